@@ -1,7 +1,51 @@
+import reprlib
+from concurrent.futures import ThreadPoolExecutor
 from src.agents.crawler import CrawlerAgent
 from src.agents.analyst import AnalystAgent
 from src.agents.advisor import AdvisorAgent
 
+# Bounded repr for progress output, so large fields like raw_text are never stringified in full
+_r = reprlib.Repr()
+_r.maxstring = 500
+_r.maxother = 500
+_r.maxdict = 10
+_r.maxlist = 10
+
+# Test inputs
+INPUTS = [
+    "https://www.biopharmadive.com/press-release/20250610-echosens-and-boehringer-ingelheim-expand-long-standing-collaboration-to-acc/"
+]
+
+def run_analysis(crawl_result, analyst, advisor):
+    """Run the analyst and advisor stages on one crawl result."""
+    print("Crawled Data (truncated):", _r.repr(crawl_result), "\n")
+
+    if not crawl_result or "error" in crawl_result:
+        print("Crawler failed:", crawl_result)
+        return
+
+    # Step 2: Analyze
+    print("=== Agent 2: Analyst ===")
+    analysis_result = analyst.process(crawl_result)
+    print("Analysis Result (truncated):", _r.repr(analysis_result), "\n")
+
+    if not analysis_result or "error" in analysis_result:
+        print("Analyst failed:", analysis_result)
+        return
+
+    # Step 3: Advise
+    print("=== Agent 3: Advisor ===")
+    advice_result = advisor.process(crawl_result, analysis_result)
+    print("Advice Result (truncated):", _r.repr(advice_result), "\n")
+
+    if not advice_result or "error" in advice_result:
+        print("Advisor failed:", advice_result)
+        return
+
+    # Final output
+    print("\n=== Final Opportunity Analysis ===")
+    print(advice_result)
+
 def main():
     # Initialize agents
     print("Initializing agents...")
@@ -9,47 +53,22 @@ def main():
     analyst = AnalystAgent()
     advisor = AdvisorAgent()
 
-    # Test input
-    input_data = "https://www.biopharmadive.com/press-release/20250610-echosens-and-boehringer-ingelheim-expand-long-standing-collaboration-to-acc/"
-    print(f"\nInput URL: {input_data}")
-
-    try:
-        # Step 1: Crawl
-        print("\n=== Agent 1: Crawler ===")
-        crawl_result = crawler.process(input_data)
-        print("Crawled Data (truncated):", str(crawl_result)[:500], "...\n")
-        
-        if not crawl_result or "error" in crawl_result:
-            print("Crawler failed:", crawl_result)
-            return
-
-        # Step 2: Analyze
-        print("=== Agent 2: Analyst ===")
-        analysis_result = analyst.process(crawl_result)
-        print("Analysis Result (truncated):", str(analysis_result)[:500], "...\n")
-
-        if not analysis_result or "error" in analysis_result:
-            print("Analyst failed:", analysis_result)
-            return
-
-        # Step 3: Advise
-        print("=== Agent 3: Advisor ===")
-        advice_result = advisor.process(crawl_result, analysis_result)
-        print("Advice Result (truncated):", str(advice_result)[:500], "...\n")
-
-        if not advice_result or "error" in advice_result:
-            print("Advisor failed:", advice_result)
-            return
-
-        # Final output
-        print("\n=== Final Opportunity Analysis ===")
-        print(advice_result)
-
-    except Exception as e:
-        print(f"\nError occurred: {str(e)}")
-        import traceback
-        print("\nFull traceback:")
-        print(traceback.format_exc())
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        # Step 1: Crawl every input up front so fetching the next one
+        # overlaps with analysis of the current one
+        crawl_futures = [executor.submit(crawler.process, input_data) for input_data in INPUTS]
+
+        for input_data, crawl_future in zip(INPUTS, crawl_futures):
+            print(f"\nInput URL: {input_data}")
+            try:
+                print("\n=== Agent 1: Crawler ===")
+                run_analysis(crawl_future.result(), analyst, advisor)
+
+            except Exception as e:
+                print(f"\nError occurred: {str(e)}")
+                import traceback
+                print("\nFull traceback:")
+                print(traceback.format_exc())
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
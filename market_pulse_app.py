@@ -1,30 +1,45 @@
 import dash
-from dash import dcc, html, Input, Output, State, callback
+from dash import dcc, html, Input, Output, State, no_update
 import dash_bootstrap_components as dbc
-import plotly.express as px
-import plotly.graph_objects as go
-import pandas as pd
-import base64
-import io
-from datetime import datetime
-import requests
-from bs4 import BeautifulSoup
-import re
-import json
-import time
+import orjson
+import plotly.io
+from dash_extensions import EventSource
+from flask import Response, abort
+import asyncio
 import threading
+import uuid
+from collections import OrderedDict
 from concurrent.futures import ThreadPoolExecutor
 
 # Import real agents
 from src.agents.crawler import CrawlerAgent
 from src.agents.analyst import AnalystAgent
 from src.agents.advisor import AdvisorAgent
+from src.utils.dedup import NearDuplicateIndex, simhash
 
 # Initialize agents
 crawler_agent = CrawlerAgent()
 analyst_agent = AnalystAgent()
 advisor_agent = AdvisorAgent()
 
+def _warmup():
+    """Run a tiny input through each agent so model loading happens before the first request."""
+    try:
+        crawler_agent._extract_entities("Pfizer announced a Phase 2 collaboration in Boston.")
+        crawler_data = {'raw_text': "Phase 2 trial of a small molecule inhibitor for cancer by Pfizer."}
+        analyst_data = analyst_agent.process(crawler_data)
+        advisor_agent.process(crawler_data, analyst_data)
+    except Exception as e:
+        print(f"Agent warm-up failed: {str(e)}")
+
+threading.Thread(target=_warmup, daemon=True).start()
+
+# Analyst results of previously seen documents, so syndicated copies skip re-analysis
+analysis_cache = NearDuplicateIndex(max_distance=3)
+
+# Dash serializes callback payloads through plotly's JSON engine
+plotly.io.json.config.default_engine = "orjson"
+
 # Initialize Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 server = app.server
@@ -173,19 +188,13 @@ analysis_state = {
     'current_agent': 0,
     'agents_status': ['pending', 'pending', 'pending'],
     'error_message': None,
-    'report_html': None,
-    'start_time': None,
-    'agent_times': {
-        'crawler': 0,
-        'analyst': 0,
-        'advisor': 0
-    }
+    'report_id': None
 }
 
 # App layout (copied from the mock code)
 app.layout = html.Div([
     dcc.Store(id='analysis-store', data=analysis_state),
-    dcc.Interval(id='progress-interval', interval=1000, disabled=True),
+    EventSource(id='progress-stream'),
     html.Div([
         # Header
         html.Div([
@@ -217,12 +226,12 @@ app.layout = html.Div([
             html.Div([
                 html.Label(id='input-label', children="Company Name:", 
                           style={'fontWeight': '600', 'marginBottom': '8px', 'display': 'block'}),
-                dcc.Input(
+                dcc.Textarea(
                     id='input-field',
-                    type='text',
-                    placeholder='Enter company name (e.g., Pfizer, Moderna, Roche)',
+                    placeholder='Enter company names, one per line (e.g., Pfizer, Moderna, Roche)',
                     style={
                         'width': '100%',
+                        'minHeight': '48px',
                         'padding': '12px',
                         'border': '2px solid #e2e8f0',
                         'borderRadius': '8px',
@@ -283,20 +292,15 @@ app.layout = html.Div([
                 html.I(className="fas fa-file-alt", style={'marginRight': '10px'}),
                 "Market Analysis Report"
             ], style={'marginBottom': '20px', 'color': '#2d3748'}),
-            html.Div(id='report-content', className="report-content"),
-            html.Div(id='report-data', style={'display': 'none'})
+            html.Div(id='report-content', className="report-content")
         ], className="results-card", id='results-card', style={'display': 'none'}),
     ], className="main-container")
 ])
 
 # Agent functions
-def agent_1_crawler(input_value, input_type):
+def structure_crawl_result(result):
+    """Turn a crawler result into the structure expected by the analyst."""
     try:
-        print(f"\nProcessing input: {input_value} (type: {input_type})")
-        
-        # Process input using crawler agent
-        result = crawler_agent.process(input_value)
-        
         if "error" in result:
             print(f"Crawler error: {result['error']}")
             return {'success': False, 'error': result['error']}
@@ -312,20 +316,12 @@ def agent_1_crawler(input_value, input_type):
             print("No pipeline or deal info found")
             return {'success': False, 'error': 'No pipeline or deal information found'}
         
-        # Structure the data for the analyst
+        # Structure the data for the analyst; the crawler has already normalized its shape
         structured_data = {
             'success': True,
-            'pipeline_info': {
-                'phases': {},
-                'indications': {}
-            },
-            'deal_info': {
-                'partnerships': [],
-                'licenses': [],
-                'acquisitions': [],
-                'investments': []
-            },
-            'entities': {},
+            'pipeline_info': result['pipeline_info'],
+            'deal_info': result['deal_info'],
+            'entities': result['entities'],
             'raw_text': result.get('raw_text', ''),
             'source_url': result.get('source_url', ''),
             'market_cap': result.get('market_cap', 'N/A'),
@@ -336,61 +332,6 @@ def agent_1_crawler(input_value, input_type):
             'mechanisms': result.get('mechanisms', [])
         }
         
-        # Process pipeline info
-        if result.get('pipeline_info'):
-            pipeline_data = result['pipeline_info']
-            if isinstance(pipeline_data, dict):
-                # Handle dictionary format
-                if 'phases' in pipeline_data:
-                    structured_data['pipeline_info']['phases'] = pipeline_data['phases']
-                if 'indications' in pipeline_data:
-                    structured_data['pipeline_info']['indications'] = pipeline_data['indications']
-            elif isinstance(pipeline_data, list):
-                # Convert list to dictionary format
-                for item in pipeline_data:
-                    phase = item.get('phase', 'Unknown')
-                    if phase not in structured_data['pipeline_info']['phases']:
-                        structured_data['pipeline_info']['phases'][phase] = []
-                    structured_data['pipeline_info']['phases'][phase].append({
-                        'name': item.get('drug', ''),
-                        'indication': item.get('indication', ''),
-                        'context': item.get('context', '')
-                    })
-        
-        # Process deal info
-        if result.get('deal_info'):
-            deal_data = result['deal_info']
-            if isinstance(deal_data, dict):
-                # Handle dictionary format
-                for deal_type in ['partnerships', 'licenses', 'acquisitions', 'investments']:
-                    if deal_type in deal_data:
-                        structured_data['deal_info'][deal_type] = deal_data[deal_type]
-            elif isinstance(deal_data, list):
-                # Convert list to dictionary format
-                for deal in deal_data:
-                    deal_type = deal.get('type', 'partnerships')
-                    if deal_type not in structured_data['deal_info']:
-                        structured_data['deal_info'][deal_type] = []
-                    structured_data['deal_info'][deal_type].append({
-                        'partner': deal.get('partner', ''),
-                        'context': deal.get('context', '')
-                    })
-        
-        # Process entities
-        if result.get('entities'):
-            entities = result['entities']
-            if isinstance(entities, dict):
-                structured_data['entities'] = entities
-            elif isinstance(entities, list):
-                # Convert list to dictionary format
-                entity_dict = {}
-                for entity in entities:
-                    entity_type = entity.get('type', 'ORG')
-                    if entity_type not in entity_dict:
-                        entity_dict[entity_type] = []
-                    entity_dict[entity_type].append(entity.get('text', ''))
-                structured_data['entities'] = entity_dict
-        
         print("Structured data keys:", structured_data.keys())
         return structured_data
         
@@ -407,13 +348,22 @@ def agent_2_analyst(crawler_data):
         if not isinstance(crawler_data, dict):
             return {'success': False, 'error': 'Invalid data format from crawler'}
         
+        # Reuse the analysis of a near-duplicate document if we have one
+        raw_text = crawler_data.get('raw_text', '')
+        fingerprint = simhash(raw_text) if raw_text else None
+        if fingerprint is not None:
+            cached = analysis_cache.lookup(fingerprint)
+            if cached is not None:
+                print("Reusing analysis of a near-duplicate document")
+                return cached
+        
         # Process the data using analyst agent
         result = analyst_agent.process(crawler_data)
         
         if "error" in result:
             return {'success': False, 'error': result['error']}
         
-        return {
+        analyst_data = {
             'success': True,
             'therapeutic_areas': result.get('therapeutic_areas', []),
             'mechanisms_of_action': result.get('mechanisms_of_action', []),
@@ -423,6 +373,9 @@ def agent_2_analyst(crawler_data):
             'key_trends': result.get('key_trends', []),
             'risk_factors': result.get('risk_factors', [])
         }
+        if fingerprint is not None:
+            analysis_cache.add(fingerprint, analyst_data)
+        return analyst_data
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
@@ -448,22 +401,121 @@ def agent_3_advisor(crawler_data, analyst_data):
     except Exception as e:
         return {'success': False, 'error': str(e)}
 
-# Callback to update input label based on type
-@app.callback(
+# Background pipeline execution
+MAX_STORED_JOBS = 100
+pipeline_executor = ThreadPoolExecutor(max_workers=8)
+pipeline_jobs = OrderedDict()
+pipeline_lock = threading.Lock()
+pipeline_changed = threading.Condition(pipeline_lock)
+
+# Job fields streamed to the browser; the report itself is served by /report/<job_id>
+STREAMED_FIELDS = ('version', 'is_running', 'current_agent', 'agents_status', 'error_message')
+
+def _update_job(job_id, **changes):
+    # Bump the version and wake up the progress streams waiting on this job
+    with pipeline_changed:
+        job = pipeline_jobs[job_id]
+        job.update(changes)
+        job['version'] += 1
+        pipeline_changed.notify_all()
+
+def _crawl_all(inputs, input_type):
+    """Crawl every input concurrently over the crawler's async connection pool."""
+    print(f"\nProcessing {len(inputs)} input(s) (type: {input_type})")
+    try:
+        results = asyncio.run(crawler_agent.process_many(inputs))
+    except Exception as e:
+        print(f"Error in crawler agent: {str(e)}")
+        return [{'success': False, 'error': str(e)}]
+    return [structure_crawl_result(result) for result in results]
+
+def run_pipeline(job_id, inputs, input_type):
+    """Run crawler -> analyst -> advisor for one job, recording progress after each stage."""
+    crawled = _crawl_all(inputs, input_type)
+    crawler_results = [data for data in crawled if data['success']]
+    if not crawler_results:
+        _update_job(job_id, is_running=False, agents_status=['error', 'pending', 'pending'],
+                    error_message=crawled[0].get('error', 'Unknown error'))
+        return
+    _update_job(job_id, current_agent=2, agents_status=['completed', 'active', 'pending'])
+    
+    analyst_results = [agent_2_analyst(crawler_data) for crawler_data in crawler_results]
+    analyses = [(crawler_data, analyst_data) for crawler_data, analyst_data in zip(crawler_results, analyst_results)
+                if analyst_data['success']]
+    if not analyses:
+        _update_job(job_id, is_running=False, agents_status=['completed', 'error', 'pending'],
+                    error_message=analyst_results[0].get('error', 'Unknown error'))
+        return
+    _update_job(job_id, current_agent=3, agents_status=['completed', 'completed', 'active'])
+    
+    advisor_results = [agent_3_advisor(crawler_data, analyst_data) for crawler_data, analyst_data in analyses]
+    reports = [result.get('html', '') for result in advisor_results if result['success']]
+    if not reports:
+        _update_job(job_id, is_running=False, agents_status=['completed', 'completed', 'error'],
+                    error_message=advisor_results[0].get('error', 'Unknown error'))
+        return
+    _update_job(job_id, is_running=False, agents_status=['completed', 'completed', 'completed'],
+                report_html='<hr style="margin: 40px 0;">'.join(reports))
+
+@server.route('/stream/<job_id>')
+def stream_progress(job_id):
+    """Server-sent events carrying each progress change of a job."""
+    def events():
+        last_version = None
+        while True:
+            with pipeline_changed:
+                job = pipeline_jobs.get(job_id)
+                if job is not None and job['version'] == last_version and job['is_running']:
+                    pipeline_changed.wait(timeout=15)
+                    job = pipeline_jobs.get(job_id)
+                update = {field: job[field] for field in STREAMED_FIELDS} if job else None
+            
+            if update is None:
+                update = {'version': -1, 'is_running': False, 'error_message': 'Analysis was interrupted'}
+            if update['version'] != last_version:
+                last_version = update['version']
+                yield b"data: " + orjson.dumps(update) + b"\n\n"
+            else:
+                # Keep idle connections from being dropped by proxies
+                yield b": keep-alive\n\n"
+            if not update['is_running']:
+                return
+    
+    return Response(events(), mimetype='text/event-stream', headers={'Cache-Control': 'no-cache'})
+
+@server.route('/report/<job_id>')
+def serve_report(job_id):
+    """Serve the finished HTML report of a job."""
+    with pipeline_lock:
+        job = pipeline_jobs.get(job_id)
+        report_html = job.get('report_html') if job else None
+    if not report_html:
+        abort(404)
+    return Response(report_html, mimetype='text/html')
+
+# Input label and placeholder for each input type
+INPUT_LABELS = {
+    'company': ("Company Name:", "Enter company names, one per line (e.g., Pfizer, Moderna, Roche)"),
+    'url': ("Press Release URL:", "Enter press release URLs, one per line (e.g., https://...)")
+}
+
+# Callback to update input label based on type, run in the browser to skip the server round-trip
+app.clientside_callback(
+    f"""
+    function(inputType) {{
+        const labels = {orjson.dumps(INPUT_LABELS).decode()};
+        return labels[inputType] || labels['url'];
+    }}
+    """,
     [Output('input-label', 'children'),
      Output('input-field', 'placeholder')],
     [Input('input-type', 'value')]
 )
-def update_input_label(input_type):
-    if input_type == 'company':
-        return "Company Name:", "Enter company name (e.g., Pfizer, Moderna, Roche)"
-    else:
-        return "Press Release URL:", "Enter press release URL (e.g., https://...)"
 
 # Callback to start analysis
 @app.callback(
     [Output('analysis-store', 'data'),
-     Output('progress-interval', 'disabled'),
+     Output('progress-stream', 'url'),
      Output('status-card', 'style'),
      Output('error-display', 'children')],
     [Input('analyze-btn', 'n_clicks')],
@@ -473,13 +525,13 @@ def update_input_label(input_type):
 )
 def start_analysis(n_clicks, input_value, input_type, current_state):
     if n_clicks == 0 or not input_value or not input_value.strip():
-        return current_state, True, {'display': 'none'}, ""
+        return current_state, None, {'display': 'none'}, ""
     
     if current_state.get('is_running'):
-        return current_state, False, {'display': 'block'}, ""
+        return current_state, no_update, {'display': 'block'}, ""
     
     # Preserve the previous report if it exists
-    previous_report = current_state.get('report_html') if current_state else None
+    previous_report = current_state.get('report_id') if current_state else None
     
     # Reset state but keep the previous report
     new_state = {
@@ -487,13 +539,49 @@ def start_analysis(n_clicks, input_value, input_type, current_state):
         'current_agent': 1,
         'agents_status': ['active', 'pending', 'pending'],
         'error_message': None,
-        'report_html': previous_report,  # Keep the previous report
-        'input_value': input_value.strip(),
-        'input_type': input_type,
-        'start_time': time.time()
+        'report_id': previous_report,  # Keep the previous report
+        'job_id': uuid.uuid4().hex
     }
     
-    return new_state, False, {'display': 'block'}, ""
+    # Run the agents in the background so the progress callback never blocks on them
+    with pipeline_lock:
+        pipeline_jobs[new_state['job_id']] = {
+            'is_running': True,
+            'current_agent': 1,
+            'agents_status': ['active', 'pending', 'pending'],
+            'error_message': None,
+            'version': 0
+        }
+        # Forget the oldest finished jobs
+        finished = [job_id for job_id, job in pipeline_jobs.items() if not job['is_running']]
+        for job_id in finished[:max(0, len(pipeline_jobs) - MAX_STORED_JOBS)]:
+            del pipeline_jobs[job_id]
+    # The inputs go straight to the pipeline; the store round-trips on every update, so it only keeps a handle
+    inputs = [line.strip() for line in input_value.splitlines() if line.strip()]
+    pipeline_executor.submit(run_pipeline, new_state['job_id'], inputs, input_type)
+    
+    return new_state, f"/stream/{new_state['job_id']}", {'display': 'block'}, ""
+
+# Progress badges are built once and shared by every callback
+_COMPLETE_BADGE = html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'})
+_RUNNING_LABELS = ["Extracting data...", "Analyzing market...", "Generating report..."]
+_SPINNERS = [
+    html.Div([
+        html.Div(className="loading-spinner", style={'display': 'inline-block'}),
+        label
+    ], style={'fontSize': '12px'})
+    for label in _RUNNING_LABELS
+]
+
+def _agent_progress(status, spinner):
+    """Render the progress line shown under an agent step."""
+    if status == 'active':
+        return spinner
+    if status == 'completed':
+        return _COMPLETE_BADGE
+    if status == 'error':
+        return "Error"
+    return ""
 
 # Callback to update progress
 @app.callback(
@@ -506,124 +594,46 @@ def start_analysis(n_clicks, input_value, input_type, current_state):
      Output('agent-3-progress', 'children'),
      Output('results-card', 'style'),
      Output('report-content', 'children'),
-     Output('report-data', 'children')],
-    [Input('progress-interval', 'n_intervals')],
+     Output('progress-stream', 'url', allow_duplicate=True)],
+    [Input('progress-stream', 'message')],
     [State('analysis-store', 'data')],
     prevent_initial_call=True
 )
-def update_progress(n_intervals, state):
-    if not state.get('is_running'):
-        # If not running and we have a report, show completed status
-        if state.get('report_html'):
-            report_content = html.Iframe(
-                srcDoc=state['report_html'],
-                style={'width': '100%', 'height': '600px', 'border': 'none', 'borderRadius': '8px'}
-            )
-            return (
-                state,
-                'agent-step completed',
-                'agent-step completed',
-                'agent-step completed',
-                html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'}),
-                html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'}),
-                html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'}),
-                {'display': 'block'},
-                report_content,
-                state['report_html']
-            )
-        return state, 'agent-step pending', 'agent-step pending', 'agent-step pending', "", "", "", {'display': 'none'}, "", ""
-    
-    current_time = time.time()
-    start_time = state.get('start_time', current_time)
-    elapsed = current_time - start_time
+def update_progress(message, state):
+    # Only the fields that changed in the background pipeline arrive here
+    if not message:
+        return (no_update,) * 10
+    update = orjson.loads(message)
+    if update['version'] == state.get('job_version'):
+        return (no_update,) * 10
+    state = {**state, **update, 'job_version': update['version']}
     
-    # Agent 1: Crawler
-    if state['current_agent'] == 1:
-        agent_1_class = 'agent-step active'
-        agent_2_class = 'agent-step pending'
-        agent_3_class = 'agent-step pending'
-        agent_1_progress = html.Div([
-            html.Div(className="loading-spinner", style={'display': 'inline-block'}),
-            "Extracting data..."
-        ], style={'fontSize': '12px'})
-        agent_2_progress = ""
-        agent_3_progress = ""
-        
-        # Run Agent 1
-        crawler_data = agent_1_crawler(state['input_value'], state['input_type'])
-        if crawler_data['success']:
-            state['crawler_data'] = crawler_data
-            state['current_agent'] = 2
-        else:
-            state['error_message'] = crawler_data.get('error', 'Unknown error')
-            state['is_running'] = False
-            return state, 'agent-step error', agent_2_class, agent_3_class, "Error", agent_2_progress, agent_3_progress, {'display': 'none'}, "", ""
-        
-        return state, agent_1_class, agent_2_class, agent_3_class, agent_1_progress, agent_2_progress, agent_3_progress, {'display': 'none'}, "", ""
+    if not state.get('is_running') and not state.get('error_message'):
+        state['report_id'] = state.get('job_id')
+        report_content = html.Iframe(
+            src=f"/report/{state['report_id']}",
+            style={'width': '100%', 'height': '600px', 'border': 'none', 'borderRadius': '8px'}
+        )
+        return (
+            state,
+            'agent-step completed',
+            'agent-step completed',
+            'agent-step completed',
+            _COMPLETE_BADGE,
+            _COMPLETE_BADGE,
+            _COMPLETE_BADGE,
+            {'display': 'block'},
+            report_content,
+            None
+        )
     
-    # Agent 2: Analyst
-    elif state['current_agent'] == 2:
-        agent_1_class = 'agent-step completed'
-        agent_2_class = 'agent-step active'
-        agent_3_class = 'agent-step pending'
-        agent_1_progress = html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'})
-        agent_2_progress = html.Div([
-            html.Div(className="loading-spinner", style={'display': 'inline-block'}),
-            "Analyzing market..."
-        ], style={'fontSize': '12px'})
-        agent_3_progress = ""
-        
-        # Run Agent 2
-        analyst_data = agent_2_analyst(state.get('crawler_data', {}))
-        if analyst_data['success']:
-            state['analyst_data'] = analyst_data
-            state['current_agent'] = 3
-        else:
-            state['error_message'] = analyst_data.get('error', 'Unknown error')
-            state['is_running'] = False
-            return state, agent_1_class, 'agent-step error', agent_3_class, agent_1_progress, "Error", agent_3_progress, {'display': 'none'}, "", ""
-        
-        return state, agent_1_class, agent_2_class, agent_3_class, agent_1_progress, agent_2_progress, agent_3_progress, {'display': 'none'}, "", ""
-    
-    # Agent 3: Advisor
-    elif state['current_agent'] == 3:
-        agent_1_class = 'agent-step completed'
-        agent_2_class = 'agent-step completed'
-        agent_3_class = 'agent-step active'
-        agent_1_progress = html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'})
-        agent_2_progress = html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'})
-        agent_3_progress = html.Div([
-            html.Div(className="loading-spinner", style={'display': 'inline-block'}),
-            "Generating report..."
-        ], style={'fontSize': '12px'})
-        
-        # Run Agent 3
-        advisor_result = agent_3_advisor(state.get('crawler_data', {}), state.get('analyst_data', {}))
-        if advisor_result['success']:
-            state['report_html'] = advisor_result.get('html', '')
-            state['is_running'] = False
-            
-            # All agents completed successfully
-            agent_1_class = 'agent-step completed'
-            agent_2_class = 'agent-step completed'
-            agent_3_class = 'agent-step completed'
-            agent_1_progress = html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'})
-            agent_2_progress = html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'})
-            agent_3_progress = html.Div("✓ Complete", style={'fontSize': '12px', 'color': 'white'})
-            
-            report_content = html.Iframe(
-                srcDoc=state['report_html'],
-                style={'width': '100%', 'height': '600px', 'border': 'none', 'borderRadius': '8px'}
-            ) if state['report_html'] else ""
-            
-            return state, agent_1_class, agent_2_class, agent_3_class, agent_1_progress, agent_2_progress, agent_3_progress, {'display': 'block'}, report_content, state['report_html']
-        else:
-            state['error_message'] = advisor_result.get('error', 'Unknown error')
-            state['is_running'] = False
-            return state, agent_1_class, agent_2_class, 'agent-step error', agent_1_progress, agent_2_progress, "Error", {'display': 'none'}, "", ""
+    agents_status = state.get('agents_status', ['pending', 'pending', 'pending'])
+    classes = [f'agent-step {status}' for status in agents_status]
+    progress = [_agent_progress(status, spinner) for status, spinner in zip(agents_status, _SPINNERS)]
     
-    # Default return
-    return state, 'agent-step pending', 'agent-step pending', 'agent-step pending', "", "", "", {'display': 'none'}, "", ""
+    # Close the stream once the job has stopped
+    stream_url = no_update if state.get('is_running') else None
+    return (state, *classes, *progress, {'display': 'none'}, "", stream_url)
 
 if __name__ == "__main__":
-    app.run(host="0.0.0.0", port=8050)
\ No newline at end of file
+    app.run(host="0.0.0.0", port=8050)
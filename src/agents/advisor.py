@@ -1,12 +1,179 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
+from enum import IntEnum
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from operator import methodcaller
+import re
+import time
 import ollama
 from .base_agent import BaseAgent
-import os
-from dotenv import load_dotenv
+from ..config.model_config import load_environment
 from datetime import datetime
-import json
+from html import escape
+from pathlib import Path
+from types import MappingProxyType
+import jinja2
 
-load_dotenv()
+load_environment()
+
+# Report template, compiled once at import and shared by every AdvisorAgent
+TEMPLATE_ENV = jinja2.Environment(
+    loader=jinja2.FileSystemLoader(Path(__file__).parent.parent / "templates"),
+    autoescape=True,
+    auto_reload=False
+)
+REPORT_TEMPLATE = TEMPLATE_ENV.get_template("opportunity_report.html")
+
+# Read-only recommendation building blocks, shared by every AdvisorAgent
+STRATEGIC_FRAMEWORKS = MappingProxyType({
+    'immediate_actions': (
+        'Engage BD team for partnership discussions',
+        'Accelerate clinical development',
+        'Expand market access',
+        'Strengthen IP portfolio',
+        'Optimize manufacturing capacity'
+    ),
+    'market_entry': (
+        'Leverage existing expertise',
+        'Consider combination therapies',
+        'Explore adjacent markets',
+        'Develop companion diagnostics',
+        'Build digital health solutions'
+    ),
+    'risk_mitigation': (
+        'Monitor competitive pipeline',
+        'Establish contingency plans',
+        'Diversify supply chain',
+        'Strengthen regulatory strategy',
+        'Protect market position'
+    ),
+    'value_creation': (
+        'Strategic acquisitions',
+        'Technology partnerships',
+        'R&D collaborations',
+        'Market expansion',
+        'Product lifecycle management'
+    )
+})
+
+RECOMMENDATION_TEMPLATES = MappingProxyType({
+    'high_potential': {
+        'tone': 'positive',
+        'key_points': (
+            'Strong market opportunity',
+            'Competitive advantage',
+            'Clear path to value',
+            'Manageable risks'
+        )
+    },
+    'moderate_potential': {
+        'tone': 'balanced',
+        'key_points': (
+            'Solid market position',
+            'Some competitive challenges',
+            'Need for strategic focus',
+            'Risk mitigation required'
+        )
+    },
+    'high_risk': {
+        'tone': 'cautious',
+        'key_points': (
+            'Significant challenges',
+            'High competition',
+            'Uncertain market dynamics',
+            'Need for careful evaluation'
+        )
+    }
+})
+
+class Factor(IntEnum):
+    """Opportunity factors identified by _assess_opportunity."""
+    LARGE_MARKET = 0
+    MODERATE_MARKET = 1
+    NICHE_MARKET = 2
+    HIGH_GROWTH = 3
+    MODERATE_GROWTH = 4
+    STABLE_MARKET = 5
+    STRONG_PIPELINE = 6
+    MODERATE_PIPELINE = 7
+    LIMITED_PIPELINE = 8
+    LIMITED_COMPETITION = 9
+    MODERATE_COMPETITION = 10
+    HIGH_COMPETITION = 11
+
+# Display label of each factor
+FACTOR_LABELS = {
+    Factor.LARGE_MARKET: 'Large market opportunity',
+    Factor.MODERATE_MARKET: 'Moderate market opportunity',
+    Factor.NICHE_MARKET: 'Niche market opportunity',
+    Factor.HIGH_GROWTH: 'High growth potential',
+    Factor.MODERATE_GROWTH: 'Moderate growth potential',
+    Factor.STABLE_MARKET: 'Stable market',
+    Factor.STRONG_PIPELINE: 'Strong pipeline',
+    Factor.MODERATE_PIPELINE: 'Moderate pipeline',
+    Factor.LIMITED_PIPELINE: 'Limited pipeline',
+    Factor.LIMITED_COMPETITION: 'Limited competition',
+    Factor.MODERATE_COMPETITION: 'Moderate competition',
+    Factor.HIGH_COMPETITION: 'High competition'
+}
+
+# Score and factor for each band of a metric, split at the thresholds below.
+# bisect_left puts values equal to a threshold in the lower band, bisect_right in the upper one.
+MARKET_SIZE_THRESHOLDS = (50, 100)
+MARKET_SIZE_SCORES = ((1, Factor.NICHE_MARKET), (2, Factor.MODERATE_MARKET), (3, Factor.LARGE_MARKET))
+GROWTH_RATE_THRESHOLDS = (5, 10)
+GROWTH_RATE_SCORES = ((1, Factor.STABLE_MARKET), (2, Factor.MODERATE_GROWTH), (3, Factor.HIGH_GROWTH))
+PIPELINE_THRESHOLDS = (2, 5)
+PIPELINE_SCORES = ((1, Factor.LIMITED_PIPELINE), (2, Factor.MODERATE_PIPELINE), (3, Factor.STRONG_PIPELINE))
+COMPETITION_THRESHOLDS = (3, 5)
+COMPETITION_SCORES = ((3, Factor.LIMITED_COMPETITION), (2, Factor.MODERATE_COMPETITION), (1, Factor.HIGH_COMPETITION))
+OPPORTUNITY_THRESHOLDS = (7, 10)
+OPPORTUNITY_CATEGORIES = ('high_risk', 'moderate_potential', 'high_potential')
+
+# Recommendations triggered by each factor, as (framework category, index) pairs
+FACTOR_RECOMMENDATIONS = {
+    Factor.LARGE_MARKET: (('immediate_actions', 0), ('market_entry', 0)),
+    Factor.HIGH_GROWTH: (('immediate_actions', 0), ('market_entry', 0)),
+    Factor.STRONG_PIPELINE: (('immediate_actions', 1), ('value_creation', 2)),
+    Factor.LIMITED_COMPETITION: (('market_entry', 2), ('value_creation', 0)),
+    Factor.HIGH_COMPETITION: (('risk_mitigation', 0), ('risk_mitigation', 1))
+}
+
+# First number in a figure such as "$120B" or "8.5% CAGR"
+NUMBER_PATTERN = re.compile(r'[-+]?\d*\.?\d+')
+
+@lru_cache(maxsize=1024)
+def _parse_number(value: str) -> float:
+    """Parse the leading number of a market figure, or 0.0 if it has none."""
+    match = NUMBER_PATTERN.search(str(value))
+    return float(match.group()) if match else 0.0
+
+# Deal categories shown in the report, in display order
+DEAL_TYPES = ('partnerships', 'licenses', 'acquisitions', 'investments')
+
+# Report shown when neither the crawler nor the analyst found anything
+EMPTY_REPORT = (
+    '<div style="font-family: Inter, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; background: white; text-align: center;">'
+    '<h2 style="color: #667eea; margin: 10px 0;">{company_name}</h2>'
+    '<p style="color: #718096;">No pipeline, deal or market data available.</p>'
+    '</div>'
+)
+
+def _field_values(items: Optional[List[Any]], key: str) -> List[str]:
+    """Read one field from a list of dicts, passing plain strings through and skipping anything else."""
+    items = items or ()
+    # The analyst returns all-dict or all-string lists, so settle the type once per list
+    if all(type(item) is dict for item in items):
+        return list(map(methodcaller('get', key, ''), items))
+    if all(type(item) is str for item in items):
+        return list(items)
+    return [item.get(key, '') if isinstance(item, dict) else item
+            for item in items if isinstance(item, (dict, str))]
+
+@lru_cache(maxsize=1)
+def _report_timestamp(minute: int) -> str:
+    """Format the report header time; reports generated within the same minute share it."""
+    return datetime.fromtimestamp(minute * 60).strftime('%B %d, %Y at %I:%M %p')
 
 class AdvisorAgent(BaseAgent):
     """Agent responsible for generating a one-page opportunity analysis report for BD teams."""
@@ -14,67 +181,10 @@ class AdvisorAgent(BaseAgent):
     def __init__(self):
         super().__init__("AdvisorAgent")
         self.model = "openhermes"  # Using OpenHermes 2.5 (Mistral)
+        self._aclient = ollama.AsyncClient()
         
-        self.strategic_frameworks = {
-            'immediate_actions': [
-                'Engage BD team for partnership discussions',
-                'Accelerate clinical development',
-                'Expand market access',
-                'Strengthen IP portfolio',
-                'Optimize manufacturing capacity'
-            ],
-            'market_entry': [
-                'Leverage existing expertise',
-                'Consider combination therapies',
-                'Explore adjacent markets',
-                'Develop companion diagnostics',
-                'Build digital health solutions'
-            ],
-            'risk_mitigation': [
-                'Monitor competitive pipeline',
-                'Establish contingency plans',
-                'Diversify supply chain',
-                'Strengthen regulatory strategy',
-                'Protect market position'
-            ],
-            'value_creation': [
-                'Strategic acquisitions',
-                'Technology partnerships',
-                'R&D collaborations',
-                'Market expansion',
-                'Product lifecycle management'
-            ]
-        }
-        
-        self.recommendation_templates = {
-            'high_potential': {
-                'tone': 'positive',
-                'key_points': [
-                    'Strong market opportunity',
-                    'Competitive advantage',
-                    'Clear path to value',
-                    'Manageable risks'
-                ]
-            },
-            'moderate_potential': {
-                'tone': 'balanced',
-                'key_points': [
-                    'Solid market position',
-                    'Some competitive challenges',
-                    'Need for strategic focus',
-                    'Risk mitigation required'
-                ]
-            },
-            'high_risk': {
-                'tone': 'cautious',
-                'key_points': [
-                    'Significant challenges',
-                    'High competition',
-                    'Uncertain market dynamics',
-                    'Need for careful evaluation'
-                ]
-            }
-        }
+        self.strategic_frameworks = STRATEGIC_FRAMEWORKS
+        self.recommendation_templates = RECOMMENDATION_TEMPLATES
 
     def process(self, crawler_data: Dict[str, Any], analyst_data: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -108,60 +218,31 @@ class AdvisorAgent(BaseAgent):
         factors = []
         
         # Market size factor
-        market_size = float(analyst_data.get('market_size', '$0B').replace('$', '').replace('B', ''))
-        if market_size > 100:
-            score += 3
-            factors.append('Large market opportunity')
-        elif market_size > 50:
-            score += 2
-            factors.append('Moderate market opportunity')
-        else:
-            score += 1
-            factors.append('Niche market opportunity')
+        market_size = _parse_number(analyst_data.get('market_size') or '0')
+        points, factor = MARKET_SIZE_SCORES[bisect_left(MARKET_SIZE_THRESHOLDS, market_size)]
+        score += points
+        factors.append(factor)
         
         # Growth rate factor
-        growth_rate = float(analyst_data.get('growth_rate', '0%').replace('%', '').replace(' CAGR', ''))
-        if growth_rate > 10:
-            score += 3
-            factors.append('High growth potential')
-        elif growth_rate > 5:
-            score += 2
-            factors.append('Moderate growth potential')
-        else:
-            score += 1
-            factors.append('Stable market')
+        growth_rate = _parse_number(analyst_data.get('growth_rate') or '0')
+        points, factor = GROWTH_RATE_SCORES[bisect_left(GROWTH_RATE_THRESHOLDS, growth_rate)]
+        score += points
+        factors.append(factor)
         
         # Pipeline strength factor
         pipeline_count = len(crawler_data.get('pipeline_info', []))
-        if pipeline_count > 5:
-            score += 3
-            factors.append('Strong pipeline')
-        elif pipeline_count > 2:
-            score += 2
-            factors.append('Moderate pipeline')
-        else:
-            score += 1
-            factors.append('Limited pipeline')
+        points, factor = PIPELINE_SCORES[bisect_left(PIPELINE_THRESHOLDS, pipeline_count)]
+        score += points
+        factors.append(factor)
         
         # Competitive position factor
         competitors = len(analyst_data.get('competitors', []))
-        if competitors < 3:
-            score += 3
-            factors.append('Limited competition')
-        elif competitors < 5:
-            score += 2
-            factors.append('Moderate competition')
-        else:
-            score += 1
-            factors.append('High competition')
+        points, factor = COMPETITION_SCORES[bisect_right(COMPETITION_THRESHOLDS, competitors)]
+        score += points
+        factors.append(factor)
         
         # Determine opportunity category
-        if score >= 10:
-            category = 'high_potential'
-        elif score >= 7:
-            category = 'moderate_potential'
-        else:
-            category = 'high_risk'
+        category = OPPORTUNITY_CATEGORIES[bisect_right(OPPORTUNITY_THRESHOLDS, score)]
         
         return {
             'score': score,
@@ -183,18 +264,8 @@ class AdvisorAgent(BaseAgent):
         
         # Select recommendations based on category and factors
         for factor in assessment['factors']:
-            if 'Large market' in factor or 'High growth' in factor:
-                recommendations['immediate_actions'].append(self.strategic_frameworks['immediate_actions'][0])
-                recommendations['market_entry'].append(self.strategic_frameworks['market_entry'][0])
-            elif 'Strong pipeline' in factor:
-                recommendations['immediate_actions'].append(self.strategic_frameworks['immediate_actions'][1])
-                recommendations['value_creation'].append(self.strategic_frameworks['value_creation'][2])
-            elif 'Limited competition' in factor:
-                recommendations['market_entry'].append(self.strategic_frameworks['market_entry'][2])
-                recommendations['value_creation'].append(self.strategic_frameworks['value_creation'][0])
-            elif 'High competition' in factor:
-                recommendations['risk_mitigation'].append(self.strategic_frameworks['risk_mitigation'][0])
-                recommendations['risk_mitigation'].append(self.strategic_frameworks['risk_mitigation'][1])
+            for framework, index in FACTOR_RECOMMENDATIONS.get(factor, ()):
+                recommendations[framework].append(self.strategic_frameworks[framework][index])
         
         # Ensure at least one recommendation per category
         for category in recommendations:
@@ -207,210 +278,62 @@ class AdvisorAgent(BaseAgent):
         """Generate HTML report with strategic recommendations."""
         company_name = crawler_data.get('company_name', 'Target Company')
         
+        # Nothing to report on, so skip extraction and rendering
+        deal_info = crawler_data.get('deal_info', {})
+        if (not any(crawler_data.get('pipeline_info', {}).get('phases', {}).values())
+                and not any(deal_info.get(deal_type) for deal_type in DEAL_TYPES)
+                and not analyst_data.get('competitors')
+                and not analyst_data.get('therapeutic_areas')):
+            return EMPTY_REPORT.format(company_name=escape(company_name))
+        
         # Extract pipeline info
-        pipeline_items = []
-        if 'pipeline_info' in crawler_data:
-            pipeline_info = crawler_data['pipeline_info']
-            if 'phases' in pipeline_info:
-                for phase, products in pipeline_info['phases'].items():
-                    for product in products:
-                        if isinstance(product, dict):
-                            pipeline_items.append(f"{product.get('name', '')} - {product.get('indication', '')} ({phase})")
+        pipeline_items = [
+            f"{product.get('name', '')} - {product.get('indication', '')} ({phase})"
+            for phase, products in crawler_data.get('pipeline_info', {}).get('phases', {}).items()
+            for product in products
+            if isinstance(product, dict)
+        ]
         
         # Extract deal info
-        deal_items = []
-        if 'deal_info' in crawler_data:
-            deal_info = crawler_data['deal_info']
-            for deal_type in ['partnerships', 'licenses', 'acquisitions', 'investments']:
-                if deal_type in deal_info:
-                    for deal in deal_info[deal_type]:
-                        if isinstance(deal, dict):
-                            deal_items.append(f"{deal.get('partner', '')} - {deal.get('context', '')} ({deal_type})")
-        
-        # Extract competitor names
-        competitor_names = []
-        if 'competitors' in analyst_data:
-            for comp in analyst_data['competitors']:
-                if isinstance(comp, dict):
-                    competitor_names.append(comp.get('name', ''))
-                elif isinstance(comp, str):
-                    competitor_names.append(comp)
-        
-        # Extract therapeutic areas
-        therapeutic_areas = []
-        if 'therapeutic_areas' in analyst_data:
-            for area in analyst_data['therapeutic_areas']:
-                if isinstance(area, dict):
-                    therapeutic_areas.append(area.get('name', ''))
-                elif isinstance(area, str):
-                    therapeutic_areas.append(area)
+        deal_items = [
+            f"{deal.get('partner', '')} - {deal.get('context', '')} ({deal_type})"
+            for deal_type in DEAL_TYPES
+            for deal in deal_info.get(deal_type, [])
+            if isinstance(deal, dict)
+        ]
         
-        # Extract mechanisms of action
-        mechanisms = []
-        if 'mechanisms_of_action' in analyst_data:
-            for moa in analyst_data['mechanisms_of_action']:
-                if isinstance(moa, dict):
-                    mechanisms.append(moa.get('name', ''))
-                elif isinstance(moa, str):
-                    mechanisms.append(moa)
+        # Extract display names of the analyst findings
+        competitor_names = _field_values(analyst_data.get('competitors'), 'name')
+        therapeutic_areas = _field_values(analyst_data.get('therapeutic_areas'), 'name')
+        mechanisms = _field_values(analyst_data.get('mechanisms_of_action'), 'name')
+        trends = _field_values(analyst_data.get('key_trends'), 'description')
+        risks = _field_values(analyst_data.get('risk_factors'), 'description')
         
-        # Extract trends
-        trends = []
-        if 'key_trends' in analyst_data:
-            for trend in analyst_data['key_trends']:
-                if isinstance(trend, dict):
-                    trends.append(trend.get('description', ''))
-                elif isinstance(trend, str):
-                    trends.append(trend)
-        
-        # Extract risk factors
-        risks = []
-        if 'risk_factors' in analyst_data:
-            for risk in analyst_data['risk_factors']:
-                if isinstance(risk, dict):
-                    risks.append(risk.get('description', ''))
-                elif isinstance(risk, str):
-                    risks.append(risk)
-        
-        html_report = f"""
-        <div style="font-family: Inter, sans-serif; max-width: 800px; margin: 0 auto; padding: 20px; background: white;">
-            <div style="text-align: center; margin-bottom: 30px; border-bottom: 3px solid #667eea; padding-bottom: 20px;">
-                <h1 style="color: #2d3748; margin: 0; font-size: 2.5rem;">Market Pulse Analysis</h1>
-                <h2 style="color: #667eea; margin: 10px 0; font-size: 2rem;">{company_name}</h2>
-                <p style="color: #718096; font-size: 14px;">Generated on {datetime.now().strftime('%B %d, %Y at %I:%M %p')}</p>
-            </div>
-            
-            <div style="margin-bottom: 25px; padding: 20px; background: linear-gradient(135deg, #f7fafc, #edf2f7); border-radius: 10px;">
-                <h3 style="color: #2d3748; margin-top: 0; display: flex; align-items: center;">
-                    <i class="fas fa-bullseye" style="margin-right: 10px; color: #667eea;"></i> Executive Summary
-                </h3>
-                <p style="line-height: 1.6; color: #4a5568; font-size: 16px;">
-                    <strong>{company_name}</strong> presents a <strong style="color: #38a169;">high-potential opportunity</strong> 
-                    in the life sciences sector with a diversified pipeline spanning multiple therapeutic areas. 
-                    The company's strategic positioning in {', '.join(therapeutic_areas[:2])} markets 
-                    offers significant growth potential with an estimated addressable market of 
-                    <strong style="color: #667eea;">{analyst_data.get('market_size', 'N/A')}</strong> growing at 
-                    <strong style="color: #38a169;">{analyst_data.get('growth_rate', 'N/A')}</strong>.
-                </p>
-            </div>
-            
-            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-bottom: 25px;">
-                <div style="padding: 20px; background: white; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); border-left: 4px solid #667eea;">
-                    <h4 style="color: #667eea; margin-top: 0; display: flex; align-items: center;">
-                        <i class="fas fa-pills" style="margin-right: 8px;"></i> Pipeline Overview
-                    </h4>
-                    <ul style="color: #4a5568; line-height: 1.6; padding-left: 20px;">
-                        {''.join([f'<li style="margin-bottom: 8px;">{item}</li>' for item in pipeline_items])}
-                    </ul>
-                </div>
-                
-                <div style="padding: 20px; background: white; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1); border-left: 4px solid #38a169;">
-                    <h4 style="color: #38a169; margin-top: 0; display: flex; align-items: center;">
-                        <i class="fas fa-handshake" style="margin-right: 8px;"></i> Recent Activity
-                    </h4>
-                    <ul style="color: #4a5568; line-height: 1.6; padding-left: 20px;">
-                        {''.join([f'<li style="margin-bottom: 8px;">{item}</li>' for item in deal_items])}
-                    </ul>
-                </div>
-            </div>
-            
-            <div style="margin-bottom: 25px; padding: 20px; background: white; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <h4 style="color: #667eea; margin-top: 0; display: flex; align-items: center;">
-                    <i class="fas fa-crosshairs" style="margin-right: 8px;"></i> Therapeutic Focus Areas
-                </h4>
-                <div style="display: flex; flex-wrap: wrap; gap: 10px; margin-bottom: 15px;">
-                    {''.join([f'<span style="background: linear-gradient(135deg, #667eea, #764ba2); color: white; padding: 8px 16px; border-radius: 20px; font-size: 14px; font-weight: 500;">{area}</span>' for area in therapeutic_areas])}
-                </div>
-                <h5 style="color: #2d3748; margin: 15px 0 10px 0;">Mechanisms of Action:</h5>
-                <div style="display: flex; flex-wrap: wrap; gap: 8px;">
-                    {''.join([f'<span style="background: #f7fafc; color: #4a5568; padding: 6px 12px; border-radius: 15px; font-size: 13px; border: 1px solid #e2e8f0;">{moa}</span>' for moa in mechanisms])}
-                </div>
-            </div>
-            
-            <div style="margin-bottom: 25px; padding: 20px; background: white; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                <h4 style="color: #667eea; margin-top: 0; display: flex; align-items: center;">
-                    <i class="fas fa-users" style="margin-right: 8px;"></i> Competitive Landscape
-                </h4>
-                <div style="margin-bottom: 15px;">
-                    <p style="color: #4a5568; line-height: 1.6; margin-bottom: 10px;">
-                        <strong>Key Competitors:</strong> {', '.join(competitor_names)}
-                    </p>
-                    <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 15px; margin-top: 15px;">
-                        <div style="background: #f0fff4; padding: 15px; border-radius: 8px; border-left: 3px solid #38a169;">
-                            <strong style="color: #2d3748;">Market Size:</strong><br>
-                            <span style="color: #38a169; font-size: 1.2em; font-weight: 600;">{analyst_data.get('market_size', 'N/A')}</span>
-                        </div>
-                        <div style="background: #f0f9ff; padding: 15px; border-radius: 8px; border-left: 3px solid #3182ce;">
-                            <strong style="color: #2d3748;">Growth Rate:</strong><br>
-                            <span style="color: #3182ce; font-size: 1.2em; font-weight: 600;">{analyst_data.get('growth_rate', 'N/A')}</span>
-                        </div>
-                    </div>
-                </div>
-            </div>
-            
-            <div style="margin-bottom: 25px; padding: 20px; background: linear-gradient(135deg, #f0fff4, #c6f6d5); border-radius: 10px; border-left: 5px solid #38a169;">
-                <h4 style="color: #2d3748; margin-top: 0; display: flex; align-items: center;">
-                    <i class="fas fa-lightbulb" style="margin-right: 8px; color: #f6ad55;"></i> Strategic Recommendations
-                </h4>
-                <div style="display: grid; gap: 15px;">
-                    <div style="background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                        <strong style="color: #2d3748;">🎯 Immediate Action:</strong>
-                        <p style="margin: 5px 0 0 0; color: #4a5568;">{recommendations.get('immediate_actions', [''])[0]}</p>
-                    </div>
-                    <div style="background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                        <strong style="color: #2d3748;">🚀 Market Entry:</strong>
-                        <p style="margin: 5px 0 0 0; color: #4a5568;">{recommendations.get('market_entry', [''])[0]}</p>
-                    </div>
-                    <div style="background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                        <strong style="color: #2d3748;">⚠️ Risk Mitigation:</strong>
-                        <p style="margin: 5px 0 0 0; color: #4a5568;">{recommendations.get('risk_mitigation', [''])[0]}</p>
-                    </div>
-                    <div style="background: white; padding: 15px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1);">
-                        <strong style="color: #2d3748;">💎 Value Creation:</strong>
-                        <p style="margin: 5px 0 0 0; color: #4a5568;">{recommendations.get('value_creation', [''])[0]}</p>
-                    </div>
-                </div>
-            </div>
-            
-            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin-bottom: 25px;">
-                <div style="padding: 20px; background: white; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                    <h4 style="color: #667eea; margin-top: 0; display: flex; align-items: center;">
-                        <i class="fas fa-chart-line" style="margin-right: 8px;"></i> Market Trends
-                    </h4>
-                    <ul style="color: #4a5568; line-height: 1.6; padding-left: 20px;">
-                        {''.join([f'<li style="margin-bottom: 8px;">{trend}</li>' for trend in trends])}
-                    </ul>
-                </div>
-                
-                <div style="padding: 20px; background: white; border-radius: 10px; box-shadow: 0 4px 6px rgba(0,0,0,0.1);">
-                    <h4 style="color: #e53e3e; margin-top: 0; display: flex; align-items: center;">
-                        <i class="fas fa-exclamation-triangle" style="margin-right: 8px;"></i> Risk Factors
-                    </h4>
-                    <ul style="color: #4a5568; line-height: 1.6; padding-left: 20px;">
-                        {''.join([f'<li style="margin-bottom: 8px;">{risk}</li>' for risk in risks])}
-                    </ul>
-                </div>
-            </div>
-            
-            <div style="text-align: center; padding: 20px; background: #f7fafc; border-radius: 10px; margin-top: 30px;">
-                <p style="color: #718096; font-size: 12px; margin: 0;">
-                    This report was generated by Market Pulse AI • Confidential & Proprietary<br>
-                    For questions or additional analysis, contact your BD team
-                </p>
-            </div>
-        </div>
-        """
+        # The report shows the first recommendation of each framework
+        top_recommendations = {framework: actions[0] if actions else '' for framework, actions in recommendations.items()}
         
-        return html_report
+        return REPORT_TEMPLATE.render(
+            company_name=company_name,
+            generated_at=_report_timestamp(int(time.time()) // 60),
+            pipeline_items=pipeline_items,
+            deal_items=deal_items,
+            competitor_names=competitor_names,
+            therapeutic_areas=therapeutic_areas,
+            mechanisms=mechanisms,
+            trends=trends,
+            risks=risks,
+            market_size=analyst_data.get('market_size', 'N/A'),
+            growth_rate=analyst_data.get('growth_rate', 'N/A'),
+            top_recommendations=top_recommendations
+        )
 
-    def _get_hermes_response(self, prompt: str) -> str:
-        """Get response from OpenHermes model using Ollama."""
+    async def _get_hermes_response(self, prompt: str) -> str:
+        """Get response from OpenHermes model using Ollama without blocking the event loop."""
         try:
-            response = ollama.generate(
+            response = await self._aclient.generate(
                 model=self.model,
                 prompt=prompt,
-                temperature=0.7,
-                max_tokens=1000
+                options={'temperature': 0.7, 'num_predict': 1000}
             )
             return response['response']
         except Exception as e:
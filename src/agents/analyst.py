@@ -1,16 +1,124 @@
-from typing import Dict, Any, List
-import ollama
+from typing import Dict, Any, List, Iterator, Optional, Tuple
+from bisect import bisect_left
+import numpy as np
 from .base_agent import BaseAgent
+from ..utils.nlp import get_nlp
 from datetime import datetime
 import re
 from collections import defaultdict
-import spacy
+import ahocorasick
+from functools import lru_cache
+import os
+import hashlib
+from pathlib import Path
+
+# Responses of the LLM, keyed by a hash of the model, temperature and prompt
+LLM_CACHE_DIR = Path(".cache/llm")
+
+# Number of texts spaCy processes per batch in nlp.pipe
+NLP_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "64"))
+# Smaller batches stay in-process, where worker start-up would cost more than it saves
+NLP_PARALLEL_THRESHOLD = 200
+
+# Compiled once and shared by every AnalystAgent
+SPECIAL_CHARS_PATTERN = re.compile(r'[^\w\s&]')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+COMPANY_SUFFIX_PATTERN = re.compile(
+    r'\b(?:Inc|LLC|Ltd|Corp|Corporation|PLC|Co|Company|Limited)\b', re.IGNORECASE
+)
+# Each prefix is stripped at most once, in this order
+COMPANY_PREFIX_PATTERN = re.compile(r'^(?:The\s+)?(?:A\s+)?(?:An\s+)?', re.IGNORECASE)
+# Words introducing a partner company, in the order they are searched
+PARTNER_MARKERS = ("by", "with")
+# Number of trends and risks reported
+MAX_INSIGHTS = 5
+TREND_PATTERNS = [
+    re.compile(r'increasing.*demand'),
+    re.compile(r'growing.*market'),
+    re.compile(r'emerging.*technology'),
+    re.compile(r'new.*approach'),
+    re.compile(r'innovative.*solution'),
+    re.compile(r'breakthrough.*treatment'),
+    re.compile(r'advancement.*in'),
+    re.compile(r'development.*of'),
+    re.compile(r'focus.*on'),
+    re.compile(r'expansion.*into')
+]
+RISK_PATTERNS = [
+    re.compile(r'risk.*of'),
+    re.compile(r'challenge.*in'),
+    re.compile(r'concern.*about'),
+    re.compile(r'limitation.*of'),
+    re.compile(r'barrier.*to'),
+    re.compile(r'delay.*in'),
+    re.compile(r'issue.*with'),
+    re.compile(r'problem.*with'),
+    re.compile(r'threat.*to'),
+    re.compile(r'uncertainty.*in')
+]
+
+def build_keyword_automaton(keyword_groups: Dict[str, List[str]]) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton finding every keyword of every group in one pass.
+
+    Args:
+        keyword_groups: Lowercase keywords keyed by group name
+
+    Returns:
+        Automaton whose matches carry (group, keyword) values
+    """
+    automaton = ahocorasick.Automaton()
+    for group, keywords in keyword_groups.items():
+        for keyword in keywords:
+            automaton.add_word(keyword, (group, keyword))
+    automaton.make_automaton()
+    return automaton
+
+def first_keyword_positions(automaton: ahocorasick.Automaton, text_lower: str) -> Dict[str, int]:
+    """Find the offset of the first occurrence of every keyword of an automaton in one pass.
+
+    Args:
+        automaton: Automaton built by build_keyword_automaton
+        text_lower: Lowercased text to scan
+
+    Returns:
+        Start offset of each keyword found, keyed by keyword
+    """
+    positions = {}
+    for end, (_, keyword) in automaton.iter(text_lower):
+        positions.setdefault(keyword, end - len(keyword) + 1)
+    return positions
+
+@lru_cache(maxsize=4096)
+def clean_company_name(name: str) -> Optional[str]:
+    """Clean and standardize a company name; the same companies recur across entities, so results are cached."""
+    # Strip surrounding whitespace
+    name = name.strip()
+
+    # Remove special characters and extra spaces
+    name = SPECIAL_CHARS_PATTERN.sub(' ', name)
+    name = WHITESPACE_PATTERN.sub(' ', name).strip()
+
+    # Remove common suffixes
+    name = COMPANY_SUFFIX_PATTERN.sub('', name)
+
+    # Remove common prefixes
+    name = COMPANY_PREFIX_PATTERN.sub('', name, count=1)
+
+    # Fix common variations
+    name = name.replace('JohnsonJohnson', 'Johnson & Johnson')
+    name = name.replace('Johnson & Johnson', 'Johnson & Johnson')  # Ensure proper spacing
+    name = name.replace('PfizerBioNTech', 'Pfizer')
+    name = name.replace('MerckEarly', 'Merck')
+
+    # Final cleanup
+    name = name.strip()
+    return name if name else None
 
 class CompetitorDetector:
     """Sub-agent for detecting competitors and deal information."""
     
     def __init__(self):
-        self.nlp = spacy.load("en_core_web_sm")
+        self.nlp = get_nlp()
         self.therapeutic_area_keywords = {
             "Oncology": ["cancer", "tumor", "oncology", "carcinoma"],
             "Neurology": ["neurological", "brain", "nervous system", "CNS"],
@@ -19,6 +127,7 @@ class CompetitorDetector:
             "Metabolic": ["diabetes", "obesity", "metabolic"],
             "Rare Diseases": ["orphan", "rare disease", "genetic disorder"]
         }
+        self.therapeutic_area_automaton = build_keyword_automaton(self.therapeutic_area_keywords)
         
         self.deal_type_patterns = {
             "co_development": [
@@ -38,42 +147,69 @@ class CompetitorDetector:
                 "merger", "takeover"
             ]
         }
+        self.deal_type_automaton = build_keyword_automaton(self.deal_type_patterns)
 
     def detect_competitors(self, text: str, therapeutic_areas: List[str]) -> List[Dict[str, Any]]:
         """Detect competitors based on therapeutic areas and text analysis."""
         competitors = []
+        text_lower = text.lower()
         
         # Extract company names using NER
         doc = self.nlp(text)
         companies = [ent.text for ent in doc.ents if ent.label_ == "ORG"]
         
+        # Window around the first mention of each keyword of each area
+        first_positions = first_keyword_positions(self.therapeutic_area_automaton, text_lower)
+        area_windows = {
+            area: [
+                self._context_bounds(text, first_positions[keyword], len(keyword), window=100)
+                for keyword in self.therapeutic_area_keywords.get(area, [])
+                if keyword in first_positions
+            ]
+            for area in therapeutic_areas
+        }
+        
+        # Sorted offsets of every occurrence of each company name
+        occurrences = {}
+        for company in dict.fromkeys(companies):
+            offsets = []
+            position = text.find(company)
+            while position != -1:
+                offsets.append(position)
+                position = text.find(company, position + 1)
+            occurrences[company] = offsets
+        
         # For each therapeutic area, find companies mentioned in similar contexts
         for area in therapeutic_areas:
-            area_keywords = self.therapeutic_area_keywords.get(area, [])
             for company in companies:
+                offsets = occurrences[company]
                 # Check if company is mentioned near therapeutic area keywords
-                for keyword in area_keywords:
-                    if keyword in text.lower():
-                        # Look for company mentions near the keyword
-                        context = self._get_context(text, keyword, window=100)
-                        if company in context:
-                            competitors.append({
-                                "name": company,
-                                "therapeutic_area": area,
-                                "confidence": 0.7,
-                                "context": context
-                            })
+                for start, end in area_windows[area]:
+                    index = bisect_left(offsets, start)
+                    if index < len(offsets) and offsets[index] + len(company) <= end:
+                        context = text[start:end]
+                        competitors.append({
+                            "name": company,
+                            "therapeutic_area": area,
+                            "confidence": 0.7,
+                            "context": context
+                        })
         
         return competitors
 
-    def detect_deal_structures(self, text: str) -> List[Dict[str, Any]]:
-        """Detect deal structures from text."""
+    def detect_deal_structures(self, text: str, text_lower: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Detect deal structures from text, reusing its lowercased copy when given."""
         deals = []
+        if text_lower is None:
+            text_lower = text.lower()
+        
+        # Offset of the first mention of each pattern
+        first_positions = first_keyword_positions(self.deal_type_automaton, text_lower)
         
         for deal_type, patterns in self.deal_type_patterns.items():
             for pattern in patterns:
-                if pattern in text.lower():
-                    context = self._get_context(text, pattern, window=100)
+                if pattern in first_positions:
+                    context = self._get_context_at(text, first_positions[pattern], len(pattern), window=100)
                     deals.append({
                         "type": deal_type,
                         "confidence": 0.8,
@@ -82,20 +218,24 @@ class CompetitorDetector:
         
         return deals
 
-    def _get_context(self, text: str, keyword: str, window: int = 100) -> str:
-        """Get context around a keyword in text."""
-        start = max(0, text.lower().find(keyword) - window)
-        end = min(len(text), text.lower().find(keyword) + len(keyword) + window)
+    def _get_context_at(self, text: str, position: int, length: int, window: int = 100) -> str:
+        """Get context around a match of the given length starting at position."""
+        start, end = self._context_bounds(text, position, length, window)
         return text[start:end]
 
+    def _context_bounds(self, text: str, position: int, length: int, window: int = 100) -> Tuple[int, int]:
+        """Get the slice bounds of the context around a match."""
+        return max(0, position - window), min(len(text), position + length + window)
+
 class AnalystAgent(BaseAgent):
     """Agent responsible for analyzing pipeline and deal information to identify therapeutic areas, MOAs, and competitors."""
     
-    def __init__(self):
+    def __init__(self, n_process: int = 1):
         super().__init__("AnalystAgent")
+        self.n_process = n_process  # spaCy worker processes for large NER batches, -1 for one per CPU
         self.model = "mistral:instruct"  # Using Mistral 7B Instruct model
         self.competitor_detector = CompetitorDetector()
-        self.nlp = spacy.load("en_core_web_sm")
+        self.nlp = get_nlp()
         
         # Define therapeutic areas and their related terms
         self.therapeutic_areas = {
@@ -107,6 +247,7 @@ class AnalystAgent(BaseAgent):
             'Infectious Disease': ['infection', 'viral', 'bacterial', 'antiviral', 'antibiotic'],
             'Rare Disease': ['rare disease', 'orphan drug', 'genetic disorder']
         }
+        self.therapeutic_area_automaton = build_keyword_automaton(self.therapeutic_areas)
         
         # Define mechanisms of action
         self.mechanisms = {
@@ -140,6 +281,11 @@ class AnalystAgent(BaseAgent):
             'Infectious Disease': 9,
             'Rare Disease': 15
         }
+        
+        # Market figures as vectors, indexed by area position
+        self._market_area_index = {area: index for index, area in enumerate(self.market_sizes)}
+        self._market_size_vector = np.array([self.market_sizes[area] for area in self.market_sizes])
+        self._growth_rate_vector = np.array([self.growth_rates.get(area, 0) for area in self.market_sizes])
     
     def process(self, input_data: Dict[str, Any]) -> Dict[str, Any]:
         """Process pipeline and deal information to identify therapeutic areas, MOAs, and competitors.
@@ -153,9 +299,11 @@ class AnalystAgent(BaseAgent):
         try:
             # Extract text from pipeline and deal information
             text = self._extract_text(input_data)
+            # Lowercased once and shared by every keyword scan below
+            text_lower = text.lower()
             
             # Identify therapeutic areas
-            therapeutic_areas = self._identify_therapeutic_areas(text)
+            therapeutic_areas = self._identify_therapeutic_areas(text, text_lower)
             
             # Identify MOAs
             moas = self._identify_moas(text)
@@ -165,16 +313,16 @@ class AnalystAgent(BaseAgent):
             competitors = self._clean_competitor_list(raw_competitors)
             
             # Detect deal structures
-            deals = self.competitor_detector.detect_deal_structures(text)
+            deals = self.competitor_detector.detect_deal_structures(text, text_lower)
             
             # Analyze market size and growth
             market_analysis = self._analyze_market(therapeutic_areas)
             
             # Identify key trends
-            trends = self._identify_trends(text)
+            trends = self._identify_trends(text, text_lower)
             
             # Identify risk factors
-            risks = self._identify_risks(text)
+            risks = self._identify_risks(text, text_lower)
             
             return {
                 "therapeutic_areas": therapeutic_areas,
@@ -192,8 +340,10 @@ class AnalystAgent(BaseAgent):
     
     def _extract_text(self, data: Dict[str, Any]) -> str:
         """Extract and combine all relevant text from crawler data."""
-        text_parts = []
-        
+        return ' '.join(part for part in self._iter_text_parts(data) if part)
+    
+    def _iter_text_parts(self, data: Dict[str, Any]) -> Iterator[str]:
+        """Yield the text fragments of crawler data in document order."""
         # Extract pipeline information
         if 'pipeline_info' in data:
             pipeline_info = data['pipeline_info']
@@ -202,15 +352,15 @@ class AnalystAgent(BaseAgent):
                 for phase, products in pipeline_info['phases'].items():
                     for product in products:
                         if isinstance(product, dict):
-                            text_parts.append(product.get('name', ''))
-                            text_parts.append(product.get('indication', ''))
-                            text_parts.append(product.get('context', ''))
+                            yield product.get('name', '')
+                            yield product.get('indication', '')
+                            yield product.get('context', '')
             # Handle indications
             if 'indications' in pipeline_info:
                 for indication in pipeline_info['indications'].values():
                     if isinstance(indication, dict):
-                        text_parts.append(indication.get('name', ''))
-                        text_parts.append(indication.get('context', ''))
+                        yield indication.get('name', '')
+                        yield indication.get('context', '')
         
         # Extract deal information
         if 'deal_info' in data:
@@ -219,8 +369,8 @@ class AnalystAgent(BaseAgent):
                 if deal_type in deal_info:
                     for deal in deal_info[deal_type]:
                         if isinstance(deal, dict):
-                            text_parts.append(deal.get('partner', ''))
-                            text_parts.append(deal.get('context', ''))
+                            yield deal.get('partner', '')
+                            yield deal.get('context', '')
         
         # Extract entities
         if 'entities' in data:
@@ -230,26 +380,27 @@ class AnalystAgent(BaseAgent):
                     if isinstance(entity_list, list):
                         for entity in entity_list:
                             if isinstance(entity, str):
-                                text_parts.append(entity)
+                                yield entity
                             elif isinstance(entity, dict):
-                                text_parts.append(entity.get('text', ''))
+                                yield entity.get('text', '')
         
         # Add raw text if available
         if 'raw_text' in data:
-            text_parts.append(data['raw_text'])
-        
-        return ' '.join(filter(None, text_parts))
+            yield data['raw_text']
     
-    def _identify_therapeutic_areas(self, text: str) -> List[str]:
+    def _identify_therapeutic_areas(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Identify therapeutic areas mentioned in the text."""
-        areas = []
-        text_lower = text.lower()
+        if text_lower is None:
+            text_lower = text.lower()
+        found = set()
+        for _, (area, _) in self.therapeutic_area_automaton.iter(text_lower):
+            found.add(area)
+            # Stop scanning once every area has been seen
+            if len(found) == len(self.therapeutic_areas):
+                break
         
-        for area, terms in self.therapeutic_areas.items():
-            if any(term in text_lower for term in terms):
-                areas.append(area)
-        
-        return areas
+        # Keep the declaration order of the areas
+        return [area for area in self.therapeutic_areas if area in found]
     
     def _identify_moas(self, text: str) -> List[Dict[str, Any]]:
         """Identify mechanisms of action from text."""
@@ -311,33 +462,7 @@ class AnalystAgent(BaseAgent):
         """Clean and standardize company names."""
         if not name:
             return None
-
-        # Convert to string and strip
-        name = str(name).strip()
-
-        # Remove special characters and extra spaces
-        name = re.sub(r'[^\w\s&]', ' ', name)
-        name = re.sub(r'\s+', ' ', name).strip()
-
-        # Remove common suffixes
-        suffixes = ['Inc', 'LLC', 'Ltd', 'Corp', 'Corporation', 'PLC', 'Co', 'Company', 'Limited']
-        for suffix in suffixes:
-            name = re.sub(rf'\b{suffix}\b', '', name, flags=re.IGNORECASE)
-
-        # Remove common prefixes
-        prefixes = ['The', 'A', 'An']
-        for prefix in prefixes:
-            name = re.sub(rf'^{prefix}\s+', '', name, flags=re.IGNORECASE)
-
-        # Fix common variations
-        name = name.replace('JohnsonJohnson', 'Johnson & Johnson')
-        name = name.replace('Johnson & Johnson', 'Johnson & Johnson')  # Ensure proper spacing
-        name = name.replace('PfizerBioNTech', 'Pfizer')
-        name = name.replace('MerckEarly', 'Merck')
-
-        # Final cleanup
-        name = name.strip()
-        return name if name else None
+        return clean_company_name(str(name))
 
     def _extract_competitors(self, data: Dict) -> List[Dict]:
         """Extract and clean competitor information from the data."""
@@ -345,13 +470,25 @@ class AnalystAgent(BaseAgent):
         seen_names = set()
         known_companies = {"Pfizer", "Novartis", "Roche"}  # Expand as needed
 
+        # Run NER over every context in one batch, consumed below in the same order
+        contexts = []
+        if "pipeline_info" in data:
+            for products in data["pipeline_info"]["phases"].values():
+                contexts.extend(product["context"] for product in products if "context" in product)
+        if "deal_info" in data:
+            for deal_type in ["partnerships", "licenses", "acquisitions"]:
+                contexts.extend(deal["context"] for deal in data["deal_info"].get(deal_type, [])
+                                if "company" not in deal and "context" in deal)
+        n_process = self.n_process if len(contexts) > NLP_PARALLEL_THRESHOLD else 1
+        docs = iter(self.nlp.pipe(contexts, batch_size=NLP_BATCH_SIZE, n_process=n_process))
+
         # Extract from pipeline information
         if "pipeline_info" in data:
             for phase, products in data["pipeline_info"]["phases"].items():
                 for product in products:
                     if "context" in product:
                         # Use spaCy for NER
-                        doc = self.nlp(product["context"])
+                        doc = next(docs)
                         found_company = False
                         for ent in doc.ents:
                             if ent.label_ == "ORG":
@@ -381,19 +518,16 @@ class AnalystAgent(BaseAgent):
                                         "confidence": 0.7
                                     })
                         # Also check for company mentions after "by" or "with"
-                        text = product["context"]
-                        for pattern in [r'by\s+([A-Za-z\s&]+)', r'with\s+([A-Za-z\s&]+)']:
-                            matches = re.finditer(pattern, text, re.IGNORECASE)
-                            for match in matches:
-                                name = self._clean_company_name(match.group(1))
-                                if name and name not in seen_names:
-                                    seen_names.add(name)
-                                    competitors.append({
-                                        "name": name,
-                                        "deal_type": "pipeline",
-                                        "context": product["context"],
-                                        "confidence": 0.8
-                                    })
+                        for mention in self._partner_mentions(doc):
+                            name = self._clean_company_name(mention)
+                            if name and name not in seen_names:
+                                seen_names.add(name)
+                                competitors.append({
+                                    "name": name,
+                                    "deal_type": "pipeline",
+                                    "context": product["context"],
+                                    "confidence": 0.8
+                                })
 
         # Extract from deal information
         if "deal_info" in data:
@@ -412,7 +546,7 @@ class AnalystAgent(BaseAgent):
                                 })
                         elif "context" in deal:
                             # Try to extract company names from context
-                            doc = self.nlp(deal["context"])
+                            doc = next(docs)
                             for ent in doc.ents:
                                 if ent.label_ == "ORG":
                                     name = self._clean_company_name(ent.text)
@@ -426,72 +560,77 @@ class AnalystAgent(BaseAgent):
                                         })
         return competitors
 
+    def _partner_mentions(self, doc) -> List[str]:
+        """Find the words following "by" or "with" in an already tokenized context."""
+        mentions = []
+        for marker in PARTNER_MARKERS:
+            for token in doc:
+                if token.lower_ != marker:
+                    continue
+                # Take the run of words (and ampersands) right after the marker
+                end = token.i + 1
+                while end < len(doc) and (doc[end].is_alpha or doc[end].text == "&"):
+                    end += 1
+                if end > token.i + 1:
+                    mentions.append(doc[token.i + 1:end].text)
+        return mentions
+
     def _analyze_market(self, therapeutic_areas: List[str]) -> Dict[str, float]:
         """Analyze market size and growth based on therapeutic areas."""
         if not therapeutic_areas:
             return {'total_market': 0, 'avg_growth': 0}
         
-        total_market = sum(self.market_sizes.get(area, 0) for area in therapeutic_areas)
-        avg_growth = sum(self.growth_rates.get(area, 0) for area in therapeutic_areas) / len(therapeutic_areas)
+        # Areas without market figures count as zero
+        indices = [self._market_area_index[area] for area in therapeutic_areas if area in self._market_area_index]
+        total_market = self._market_size_vector[indices].sum().item()
+        avg_growth = self._growth_rate_vector[indices].sum().item() / len(therapeutic_areas)
         
         return {
             'total_market': round(total_market, 1),
             'avg_growth': round(avg_growth, 1)
         }
 
-    def _identify_trends(self, text: str) -> List[str]:
+    def _identify_trends(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Identify key market trends from the text."""
         trends = []
+        seen = set()
         
         # Look for trend indicators
-        trend_patterns = [
-            r'increasing.*demand',
-            r'growing.*market',
-            r'emerging.*technology',
-            r'new.*approach',
-            r'innovative.*solution',
-            r'breakthrough.*treatment',
-            r'advancement.*in',
-            r'development.*of',
-            r'focus.*on',
-            r'expansion.*into'
-        ]
-        
-        for pattern in trend_patterns:
-            matches = re.finditer(pattern, text.lower())
+        if text_lower is None:
+            text_lower = text.lower()
+        for pattern in TREND_PATTERNS:
+            matches = pattern.finditer(text_lower)
             for match in matches:
-                context = text[max(0, match.start()-50):min(len(text), match.end()+50)]
-                if context not in trends:
-                    trends.append(context.strip())
+                context = text[max(0, match.start()-50):min(len(text), match.end()+50)].strip()
+                if context not in seen:
+                    seen.add(context)
+                    trends.append(context)
+                    # Only the first MAX_INSIGHTS are returned, so stop scanning once we have them
+                    if len(trends) == MAX_INSIGHTS:
+                        return trends
         
-        return trends[:5]  # Return top 5 trends
+        return trends
 
-    def _identify_risks(self, text: str) -> List[str]:
+    def _identify_risks(self, text: str, text_lower: Optional[str] = None) -> List[str]:
         """Identify risk factors from the text."""
         risks = []
+        seen = set()
         
         # Look for risk indicators
-        risk_patterns = [
-            r'risk.*of',
-            r'challenge.*in',
-            r'concern.*about',
-            r'limitation.*of',
-            r'barrier.*to',
-            r'delay.*in',
-            r'issue.*with',
-            r'problem.*with',
-            r'threat.*to',
-            r'uncertainty.*in'
-        ]
-        
-        for pattern in risk_patterns:
-            matches = re.finditer(pattern, text.lower())
+        if text_lower is None:
+            text_lower = text.lower()
+        for pattern in RISK_PATTERNS:
+            matches = pattern.finditer(text_lower)
             for match in matches:
-                context = text[max(0, match.start()-50):min(len(text), match.end()+50)]
-                if context not in risks:
-                    risks.append(context.strip())
+                context = text[max(0, match.start()-50):min(len(text), match.end()+50)].strip()
+                if context not in seen:
+                    seen.add(context)
+                    risks.append(context)
+                    # Only the first MAX_INSIGHTS are returned, so stop scanning once we have them
+                    if len(risks) == MAX_INSIGHTS:
+                        return risks
         
-        return risks[:5]  # Return top 5 risks
+        return risks
 
     def _analyze_therapeutic_areas(self, data: Dict[str, Any]) -> List[str]:
         """Analyze and identify therapeutic areas."""
@@ -540,15 +679,30 @@ Please provide a list of identified mechanisms of action, including molecular ta
         return [mechanism.strip() for mechanism in text.split('\n') if mechanism.strip()]
 
     def _get_mistral_response(self, prompt: str) -> str:
-        """Get response from Mistral Instruct model using Ollama."""
+        """Get response from Mistral Instruct model using Ollama, reusing cached answers to repeated prompts."""
+        options = {'temperature': 0.7, 'num_predict': 1000}
+        key = hashlib.sha256(f"{self.model}|{options['temperature']}|{prompt}".encode('utf-8')).hexdigest()
+        cache_path = LLM_CACHE_DIR / f"{key}.txt"
+        try:
+            return cache_path.read_text(encoding='utf-8')
+        except OSError:
+            pass
+        
+        import ollama
+        
         try:
             response = ollama.generate(
                 model=self.model,
                 prompt=prompt,
-                temperature=0.7,
-                max_tokens=1000
+                options=options
             )
-            return response['response']
         except Exception as e:
             self.log_error(e)
-            return "Error in Mistral analysis" 
\ No newline at end of file
+            return "Error in Mistral analysis"
+        
+        try:
+            LLM_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(response['response'], encoding='utf-8')
+        except OSError as e:
+            self.log_error(e)
+        return response['response'] 
\ No newline at end of file
@@ -1,9 +1,16 @@
-from typing import Dict, Any
-import autogen
+from __future__ import annotations
+from typing import Dict, Any, TYPE_CHECKING
+from functools import lru_cache
 from config.model_config import AUTOGEN_CONFIG, MODEL_CONFIGS
 
+# autogen is slow to import, so it is only loaded when an agent is created
+if TYPE_CHECKING:
+    import autogen
+
+@lru_cache(maxsize=1)
 def create_crawler_agent() -> autogen.AssistantAgent:
     """Create the Crawler agent configuration."""
+    import autogen
     return autogen.AssistantAgent(
         name="Crawler",
         llm_config=AUTOGEN_CONFIG["llm_config"],
@@ -17,8 +24,10 @@ def create_crawler_agent() -> autogen.AssistantAgent:
         Use the provided scraping tools to gather information efficiently and accurately."""
     )
 
+@lru_cache(maxsize=1)
 def create_analyst_agent() -> autogen.AssistantAgent:
     """Create the Analyst agent configuration."""
+    import autogen
     return autogen.AssistantAgent(
         name="Analyst",
         llm_config=AUTOGEN_CONFIG["llm_config"],
@@ -31,8 +40,10 @@ def create_analyst_agent() -> autogen.AssistantAgent:
         Use NER tools and your expertise to provide detailed analysis."""
     )
 
+@lru_cache(maxsize=1)
 def create_advisor_agent() -> autogen.AssistantAgent:
     """Create the Advisor agent configuration."""
+    import autogen
     return autogen.AssistantAgent(
         name="Advisor",
         llm_config=AUTOGEN_CONFIG["llm_config"],
@@ -45,8 +56,10 @@ def create_advisor_agent() -> autogen.AssistantAgent:
         Use your expertise to create clear, actionable reports."""
     )
 
+@lru_cache(maxsize=1)
 def create_user_proxy() -> autogen.UserProxyAgent:
     """Create the User Proxy agent configuration."""
+    import autogen
     return autogen.UserProxyAgent(
         name="User_Proxy",
         human_input_mode="NEVER",
@@ -62,6 +75,12 @@ def create_user_proxy() -> autogen.UserProxyAgent:
         Your role is to ensure smooth communication and task completion."""
     )
 
+def reset_agents() -> None:
+    """Drop the cached agents so the next call builds fresh ones."""
+    for create in (create_crawler_agent, create_analyst_agent,
+                   create_advisor_agent, create_user_proxy):
+        create.cache_clear()
+
 def create_group_chat_config() -> Dict[str, Any]:
     """Create the group chat configuration."""
     return {
@@ -72,7 +91,10 @@ def create_group_chat_config() -> Dict[str, Any]:
     }
 
 def initialize_agents() -> Dict[str, Any]:
-    """Initialize all agents and return their configurations."""
+    """Initialize all agents and return their configurations.
+
+    Agents are built once and reused; call reset_agents() to rebuild them.
+    """
     return {
         "crawler": create_crawler_agent(),
         "analyst": create_analyst_agent(),
@@ -3,6 +3,8 @@ from typing import Any, Dict
 import logging
 from pathlib import Path
 
+LOG_FORMATTER = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+
 class BaseAgent(ABC):
     """Base class for all agents in the system."""
     
@@ -13,7 +15,13 @@ class BaseAgent(ABC):
     def _setup_logger(self) -> logging.Logger:
         """Set up logging for the agent."""
         logger = logging.getLogger(self.name)
+        
+        # Loggers are per-name singletons, so only the first agent of a name attaches handlers
+        if logger.handlers:
+            return logger
+        
         logger.setLevel(logging.INFO)
+        logger.propagate = False
         
         # Create logs directory if it doesn't exist
         log_dir = Path("logs")
@@ -27,10 +35,8 @@ class BaseAgent(ABC):
         ch = logging.StreamHandler()
         ch.setLevel(logging.INFO)
         
-        # Formatter
-        formatter = logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
-        fh.setFormatter(formatter)
-        ch.setFormatter(formatter)
+        fh.setFormatter(LOG_FORMATTER)
+        ch.setFormatter(LOG_FORMATTER)
         
         logger.addHandler(fh)
         logger.addHandler(ch)
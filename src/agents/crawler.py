@@ -1,18 +1,31 @@
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple, Iterator
+import asyncio
+import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
+from selectolax.parser import HTMLParser
 from urllib.parse import urlparse
 import re
 from .base_agent import BaseAgent
+from ..utils.nlp import get_nlp
 import unicodedata
 import string
 import os
-import sys
 import time
-import spacy
-from collections import defaultdict
+import copy
+import hashlib
+import pickle
+from pathlib import Path
+from collections import defaultdict, OrderedDict
+from functools import singledispatch, lru_cache
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from googlesearch import search
 import random
+import threading
+import multiprocessing
+import ahocorasick
 from ..config.crawler_config import (
     SEARCH_SETTINGS,
     URL_SCORING,
@@ -20,9 +33,251 @@ from ..config.crawler_config import (
     SEARCH_QUERIES,
     BIOTECH_DOMAINS,
     NEWS_DOMAINS,
-    REQUEST_SETTINGS
+    REQUEST_SETTINGS,
+    CACHE_SETTINGS,
+    NER_SETTINGS
 )
 
+# Pharmaceutical terms and patterns used for structured extraction
+PHARMA_TERMS = {
+    "phases": {
+        "Phase I": r"Phase\s*I|Phase\s*1|Phase\s*I/II|Phase\s*1/2",
+        "Phase II": r"Phase\s*II|Phase\s*2|Phase\s*II/III|Phase\s*2/3",
+        "Phase III": r"Phase\s*III|Phase\s*3",
+        "Pre-clinical": r"Pre-?clinical|Preclinical|Pre-IND",
+        "IND": r"IND[\s-]*enabled|Investigational\s*New\s*Drug|IND\s*application",
+        "Approved": r"Approved|FDA\s*approved|EMA\s*approved|Marketing\s*Authorization"
+    },
+    "deal_types": {
+        "partnership": r"partnership|collaboration|alliance|co-?development|joint\s*venture",
+        "license": r"license|licensing|royalty|milestone|technology\s*transfer",
+        "acquisition": r"acquire|acquisition|merger|takeover|purchase",
+        "investment": r"investment|funding|financing|series\s*[A-F]|venture\s*capital"
+    },
+    "indications": {
+        "cancer": r"cancer|oncology|tumor|malignant|metastatic",
+        "autoimmune": r"autoimmune|inflammation|rheumatoid|arthritis|lupus",
+        "neurological": r"neurological|CNS|brain|spinal|nerve",
+        "infectious": r"infectious|viral|bacterial|fungal|pathogen",
+        "rare_disease": r"rare\s*disease|orphan\s*drug|genetic\s*disorder"
+    }
+}
+
+# Compiled once and shared by every crawl
+PHARMA_PATTERNS = {
+    category: {name: re.compile(pattern, re.IGNORECASE) for name, pattern in patterns.items()}
+    for category, patterns in PHARMA_TERMS.items()
+}
+
+# Indication terms never overlap across keys, so they are scanned in a single
+# pass. Phase and deal-type patterns overlap ("Phase I" is a prefix of "Phase II",
+# "series A" of "series acquisition") and keep one scan per key.
+CATEGORY_GROUPS = {
+    category: {f"g{index}": name for index, name in enumerate(PHARMA_TERMS[category])}
+    for category in ("indications",)
+}
+CATEGORY_PATTERNS = {
+    category: re.compile(
+        "|".join(f"(?P<{group}>{PHARMA_TERMS[category][name]})" for group, name in groups.items()),
+        re.IGNORECASE
+    )
+    for category, groups in CATEGORY_GROUPS.items()
+}
+
+# Press release noise, removed in one substitution each
+ARTIFACT_PATTERN = re.compile("|".join([
+    r'FOR IMMEDIATE RELEASE',
+    r'FOR RELEASE UPON RECEIPT',
+    r'CONTACT:.*?\n',
+    r'Media Contact:.*?\n',
+    r'Investor Contact:.*?\n',
+    r'About.*?Company.*?\n',
+    r'Forward-Looking Statements.*?\n',
+    r'SOURCE:.*?\n',
+    r'©.*?\n',
+    r'All rights reserved.*?\n'
+]), re.IGNORECASE)
+BOILERPLATE_PATTERN = re.compile("|".join([
+    r'About the Company.*?(?=\n\n|\Z)',
+    r'Forward-Looking Statements.*?(?=\n\n|\Z)',
+    r'Investor Relations.*?(?=\n\n|\Z)',
+    r'Media Relations.*?(?=\n\n|\Z)',
+    r'Legal Notice.*?(?=\n\n|\Z)'
+]), re.IGNORECASE)
+
+# Leftover HTML tags and entities, stripped in one substitution
+MARKUP_PATTERN = re.compile(r'<[^>]+>|&[a-z]+;')
+WORD_PATTERN = re.compile(r'\S+')
+# Punctuation dropped from normalized company names
+NON_WORD_PATTERN = re.compile(r'[^\w\s]')
+# Legal suffixes stripped from company names, longest spelling first
+COMPANY_SUFFIXES = ('Inc.', 'Inc', 'LLC', 'Ltd.', 'Ltd', 'Corp.', 'Corp', 'PLC', 'plc')
+# Lowercase text fragments marking navigation and legal noise in clean_html
+NOISE_TEXTS = (
+    'skip to main content',
+    'skip to content',
+    'menu',
+    'navigation',
+    'cookie notice',
+    'privacy policy'
+)
+
+DRUG_NAME_PATTERNS = [
+    re.compile(r'([A-Z][a-z]+-[0-9]+)'),  # e.g., Drug-123
+    re.compile(r'([A-Z][a-z]+[0-9]+)'),   # e.g., Drug123
+    re.compile(r'([A-Z]{2,}-[0-9]+)'),    # e.g., DR-123
+    re.compile(r'([A-Z]{2,}[0-9]+)')      # e.g., DR123
+]
+PARTNER_PATTERN = re.compile(r'(?:with|by)\s+([A-Z][a-zA-Z\s&]+(?:Inc\.|LLC|Ltd\.|Corp\.)?)')
+INDICATION_PATTERN = re.compile(r'(?:for|in)\s+([^.,]+)')
+# Looser field patterns used for company pages
+PIPELINE_DRUG_PATTERN = re.compile(r'([A-Za-z0-9-]+(?:\s*[A-Za-z0-9-]+)*)')
+PIPELINE_INDICATION_PATTERN = re.compile(r'for\s+([^.,]+)')
+DEAL_PARTNER_PATTERN = re.compile(r'with\s+([A-Za-z0-9\s]+)')
+
+# Entity recognition only looks at the start of very long pages
+MAX_NER_CHARS = 100_000
+
+# Runs of two or more capitalized words, e.g. "Boehringer Ingelheim" or "Acme Bio Inc"
+ORG_CANDIDATE_PATTERN = re.compile(r'\b[A-Z][a-zA-Z&-]+(?:\s+[A-Z][a-zA-Z&-]*)+')
+
+# URL fragments that mark a press release
+PRESS_RELEASE_PATTERNS = ("press-release", "news", "media")
+
+def _keyword_automaton(keywords: List[str]) -> ahocorasick.Automaton:
+    """Build an Aho-Corasick automaton yielding each keyword it finds."""
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+# URL scoring keywords, each side matched in one pass
+URL_KEYWORD_AUTOMATON = _keyword_automaton([*PRESS_RELEASE_PATTERNS, *WEBSITE_PATTERNS])
+DOMAIN_KEYWORD_AUTOMATON = _keyword_automaton([*NEWS_DOMAINS, *BIOTECH_DOMAINS])
+
+# Batches with at least this many URLs parse pages in worker processes;
+# smaller ones are not worth starting the pool or shipping pages to it
+PROCESS_POOL_MIN_PAGES = 4
+
+# Status reported for responses that are not HTML pages (e.g. PDFs or images)
+UNSUPPORTED_MEDIA_TYPE = 415
+# Response bodies are read in chunks of this size until max_body_bytes
+BODY_CHUNK_SIZE = 64 * 1024
+
+def _is_html_content(content_type: str) -> bool:
+    """Check whether a Content-Type header describes a page worth parsing."""
+    content_type = content_type.lower()
+    return not content_type or "html" in content_type or content_type.startswith("text/")
+
+def _decode_body(body: bytes, encoding: Optional[str]) -> str:
+    """Decode a response body, replacing undecodable bytes."""
+    try:
+        return str(body, encoding or "utf-8", errors="replace")
+    except LookupError:
+        return str(body, "utf-8", errors="replace")
+
+# User-Agents rotated across requests
+USER_AGENTS = (
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
+    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0',
+    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2.1 Safari/605.1.15'
+)
+# Looser headers for sites that answer the default ones with 403
+FALLBACK_HEADERS = {
+    'Accept': '*/*',
+    'Accept-Language': 'en-US,en;q=0.5',
+    'Accept-Encoding': 'gzip, deflate, br',
+    'Referer': 'https://www.google.com/',
+    'Origin': 'https://www.google.com',
+    'Connection': 'keep-alive',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+# Canonical deal categories, keyed by the singular deal type used during extraction
+DEAL_CATEGORIES = {
+    "partnership": "partnerships",
+    "license": "licenses",
+    "acquisition": "acquisitions",
+    "investment": "investments"
+}
+
+# Entity labels kept from the spaCy model
+ENTITY_LABELS = ("PERSON", "ORG", "GPE", "PRODUCT")
+
+@lru_cache(maxsize=128)
+def _spacy_entities(text: str) -> Tuple[Tuple[str, str], ...]:
+    """Run NER once per distinct text, so syndicated copies of a release reuse the result."""
+    return tuple(
+        (ent.label_, ent.text) for ent in get_nlp()(text).ents if ent.label_ in ENTITY_LABELS
+    )
+
+@singledispatch
+def _normalize_pipeline_info(data: Any) -> Dict[str, Dict[str, Any]]:
+    """Normalize pipeline info into {"phases": {...}, "indications": {...}}."""
+    return {"phases": {}, "indications": {}}
+
+@_normalize_pipeline_info.register(dict)
+def _(data: dict) -> Dict[str, Dict[str, Any]]:
+    if "phases" in data or "indications" in data:
+        return {
+            "phases": dict(data.get("phases", {})),
+            "indications": dict(data.get("indications", {}))
+        }
+    # Company page extraction keys products directly by phase
+    return {"phases": dict(data), "indications": {}}
+
+@_normalize_pipeline_info.register(list)
+def _(data: list) -> Dict[str, Dict[str, Any]]:
+    phases = defaultdict(list)
+    for item in data:
+        phases[item.get("phase", "Unknown")].append({
+            "name": item.get("drug", ""),
+            "indication": item.get("indication", ""),
+            "context": item.get("context", "")
+        })
+    return {"phases": dict(phases), "indications": {}}
+
+@singledispatch
+def _normalize_deal_info(data: Any) -> Dict[str, List[Dict[str, Any]]]:
+    """Normalize deal info into lists keyed by canonical deal category."""
+    return {category: [] for category in DEAL_CATEGORIES.values()}
+
+@_normalize_deal_info.register(dict)
+def _(data: dict) -> Dict[str, List[Dict[str, Any]]]:
+    deals = {category: [] for category in DEAL_CATEGORIES.values()}
+    for deal_type, items in data.items():
+        deals[DEAL_CATEGORIES.get(deal_type, deal_type)] = list(items)
+    return deals
+
+@_normalize_deal_info.register(list)
+def _(data: list) -> Dict[str, List[Dict[str, Any]]]:
+    deals = {category: [] for category in DEAL_CATEGORIES.values()}
+    for deal in data:
+        deal_type = deal.get("type", "partnerships")
+        deals.setdefault(DEAL_CATEGORIES.get(deal_type, deal_type), []).append({
+            "partner": deal.get("partner", ""),
+            "context": deal.get("context", "")
+        })
+    return deals
+
+@singledispatch
+def _normalize_entities(data: Any) -> Dict[str, List[str]]:
+    """Normalize entities into lists of names keyed by entity label."""
+    return {}
+
+@_normalize_entities.register(dict)
+def _(data: dict) -> Dict[str, List[str]]:
+    return dict(data)
+
+@_normalize_entities.register(list)
+def _(data: list) -> Dict[str, List[str]]:
+    entities = defaultdict(list)
+    for entity in data:
+        entities[entity.get("type", "ORG")].append(entity.get("text", ""))
+    return dict(entities)
+
 class CrawlerAgent(BaseAgent):
     """Agent responsible for extracting pipeline and deal information from websites."""
     
@@ -31,39 +286,39 @@ class CrawlerAgent(BaseAgent):
         self.session = requests.Session()
         self.session.headers.update(REQUEST_SETTINGS["headers"])
         
-        # Load spaCy model for entity recognition
-        try:
-            self.nlp = spacy.load("en_core_web_sm")
-        except:
-            print("Downloading spaCy model...")
-            import subprocess
-            subprocess.run([sys.executable, "-m", "spacy", "download", "en_core_web_sm"])
-            self.nlp = spacy.load("en_core_web_sm")
+        # Reuse keep-alive connections across crawls and retry transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_connections=REQUEST_SETTINGS["pool_connections"],
+            pool_maxsize=REQUEST_SETTINGS["pool_maxsize"],
+            max_retries=Retry(
+                total=REQUEST_SETTINGS["max_retries"],
+                backoff_factor=REQUEST_SETTINGS["backoff_factor"],
+                status_forcelist=REQUEST_SETTINGS["retry_statuses"],
+                raise_on_status=False
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
+        # Cache of crawl results keyed by URL hash
+        self.cache_dir = Path(CACHE_SETTINGS["dir"])
+        self._memory_cache = OrderedDict()
+        # process_many and the app call one agent from several threads
+        self._cache_lock = threading.Lock()
+        
+        # Worker processes for page extraction, started by the first batch that needs them
+        self._extraction_pool: Optional[ProcessPoolExecutor] = None
+        self._pool_lock = threading.Lock()
+        
+        # Search queries run on several threads but share one rate limit
+        self._search_lock = threading.Lock()
+        self._next_search_at = 0.0
+        
+        # Pages get cheap regex entities unless spaCy NER is asked for
+        self.lazy_spacy = NER_SETTINGS["lazy_spacy"]
         
         # Enhanced pharmaceutical terms and patterns
-        self.pharma_terms = {
-            "phases": {
-                "Phase I": r"Phase\s*I|Phase\s*1|Phase\s*I/II|Phase\s*1/2",
-                "Phase II": r"Phase\s*II|Phase\s*2|Phase\s*II/III|Phase\s*2/3",
-                "Phase III": r"Phase\s*III|Phase\s*3",
-                "Pre-clinical": r"Pre-?clinical|Preclinical|Pre-IND",
-                "IND": r"IND[\s-]*enabled|Investigational\s*New\s*Drug|IND\s*application",
-                "Approved": r"Approved|FDA\s*approved|EMA\s*approved|Marketing\s*Authorization"
-            },
-            "deal_types": {
-                "partnership": r"partnership|collaboration|alliance|co-?development|joint\s*venture",
-                "license": r"license|licensing|royalty|milestone|technology\s*transfer",
-                "acquisition": r"acquire|acquisition|merger|takeover|purchase",
-                "investment": r"investment|funding|financing|series\s*[A-F]|venture\s*capital"
-            },
-            "indications": {
-                "cancer": r"cancer|oncology|tumor|malignant|metastatic",
-                "autoimmune": r"autoimmune|inflammation|rheumatoid|arthritis|lupus",
-                "neurological": r"neurological|CNS|brain|spinal|nerve",
-                "infectious": r"infectious|viral|bacterial|fungal|pathogen",
-                "rare_disease": r"rare\s*disease|orphan\s*drug|genetic\s*disorder"
-            }
-        }
+        self.pharma_terms = PHARMA_TERMS
         
         # Common biotech/pharma website patterns
         self.website_patterns = [
@@ -77,60 +332,36 @@ class CrawlerAgent(BaseAgent):
             "about"
         ]
 
+    @property
+    def nlp(self):
+        """spaCy pipeline shared with the analyst, loaded on first use."""
+        return get_nlp()
+
     def _make_request_with_retry(self, url: str) -> Optional[requests.Response]:
-        """Make HTTP request with retry logic and better error handling."""
-        for attempt in range(REQUEST_SETTINGS["max_retries"]):
-            try:
-                print(f"\nAttempt {attempt + 1} of {REQUEST_SETTINGS['max_retries']}")
-                # Add random delay between attempts
-                if attempt > 0:
-                    time.sleep(random.uniform(2, 4))
-                
-                # Rotate User-Agent
-                user_agents = [
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
-                    'Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:122.0) Gecko/20100101 Firefox/122.0',
-                    'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/605.1.15 (KHTML, like Gecko) Version/17.2.1 Safari/605.1.15'
-                ]
-                self.session.headers['User-Agent'] = random.choice(user_agents)
-                
-                response = self.session.get(url, timeout=REQUEST_SETTINGS["timeout"])
-                
-                # Handle 403 errors specifically
-                if response.status_code == 403:
-                    print(f"Received 403 error, trying with different headers...")
-                    # Try with different headers
-                    self.session.headers.update({
-                        'Accept': '*/*',
-                        'Accept-Language': 'en-US,en;q=0.5',
-                        'Accept-Encoding': 'gzip, deflate, br',
-                        'Referer': 'https://www.google.com/',
-                        'Origin': 'https://www.google.com',
-                        'Connection': 'keep-alive',
-                        'Upgrade-Insecure-Requests': '1'
-                    })
-                    continue
-                
-                return response
-                
-            except requests.exceptions.Timeout:
-                print(f"Timeout on attempt {attempt + 1}")
-                if attempt == REQUEST_SETTINGS["max_retries"] - 1:
-                    return None
-                time.sleep(2 ** attempt)
-            except requests.exceptions.ConnectionError as e:
-                print(f"Connection error on attempt {attempt + 1}: {str(e)}")
-                if attempt == REQUEST_SETTINGS["max_retries"] - 1:
-                    return None
-                time.sleep(2 ** attempt)
-            except requests.exceptions.RequestException as e:
-                print(f"Request error on attempt {attempt + 1}: {str(e)}")
-                if attempt == REQUEST_SETTINGS["max_retries"] - 1:
-                    return None
-                time.sleep(2 ** attempt)
-        
-        return None
+        """Make HTTP request; timeouts, connection errors and 429/5xx responses are retried by the session adapter."""
+        # Rotate User-Agent per request without touching the shared session headers
+        headers = {'User-Agent': random.choice(USER_AGENTS)}
+        try:
+            # Stream the body so oversized pages can be cut off before they are downloaded
+            response = self.session.get(url, headers=headers, timeout=REQUEST_SETTINGS["timeout"], stream=True)
+            
+            # Handle 403 errors specifically
+            if response.status_code == 403:
+                print(f"Received 403 error, trying with different headers...")
+                response.close()
+                time.sleep(random.uniform(2, 4))
+                response = self.session.get(
+                    url,
+                    headers={**headers, **FALLBACK_HEADERS},
+                    timeout=REQUEST_SETTINGS["timeout"],
+                    stream=True
+                )
+            
+            return response
+            
+        except requests.exceptions.RequestException as e:
+            print(f"Request error for {url}: {str(e)}")
+            return None
 
     def process(self, input_data: str) -> Dict[str, Any]:
         """Process a URL or company name to extract pipeline/deal information."""
@@ -138,14 +369,95 @@ class CrawlerAgent(BaseAgent):
             print(f"\n=== Processing Input: {input_data} ===")
             
             if self._is_url(input_data):
-                return self._process_url(input_data)
+                cached = self._load_cached_result(input_data)
+                if cached is not None:
+                    print("Using cached crawl result")
+                    return cached
+                result = self._process_url(input_data)
+                if "error" not in result:
+                    result = self._normalize_output(result)
+                    self._store_cached_result(input_data, result)
+                return result
             else:
-                return self._process_company_name(input_data)
+                result = self._process_company_name(input_data)
+                return result if "error" in result else self._normalize_output(result)
                 
         except Exception as e:
             print(f"Error processing input: {str(e)}")
             return {"error": f"Error processing input: {str(e)}"}
 
+    def _normalize_output(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Give pipeline, deal and entity data the same shape whichever extraction path produced it."""
+        return {
+            **result,
+            "pipeline_info": _normalize_pipeline_info(result.get("pipeline_info")),
+            "deal_info": _normalize_deal_info(result.get("deal_info")),
+            "entities": _normalize_entities(result.get("entities"))
+        }
+
+    def _cache_key(self, url: str) -> str:
+        """Hash a URL into a cache key."""
+        return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+    def _load_cached_result(self, url: str) -> Optional[Dict[str, Any]]:
+        """Return a previously crawled result for the URL if it has not expired."""
+        if not CACHE_SETTINGS["enabled"]:
+            return None
+        
+        key = self._cache_key(url)
+        now = time.time()
+        
+        # In-process cache first
+        with self._cache_lock:
+            entry = self._memory_cache.get(key)
+            if entry is not None:
+                if now - entry[0] <= CACHE_SETTINGS["ttl"]:
+                    self._memory_cache.move_to_end(key)
+                else:
+                    del self._memory_cache[key]
+                    entry = None
+        if entry is not None:
+            return copy.deepcopy(entry[1])
+        
+        # Fall back to the on-disk cache
+        cache_file = self.cache_dir / f"{key}.pkl"
+        try:
+            stored_at = cache_file.stat().st_mtime
+            if now - stored_at > CACHE_SETTINGS["ttl"]:
+                return None
+            with open(cache_file, "rb") as f:
+                result = pickle.load(f)
+        except (OSError, pickle.PickleError, EOFError):
+            return None
+        
+        self._remember(key, stored_at, result)
+        return copy.deepcopy(result)
+
+    def _store_cached_result(self, url: str, result: Dict[str, Any]) -> None:
+        """Save a crawl result in memory and on disk."""
+        if not CACHE_SETTINGS["enabled"]:
+            return
+        
+        key = self._cache_key(url)
+        self._remember(key, time.time(), copy.deepcopy(result))
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write under a per-process, per-thread name and swap it in, so readers never see a partial file
+            temp_file = self.cache_dir / f"{key}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(temp_file, "wb") as f:
+                pickle.dump(result, f)
+            os.replace(temp_file, self.cache_dir / f"{key}.pkl")
+        except OSError as e:
+            print(f"Could not write crawl cache: {str(e)}")
+
+    def _remember(self, key: str, stored_at: float, result: Dict[str, Any]) -> None:
+        """Keep a result in the bounded in-process cache."""
+        with self._cache_lock:
+            self._memory_cache[key] = (stored_at, result)
+            self._memory_cache.move_to_end(key)
+            while len(self._memory_cache) > CACHE_SETTINGS["max_memory_entries"]:
+                self._memory_cache.popitem(last=False)
+
     def _process_url(self, url: str) -> Dict[str, Any]:
         """Process a URL to extract information."""
         try:
@@ -153,115 +465,239 @@ class CrawlerAgent(BaseAgent):
             if response is None:
                 return {"error": "Failed to fetch URL after multiple attempts"}
             
-            if response.status_code != 200:
-                return {"error": f"Failed to fetch URL. Status code: {response.status_code}"}
+            with response:
+                if response.status_code != 200:
+                    return {"error": f"Failed to fetch URL. Status code: {response.status_code}"}
+                
+                content_type = response.headers.get("Content-Type", "")
+                if not _is_html_content(content_type):
+                    return {"error": f"Unsupported content type: {content_type}"}
+                
+                return self._extract_page(url, self._read_body(response))
             
-            soup = BeautifulSoup(response.text, 'html.parser')
-            raw_text = self._extract_text_content(soup)
+        except Exception as e:
+            return {"error": f"Error processing URL: {str(e)}"}
+
+    def _read_body(self, response: requests.Response) -> str:
+        """Read a streamed response body, stopping at the configured size limit."""
+        max_bytes = REQUEST_SETTINGS["max_body_bytes"]
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(BODY_CHUNK_SIZE):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= max_bytes:
+                print(f"Response body truncated at {max_bytes} bytes")
+                break
+        
+        return _decode_body(b"".join(chunks)[:max_bytes], response.encoding)
+
+    def _extract_page(self, url: str, html: str) -> Dict[str, Any]:
+        """Extract pipeline, deal and entity information from a fetched page."""
+        raw_text = self._extract_page_text(html)
+        
+        # Extract structured data
+        structured_data = self._extract_structured_data(raw_text)
+        
+        # Extract entities
+        entities = self._extract_page_entities(raw_text)
+        
+        return {
+            "source_url": url,
+            "pipeline_info": {
+                "phases": structured_data["phases"],
+                "indications": structured_data["indications"]
+            },
+            "deal_info": {
+                "partnerships": structured_data["deals"].get("partnership", []),
+                "licenses": structured_data["deals"].get("license", []),
+                "acquisitions": structured_data["deals"].get("acquisition", []),
+                "investments": structured_data["deals"].get("investment", [])
+            },
+            "entities": entities,
+            "raw_text": raw_text
+        }
+
+    async def process_many(self, inputs: List[str]) -> List[Dict[str, Any]]:
+        """Process several URLs or company names, fetching URLs concurrently over one connection pool."""
+        # Repeated inputs would all miss the cache at once, so each distinct one is crawled a single time
+        unique_inputs = list(dict.fromkeys(inputs))
+        
+        # Page extraction is CPU bound, so larger batches spread it over worker processes
+        url_count = sum(1 for input_data in unique_inputs if self._is_url(input_data))
+        use_pool = url_count >= PROCESS_POOL_MIN_PAGES
+        # Bounds how many fetched bodies are held or parsed at once
+        semaphore = asyncio.Semaphore(REQUEST_SETTINGS["max_pages_in_flight"])
+        async with self._async_session() as session:
+            results = dict(zip(unique_inputs, await asyncio.gather(
+                *(self._process_async(input_data, session, semaphore, use_pool) for input_data in unique_inputs)
+            )))
+        
+        # Repeats get their own copy, like results served from the cache
+        seen = set()
+        outputs = []
+        for input_data in inputs:
+            result = results[input_data]
+            outputs.append(copy.deepcopy(result) if input_data in seen else result)
+            seen.add(input_data)
+        return outputs
+
+    def _get_extraction_pool(self) -> ProcessPoolExecutor:
+        """Return the agent's page extraction pool, starting it on first use."""
+        with self._pool_lock:
+            if self._extraction_pool is None:
+                # Spawned workers, since forking a process that runs server threads can deadlock
+                self._extraction_pool = ProcessPoolExecutor(mp_context=multiprocessing.get_context("spawn"))
+            return self._extraction_pool
+
+    def close(self) -> None:
+        """Shut down the page extraction pool, if one was started."""
+        with self._pool_lock:
+            pool, self._extraction_pool = self._extraction_pool, None
+        if pool is not None:
+            pool.shutdown()
+
+    def _async_session(self) -> aiohttp.ClientSession:
+        """Open a pooled aiohttp session using the crawler request settings."""
+        connector = aiohttp.TCPConnector(
+            limit=REQUEST_SETTINGS["async_connection_limit"],
+            limit_per_host=REQUEST_SETTINGS["async_connections_per_host"]
+        )
+        timeout = aiohttp.ClientTimeout(total=REQUEST_SETTINGS["timeout"])
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=timeout,
+            headers=REQUEST_SETTINGS["headers"]
+        )
+
+    async def _process_async(
+        self,
+        input_data: str,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        use_pool: bool = False
+    ) -> Dict[str, Any]:
+        """Process one input inside process_many, extracting the page in worker processes when asked to."""
+        try:
+            if not self._is_url(input_data):
+                # Company names go through the search engine, which has no async client
+                loop = asyncio.get_running_loop()
+                return await loop.run_in_executor(None, self.process, input_data)
             
-            # Extract structured data
-            structured_data = self._extract_structured_data(raw_text)
+            cached = self._load_cached_result(input_data)
+            if cached is not None:
+                return cached
             
-            # Extract entities
-            entities = self._extract_entities(raw_text)
+            async with semaphore:
+                status, html = await self._fetch_async(session, input_data)
+                if status is None:
+                    return {"error": "Failed to fetch URL after multiple attempts"}
+                if status != 200:
+                    return {"error": f"Failed to fetch URL. Status code: {status}"}
+                
+                if use_pool:
+                    loop = asyncio.get_running_loop()
+                    page = await loop.run_in_executor(
+                        self._get_extraction_pool(), _extract_page_worker, input_data, html, self.lazy_spacy
+                    )
+                else:
+                    page = self._extract_page(input_data, html)
             
-            return {
-                "source_url": url,
-                "pipeline_info": {
-                    "phases": structured_data["phases"],
-                    "indications": structured_data["indications"]
-                },
-                "deal_info": {
-                    "partnerships": structured_data["deals"].get("partnership", []),
-                    "licenses": structured_data["deals"].get("license", []),
-                    "acquisitions": structured_data["deals"].get("acquisition", []),
-                    "investments": structured_data["deals"].get("investment", [])
-                },
-                "entities": entities,
-                "raw_text": raw_text
-            }
+            result = self._normalize_output(page)
+            self._store_cached_result(input_data, result)
+            return result
             
         except Exception as e:
-            return {"error": f"Error processing URL: {str(e)}"}
+            print(f"Error processing input: {str(e)}")
+            return {"error": f"Error processing input: {str(e)}"}
+
+    async def _fetch_async(self, session: aiohttp.ClientSession, url: str) -> Tuple[Optional[int], str]:
+        """Fetch a URL, rotating the User-Agent, retrying with fallback headers and backing off like the sync session."""
+        last_attempt = REQUEST_SETTINGS["max_retries"] - 1
+        for attempt in range(REQUEST_SETTINGS["max_retries"]):
+            # Retries go out with the looser headers, in case the default ones were blocked
+            headers = {'User-Agent': random.choice(USER_AGENTS), **(FALLBACK_HEADERS if attempt else {})}
+            try:
+                async with session.get(url, headers=headers) as response:
+                    if response.status == 403 and attempt < last_attempt:
+                        print(f"Received 403 error for {url}, trying with different headers...")
+                        await asyncio.sleep(random.uniform(2, 4))
+                        continue
+                    if response.status in REQUEST_SETTINGS["retry_statuses"] and attempt < last_attempt:
+                        print(f"Received {response.status} for {url}, retrying...")
+                        await asyncio.sleep(REQUEST_SETTINGS["backoff_factor"] * 2 ** attempt)
+                        continue
+                    if response.status == 200 and not _is_html_content(response.headers.get("Content-Type", "")):
+                        return UNSUPPORTED_MEDIA_TYPE, ""
+                    return response.status, await self._read_body_async(response)
+            except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+                print(f"Request error on attempt {attempt + 1} for {url}: {str(e)}")
+                if attempt == last_attempt:
+                    return None, ""
+                await asyncio.sleep(REQUEST_SETTINGS["backoff_factor"] * 2 ** attempt)
+        
+        return None, ""
+
+    async def _read_body_async(self, response: aiohttp.ClientResponse) -> str:
+        """Read an aiohttp response body, stopping at the configured size limit."""
+        max_bytes = REQUEST_SETTINGS["max_body_bytes"]
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+            body += chunk
+            if len(body) >= max_bytes:
+                print(f"Response body from {response.url} truncated at {max_bytes} bytes")
+                break
+        
+        return _decode_body(bytes(body[:max_bytes]), response.charset)
+
+    async def _fetch_first_success(self, urls: List[str]) -> Optional[Tuple[str, str]]:
+        """Fetch candidate URLs in concurrent batches and return the first (url, html) that loaded, in list order."""
+        batch_size = REQUEST_SETTINGS["async_batch_size"]
+        async with self._async_session() as session:
+            for start in range(0, len(urls), batch_size):
+                batch = urls[start:start + batch_size]
+                print(f"\nTrying URLs {start + 1}-{start + len(batch)} of {len(urls)}")
+                tasks = [asyncio.create_task(self._fetch_async(session, url)) for url in batch]
+                try:
+                    # Await in rank order, so the best page that loads wins without waiting on slower ones
+                    for url, task in zip(batch, tasks):
+                        status, html = await task
+                        if status == 200:
+                            print(f"Successfully fetched URL: {url}")
+                            return url, html
+                        print(f"Failed to fetch URL: {url}")
+                finally:
+                    # Lower-ranked fetches still running are no longer needed
+                    for task in tasks:
+                        task.cancel()
+        
+        return None
 
     def _clean_common_artifacts(self, text: str) -> str:
         """Remove common artifacts from press releases."""
-        # Remove common press release artifacts
-        artifacts = [
-            r'FOR IMMEDIATE RELEASE',
-            r'FOR RELEASE UPON RECEIPT',
-            r'CONTACT:.*?\n',
-            r'Media Contact:.*?\n',
-            r'Investor Contact:.*?\n',
-            r'About.*?Company.*?\n',
-            r'Forward-Looking Statements.*?\n',
-            r'SOURCE:.*?\n',
-            r'©.*?\n',
-            r'All rights reserved.*?\n'
-        ]
-        for pattern in artifacts:
-            text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
-        return text
+        return ARTIFACT_PATTERN.sub(' ', text)
 
     def _remove_boilerplate_sections(self, text: str) -> str:
         """Remove boilerplate sections from press releases."""
-        # Common boilerplate sections to remove
-        sections = [
-            r'About the Company.*?(?=\n\n|\Z)',
-            r'Forward-Looking Statements.*?(?=\n\n|\Z)',
-            r'Investor Relations.*?(?=\n\n|\Z)',
-            r'Media Relations.*?(?=\n\n|\Z)',
-            r'Legal Notice.*?(?=\n\n|\Z)'
-        ]
-        for pattern in sections:
-            text = re.sub(pattern, ' ', text, flags=re.IGNORECASE)
-        return text
-
-    def _extract_relevant_sections(self, text: str) -> str:
-        """Extract relevant sections from press releases."""
-        # Look for sections that typically contain important information
-        relevant_sections = []
-        
-        # Look for sections with key terms
-        key_terms = [
-            r'clinical trial',
-            r'phase [123]',
-            r'regulatory',
-            r'approval',
-            r'partnership',
-            r'collaboration',
-            r'license',
-            r'acquisition'
-        ]
-        
-        # Split text into paragraphs
-        paragraphs = text.split('\n\n')
-        
-        for paragraph in paragraphs:
-            # Check if paragraph contains any key terms
-            if any(re.search(term, paragraph, re.IGNORECASE) for term in key_terms):
-                relevant_sections.append(paragraph)
-        
-        return '\n\n'.join(relevant_sections) if relevant_sections else text
+        return BOILERPLATE_PATTERN.sub(' ', text)
 
     def _truncate_text(self, text: str, max_words: int = 500) -> str:
         """Truncate text to a maximum number of words."""
-        words = text.split()
-        if len(words) > max_words:
-            return ' '.join(words[:max_words]) + '...'
+        end = 0
+        for count, match in enumerate(WORD_PATTERN.finditer(text), 1):
+            if count > max_words:
+                # Words are already single-space separated by preprocessing
+                return text[:end] + '...'
+            end = match.end()
         return text
 
     def preprocess_press_release(self, text: str) -> str:
         """Preprocess press release text to extract relevant information."""
-        import re, unicodedata
-
         text = unicodedata.normalize('NFKD', text)
-        text = re.sub(r'<[^>]+>', ' ', text)
-        text = re.sub(r'&[a-z]+;', ' ', text)
+        text = MARKUP_PATTERN.sub(' ', text)
         text = self._clean_common_artifacts(text)
         text = self._remove_boilerplate_sections(text)
         text = ' '.join(text.split())
-        text = self._extract_relevant_sections(text)
         text = self._truncate_text(text, max_words=500)
         return text.strip()
     
@@ -274,71 +710,78 @@ class CrawlerAgent(BaseAgent):
         }
         
         # Extract phase information
-        for phase, pattern in self.pharma_terms["phases"].items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                context = self._get_context(text, match.start(), 200)
-                drug_name = self._extract_drug_name(context)
-                indication = self._extract_indication(context)
-                
-                structured_data["phases"][phase].append({
-                    "drug_name": drug_name,
-                    "indication": indication,
-                    "context": context
-                })
+        for phase, match in self._find_category_matches(text, "phases"):
+            context = self._get_context(text, match.start(), 200)
+            drug_name = self._extract_drug_name(context)
+            indication = self._extract_indication(context)
+            
+            structured_data["phases"][phase].append({
+                "drug_name": drug_name,
+                "indication": indication,
+                "context": context
+            })
         
         # Extract deal information
-        for deal_type, pattern in self.pharma_terms["deal_types"].items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                context = self._get_context(text, match.start(), 200)
-                partner = self._extract_partner(context)
-                
-                structured_data["deals"][deal_type].append({
-                    "partner": partner,
-                    "context": context
-                })
+        for deal_type, match in self._find_category_matches(text, "deal_types"):
+            context = self._get_context(text, match.start(), 200)
+            partner = self._extract_partner(context)
+            
+            structured_data["deals"][deal_type].append({
+                "partner": partner,
+                "context": context
+            })
         
         # Extract indications
-        for indication_type, pattern in self.pharma_terms["indications"].items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                context = self._get_context(text, match.start(), 200)
-                structured_data["indications"][indication_type].append({
-                    "context": context
-                })
+        for indication_type, match in self._find_category_matches(text, "indications"):
+            context = self._get_context(text, match.start(), 200)
+            structured_data["indications"][indication_type].append({
+                "context": context
+            })
         
         return structured_data
 
+    def _find_category_matches(self, text: str, category: str) -> Iterator[Tuple[str, re.Match]]:
+        """Yield (term name, match) pairs for every term of a category, in one scan where the terms allow it."""
+        if category in CATEGORY_PATTERNS:
+            groups = CATEGORY_GROUPS[category]
+            for match in CATEGORY_PATTERNS[category].finditer(text):
+                yield groups[match.lastgroup], match
+        else:
+            for name, pattern in PHARMA_PATTERNS[category].items():
+                for match in pattern.finditer(text):
+                    yield name, match
+
+    def _extract_page_entities(self, text: str) -> Dict[str, List[str]]:
+        """Extract entities from a crawled page, running spaCy only on the trimmed release when enabled."""
+        if self.lazy_spacy:
+            return self._extract_ingest_entities(text)
+        return self._extract_entities(self.preprocess_press_release(text))
+
+    def _extract_ingest_entities(self, text: str) -> Dict[str, List[str]]:
+        """Extract likely organization names with a regex instead of the spaCy model."""
+        organizations = list(dict.fromkeys(ORG_CANDIDATE_PATTERN.findall(text)))
+        return {"ORG": organizations} if organizations else {}
+
     def _extract_entities(self, text: str) -> Dict[str, List[str]]:
         """Extract named entities from text using spaCy."""
-        doc = self.nlp(text)
         entities = defaultdict(list)
         
-        for ent in doc.ents:
-            if ent.label_ in ["PERSON", "ORG", "GPE", "PRODUCT"]:
-                entities[ent.label_].append(ent.text)
+        for label, entity_text in _spacy_entities(text[:MAX_NER_CHARS]):
+            entities[label].append(entity_text)
         
         return dict(entities)
 
-    def _get_context(self, text: str, position: int, window: int = 200) -> str:
-        """Get context around a position in text."""
+    def _get_context(self, text: str, position: int, window: int = 200, length: int = 0) -> str:
+        """Get context around a position in text, extended past a match of the given length."""
         start = max(0, position - window)
-        end = min(len(text), position + window)
+        end = min(len(text), position + length + window)
         return text[start:end].strip()
 
     def _extract_drug_name(self, context: str) -> str:
         """Extract drug name from context."""
         # Look for common drug name patterns
-        patterns = [
-            r'([A-Z][a-z]+-[0-9]+)',  # e.g., Drug-123
-            r'([A-Z][a-z]+[0-9]+)',   # e.g., Drug123
-            r'([A-Z]{2,}-[0-9]+)',    # e.g., DR-123
-            r'([A-Z]{2,}[0-9]+)'      # e.g., DR123
-        ]
-        
-        for pattern in patterns:
-            match = re.search(pattern, context)
+        for pattern in DRUG_NAME_PATTERNS:
+            match = pattern.search(context)
             if match:
                 return match.group(1)
         
@@ -347,7 +790,7 @@ class CrawlerAgent(BaseAgent):
     def _extract_partner(self, context: str) -> str:
         """Extract partner company name from context."""
         # Look for company names after "with" or "by"
-        match = re.search(r'(?:with|by)\s+([A-Z][a-zA-Z\s&]+(?:Inc\.|LLC|Ltd\.|Corp\.)?)', context)
+        match = PARTNER_PATTERN.search(context)
         if match:
             return match.group(1).strip()
         return "Partner Company"
@@ -355,7 +798,7 @@ class CrawlerAgent(BaseAgent):
     def _extract_indication(self, context: str) -> str:
         """Extract indication from context."""
         # Look for indication after "for" or "in"
-        match = re.search(r'(?:for|in)\s+([^.,]+)', context)
+        match = INDICATION_PATTERN.search(context)
         if match:
             return match.group(1).strip()
         return "Unknown"
@@ -363,67 +806,87 @@ class CrawlerAgent(BaseAgent):
     def _find_company_urls(self, company_name: str) -> List[str]:
         """Find company URLs using Google search, focusing on press releases and news."""
         print(f"\nSearching for {company_name} press releases and news...")
-        urls = []
+        queries = [query_template.format(company=company_name) for query_template in SEARCH_QUERIES]
         
-        for query_template in SEARCH_QUERIES:
-            query = query_template.format(company=company_name)
-            try:
-                print(f"Trying search query: {query}")
-                # Search with a random delay to avoid rate limiting
-                time.sleep(random.uniform(
-                    SEARCH_SETTINGS["delay"]["min"],
-                    SEARCH_SETTINGS["delay"]["max"]
-                ))
-                search_results = search(query, num_results=SEARCH_SETTINGS["num_results"])
-                
-                for url in search_results:
-                    if url not in urls:
-                        urls.append(url)
-                        print(f"Found URL: {url}")
-                
-            except Exception as e:
-                print(f"Error during search: {str(e)}")
-                continue
+        # Searches are network bound, so a few run at once; map keeps the query order
+        with ThreadPoolExecutor(max_workers=SEARCH_SETTINGS["max_workers"]) as executor:
+            results = list(executor.map(self._search_query, queries))
+        
+        urls = []
+        seen = set()
+        for search_results in results:
+            for url in search_results:
+                if url not in seen:
+                    seen.add(url)
+                    urls.append(url)
+                    print(f"Found URL: {url}")
         
         return urls
 
+    def _search_query(self, query: str) -> List[str]:
+        """Run one search query once the shared rate limit allows it, returning no results on failure."""
+        try:
+            print(f"Trying search query: {query}")
+            self._wait_for_search_slot()
+            return list(search(query, num_results=SEARCH_SETTINGS["num_results"]))
+            
+        except Exception as e:
+            print(f"Error during search: {str(e)}")
+            return []
+
+    def _wait_for_search_slot(self) -> None:
+        """Space search starts a random delay apart across all threads to avoid rate limiting."""
+        with self._search_lock:
+            now = time.monotonic()
+            start_at = max(now, self._next_search_at)
+            # Reserve the slot, then wait outside the lock so other threads can queue behind it
+            self._next_search_at = start_at + random.uniform(
+                SEARCH_SETTINGS["delay"]["min"],
+                SEARCH_SETTINGS["delay"]["max"]
+            )
+        time.sleep(start_at - now)
+
     def _find_best_url(self, urls: List[str], company_name: str) -> Optional[str]:
         """Find the best URL from the list of URLs, prioritizing press releases and news."""
         if not urls:
             return None
         
         # Score each URL based on relevance
+        news_domains = set(NEWS_DOMAINS)
+        biotech_domains = set(BIOTECH_DOMAINS)
+        website_patterns = set(WEBSITE_PATTERNS)
+        company = company_name.lower()
+        
         scored_urls = []
         for url in urls:
             score = 0
             domain = urlparse(url).netloc.lower()
+            domain_keywords = {keyword for _, keyword in DOMAIN_KEYWORD_AUTOMATON.iter(domain)}
+            url_keywords = {keyword for _, keyword in URL_KEYWORD_AUTOMATON.iter(url.lower())}
             
             # Check if it's a news domain
-            if any(news_domain in domain for news_domain in NEWS_DOMAINS):
+            if not news_domains.isdisjoint(domain_keywords):
                 score += URL_SCORING["news_domain"]
             
             # Check for press release patterns
-            if any(pattern in url.lower() for pattern in ["press-release", "press-release", "news", "media"]):
+            if not url_keywords.isdisjoint(PRESS_RELEASE_PATTERNS):
                 score += URL_SCORING["press_release"]
             
             # Check if it's the company's main domain
-            if company_name.lower() in domain:
+            if company in domain:
                 score += URL_SCORING["company_domain"]
             
             # Check for pipeline-related pages
-            for pattern in WEBSITE_PATTERNS:
-                if pattern in url.lower():
-                    score += URL_SCORING["pipeline_page"]
+            score += URL_SCORING["pipeline_page"] * len(website_patterns & url_keywords)
             
             # Check for common biotech/pharma domains
-            if any(x in domain for x in BIOTECH_DOMAINS):
+            if not biotech_domains.isdisjoint(domain_keywords):
                 score += URL_SCORING["biotech_domain"]
             
             scored_urls.append((url, score))
         
-        # Sort by score and return the highest scoring URL
-        scored_urls.sort(key=lambda x: x[1], reverse=True)
-        return scored_urls[0][0] if scored_urls else None
+        # Return the highest scoring URL, the earliest one on ties
+        return max(scored_urls, key=lambda x: x[1])[0]
 
     def _process_company_name(self, company_name: str) -> Dict[str, Any]:
         """Process a company name to find and extract information."""
@@ -439,30 +902,23 @@ class CrawlerAgent(BaseAgent):
             print("No URLs found for company")
             return {"error": "No URLs found"}
         
-        # Try each URL until we get a successful response
-        for url in urls:
-            print(f"\nTrying URL: {url}")
-            response = self._make_request_with_retry(url)
-            
-            if response and response.status_code == 200:
-                print(f"Successfully fetched URL: {url}")
-                return self._extract_information(response.text, url)
-            else:
-                print(f"Failed to fetch URL: {url}")
-                continue
+        # Fetch the candidates a batch at a time and keep the best-ranked page that loads
+        fetched = asyncio.run(self._fetch_first_success(urls))
+        if fetched is None:
+            return {"error": "Failed to fetch any URLs"}
         
-        return {"error": "Failed to fetch any URLs"}
+        url, html = fetched
+        return self._extract_information(html, url)
 
     def _normalize_company_name(self, company_name: str) -> str:
         """Normalize company name for better matching."""
         # Remove common suffixes
-        suffixes = ['Inc.', 'Inc', 'LLC', 'Ltd.', 'Ltd', 'Corp.', 'Corp', 'PLC', 'plc']
         name = company_name
-        for suffix in suffixes:
+        for suffix in COMPANY_SUFFIXES:
             name = name.replace(suffix, '').strip()
         
         # Remove special characters and normalize spaces
-        name = re.sub(r'[^\w\s]', '', name)
+        name = NON_WORD_PATTERN.sub('', name)
         name = ' '.join(name.split())
         
         return name
@@ -473,48 +929,52 @@ class CrawlerAgent(BaseAgent):
         for script in soup(["script", "style"]):
             script.decompose()
         
-        # Get text
-        text = soup.get_text()
-        
-        # Break into lines and remove leading and trailing space
-        lines = (line.strip() for line in text.splitlines())
-        
-        # Break multi-headlines into a line each
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        return self._split_text_lines(soup.get_text())
+
+    def _extract_page_text(self, html: str) -> str:
+        """Extract text content from raw HTML with the lexbor parser, falling back to BeautifulSoup."""
+        try:
+            tree = HTMLParser(html)
+            if tree.root is not None:
+                tree.strip_tags(["script", "style"])
+                return self._split_text_lines(tree.root.text(separator=''))
+        except Exception as e:
+            print(f"Fast HTML parsing failed, falling back to BeautifulSoup: {str(e)}")
         
-        # Drop blank lines
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        return self._extract_text_content(BeautifulSoup(html, 'lxml'))
+
+    def _split_text_lines(self, text: str) -> str:
+        """Normalize extracted page text into one stripped chunk per line."""
+        # Line breaks and double spaces (multi-headlines) both end a chunk, so
+        # turn the breaks into double spaces and split the page once
+        chunks = "  ".join(text.splitlines()).split("  ")
         
-        return text
+        # Strip each chunk and drop blank ones
+        return '\n'.join(filter(None, map(str.strip, chunks)))
     
     def _is_url(self, text: str) -> bool:
         """Check if the input is a valid URL."""
+        # Only http(s) links can be crawled, and company names never start like one
+        text = text.lstrip() if isinstance(text, str) else ""
+        if not text.startswith(("http://", "https://")):
+            return False
         try:
-            result = urlparse(text)
-            return all([result.scheme, result.netloc])
-        except:
+            return bool(urlparse(text).netloc)
+        except ValueError:
             return False
 
     def clean_html(self, raw_html):
         """Clean HTML content by removing noise and normalizing text."""
-        soup = BeautifulSoup(raw_html, "html.parser")
+        soup = BeautifulSoup(raw_html, "lxml")
         
         # Remove common noise elements
         for noise in soup.find_all(['script', 'style', 'nav', 'header', 'footer']):
             noise.decompose()
         
         # Remove elements with common noise text
-        noise_patterns = [
-            'skip to main content',
-            'skip to content',
-            'menu',
-            'navigation',
-            'cookie notice',
-            'privacy policy'
-        ]
-        
         for element in soup.find_all(string=True):
-            if any(pattern in element.lower() for pattern in noise_patterns):
+            lowered = element.lower()
+            if any(pattern in lowered for pattern in NOISE_TEXTS):
                 element.parent.decompose()
         
         # Get text and normalize
@@ -526,19 +986,18 @@ class CrawlerAgent(BaseAgent):
     def _extract_information(self, html_content: str, url: str) -> Dict[str, Any]:
         """Extract information from HTML content."""
         try:
-            soup = BeautifulSoup(html_content, 'html.parser')
+            tree = HTMLParser(html_content)
             
             # Remove script and style elements
-            for script in soup(["script", "style"]):
-                script.decompose()
+            tree.strip_tags(["script", "style"])
             
             # Get text content
-            text = soup.get_text(separator=' ', strip=True)
+            text = tree.root.text(separator=' ', strip=True) if tree.root is not None else ""
             
             # Extract information
             pipeline_info = self._extract_pipeline_info(text)
             deal_info = self._extract_deal_info(text)
-            entities = self._extract_entities(text)
+            entities = self._extract_page_entities(text)
             
             return {
                 "url": url,
@@ -556,28 +1015,23 @@ class CrawlerAgent(BaseAgent):
         pipeline_info = defaultdict(list)
         
         # Extract phase information
-        for phase, pattern in self.pharma_terms["phases"].items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Get context around the match
-                start = max(0, match.start() - 200)
-                end = min(len(text), match.end() + 200)
-                context = text[start:end]
-                
-                # Extract drug name and indication
-                drug_match = re.search(r'([A-Za-z0-9-]+(?:\s*[A-Za-z0-9-]+)*)', context)
-                drug = drug_match.group(1) if drug_match else "Unknown"
-                
-                indication_match = re.search(r'for\s+([^.,]+)', context)
-                indication = indication_match.group(1) if indication_match else "Unknown"
-                
-                # Only add if we found something meaningful
-                if drug != "Unknown" or indication != "Unknown":
-                    pipeline_info[phase].append({
-                        "drug": drug,
-                        "indication": indication,
-                        "context": context.strip()
-                    })
+        for phase, match in self._find_category_matches(text, "phases"):
+            context = self._get_context(text, match.start(), 200, len(match.group()))
+            
+            # Extract drug name and indication
+            drug_match = PIPELINE_DRUG_PATTERN.search(context)
+            drug = drug_match.group(1) if drug_match else "Unknown"
+            
+            indication_match = PIPELINE_INDICATION_PATTERN.search(context)
+            indication = indication_match.group(1) if indication_match else "Unknown"
+            
+            # Only add if we found something meaningful
+            if drug != "Unknown" or indication != "Unknown":
+                pipeline_info[phase].append({
+                    "drug": drug,
+                    "indication": indication,
+                    "context": context
+                })
         
         return dict(pipeline_info)
 
@@ -586,23 +1040,29 @@ class CrawlerAgent(BaseAgent):
         deal_info = defaultdict(list)
         
         # Extract deal information
-        for deal_type, pattern in self.pharma_terms["deal_types"].items():
-            matches = re.finditer(pattern, text, re.IGNORECASE)
-            for match in matches:
-                # Get context around the match
-                start = max(0, match.start() - 200)
-                end = min(len(text), match.end() + 200)
-                context = text[start:end]
-                
-                # Extract partner name
-                partner_match = re.search(r'with\s+([A-Za-z0-9\s]+)', context)
-                partner = partner_match.group(1) if partner_match else "Partner Company"
-                
-                # Only add if we found something meaningful
-                if partner != "Partner Company":
-                    deal_info[deal_type].append({
-                        "partner": partner,
-                        "context": context.strip()
-                    })
-        
-        return dict(deal_info) 
\ No newline at end of file
+        for deal_type, match in self._find_category_matches(text, "deal_types"):
+            context = self._get_context(text, match.start(), 200, len(match.group()))
+            
+            # Extract partner name
+            partner_match = DEAL_PARTNER_PATTERN.search(context)
+            partner = partner_match.group(1) if partner_match else "Partner Company"
+            
+            # Only add if we found something meaningful
+            if partner != "Partner Company":
+                deal_info[deal_type].append({
+                    "partner": partner,
+                    "context": context
+                })
+        
+        return dict(deal_info) 
+
+@lru_cache(maxsize=1)
+def _worker_agent() -> CrawlerAgent:
+    """Create the crawler used by a page-extraction worker process."""
+    return CrawlerAgent()
+
+def _extract_page_worker(url: str, html: str, lazy_spacy: bool) -> Dict[str, Any]:
+    """Extract a fetched page inside a worker process of process_many."""
+    agent = _worker_agent()
+    agent.lazy_spacy = lazy_spacy
+    return agent._extract_page(url, html)
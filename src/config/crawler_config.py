@@ -3,6 +3,7 @@
 # Search settings
 SEARCH_SETTINGS = {
     "num_results": 10,  # Increased to get more press releases
+    "max_workers": 4,  # Search queries in flight at once; starts are still spaced by "delay"
     "delay": {
         "min": 2,  # Increased delay to avoid rate limiting
         "max": 4
@@ -81,6 +82,15 @@ BIOTECH_DOMAINS = [
 REQUEST_SETTINGS = {
     "timeout": 30,
     "max_retries": 3,
+    "backoff_factor": 0.5,  # Retry waits 0.5s, 1s, 2s...
+    "retry_statuses": [429, 500, 502, 503, 504],  # Responses worth retrying
+    "max_body_bytes": 2_000_000,  # Larger pages are cut off before parsing
+    "pool_connections": 10,  # Number of hosts to keep connection pools for
+    "pool_maxsize": 20,  # Keep-alive connections per host
+    "async_connection_limit": 100,  # Total connections for concurrent batch crawls
+    "async_connections_per_host": 2,  # Stay polite to each host during batch crawls
+    "max_pages_in_flight": 16,  # Pages fetched or parsed at once during batch crawls
+    "async_batch_size": 10,  # Candidate URLs fetched together when resolving a company name
     "headers": {
         'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/121.0.0.0 Safari/537.36',
         'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/avif,image/webp,image/apng,*/*;q=0.8,application/signed-exchange;v=b3;q=0.7',
@@ -98,4 +108,17 @@ REQUEST_SETTINGS = {
         'Sec-Ch-Ua-Mobile': '?0',
         'Sec-Ch-Ua-Platform': '"Windows"'
     }
-} 
\ No newline at end of file
+} 
+
+# Crawl result cache settings
+CACHE_SETTINGS = {
+    "enabled": True,
+    "dir": ".cache/crawl",
+    "ttl": 7 * 24 * 3600,  # Press releases rarely change once published
+    "max_memory_entries": 512
+}
+
+# Entity extraction settings
+NER_SETTINGS = {
+    "lazy_spacy": True  # Regex entities on ingest; set False to run spaCy NER on each page
+}
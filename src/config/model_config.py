@@ -1,9 +1,19 @@
 from typing import Dict, Any
 from pathlib import Path
+from types import MappingProxyType
 import os
 from dotenv import load_dotenv
 
-load_dotenv()
+# Set once .env has been read, so later loads in the process skip re-parsing it
+DOTENV_LOADED_FLAG = "_MARKETPULSE_DOTENV_LOADED"
+
+def load_environment() -> None:
+    """Read .env into the environment unless this process has already done so."""
+    if not os.environ.get(DOTENV_LOADED_FLAG):
+        load_dotenv()
+        os.environ[DOTENV_LOADED_FLAG] = "1"
+
+load_environment()
 
 # Model configurations
 MODEL_CONFIGS = {
@@ -63,11 +73,16 @@ TOOL_CONFIGS = {
     "scraper": {
         "timeout": 30,
         "max_retries": 3,
+        "concurrency": 16,  # Simultaneous downloads in ScraperTool.scrape_urls
+        "backoff_factor": 0.3,
+        "pool_connections": 32,  # Hosts with pooled keep-alive connections
+        "pool_maxsize": 64,  # Connections kept per host
         "user_agent": "MarketPulse/1.0 (Business Development Analysis Tool)"
     },
     "ner": {
         "batch_size": 32,
-        "max_length": 512
+        "max_length": 512,
+        "n_process": max(1, (os.cpu_count() or 2) // 2)  # Worker processes for batched NER
     },
     "formatter": {
         "template_path": "src/templates",
@@ -97,10 +112,10 @@ PATHS = {
 for path in PATHS.values():
     path.mkdir(parents=True, exist_ok=True)
 
-# Environment variables
-ENV_VARS = {
+# Environment variables, wrapped read-only so callers cannot mutate the shared mapping
+ENV_VARS = MappingProxyType({
     "OLLAMA_HOST": os.getenv("OLLAMA_HOST", "http://localhost:11434"),
     "MODEL_PROVIDER": os.getenv("MODEL_PROVIDER", "ollama"),
     "DEFAULT_MODEL": os.getenv("DEFAULT_MODEL", "mistral"),
     "LOG_LEVEL": os.getenv("LOG_LEVEL", "INFO")
-} 
\ No newline at end of file
+}) 
\ No newline at end of file
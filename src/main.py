@@ -1,11 +1,19 @@
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 import argparse
-import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from agents.crawler import CrawlerAgent
 from agents.analyst import AnalystAgent
 from agents.advisor import AdvisorAgent
 
+# Indented like json.dump(indent=2); numpy values from the analyst serialize natively
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
+# Inputs crawled at once while earlier ones are being analyzed
+CRAWL_WORKERS = 8
+
 def save_report(report: Dict[str, Any], output_path: str) -> None:
     """Save the generated report to a file.
     
@@ -15,9 +23,16 @@ def save_report(report: Dict[str, Any], output_path: str) -> None:
     """
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
+    output_file.write_bytes(orjson.dumps(report, option=JSON_OPTIONS))
+
+@lru_cache(maxsize=None)
+def get_agents() -> Tuple[CrawlerAgent, AnalystAgent, AdvisorAgent]:
+    """Create the agents once and share them across pipeline runs.
     
-    with open(output_file, 'w') as f:
-        json.dump(report, f, indent=2)
+    Returns:
+        Tuple of crawler, analyst and advisor agents
+    """
+    return CrawlerAgent(), AnalystAgent(), AdvisorAgent()
 
 def process_opportunity(input_data: str, output_path: str) -> None:
     """Process an opportunity through the agent pipeline.
@@ -26,14 +41,44 @@ def process_opportunity(input_data: str, output_path: str) -> None:
         input_data: URL or company name to analyze
         output_path: Path where to save the report
     """
-    # Initialize agents
-    crawler = CrawlerAgent()
-    analyst = AnalystAgent()
-    advisor = AdvisorAgent()
+    crawler = get_agents()[0]
     
     # Step 1: Extract information
     print("Step 1: Extracting information...")
     extracted_info = crawler.process(input_data)
+    report_opportunity(extracted_info, output_path)
+
+def process_opportunities(inputs: List[str], output_paths: List[str]) -> None:
+    """Process several opportunities, crawling ahead while earlier ones are analyzed.
+    
+    Crawling is network bound, so every input is fetched from a thread pool
+    and each result is analyzed as soon as its crawl finishes.
+    
+    Args:
+        inputs: URLs or company names to analyze
+        output_paths: Path where to save each report, in input order
+    """
+    crawler = get_agents()[0]
+    
+    print(f"Step 1: Extracting information from {len(inputs)} inputs...")
+    with ThreadPoolExecutor(max_workers=CRAWL_WORKERS) as executor:
+        futures = {
+            executor.submit(crawler.process, input_data): (input_data, output_path)
+            for input_data, output_path in zip(inputs, output_paths)
+        }
+        for future in as_completed(futures):
+            input_data, output_path = futures[future]
+            print(f"\nInput: {input_data}")
+            report_opportunity(future.result(), output_path)
+
+def report_opportunity(extracted_info: Dict[str, Any], output_path: str) -> None:
+    """Analyze crawled information and save the resulting report.
+    
+    Args:
+        extracted_info: Crawler output for one opportunity
+        output_path: Path where to save the report
+    """
+    _, analyst, advisor = get_agents()
     
     if "error" in extracted_info:
         print(f"Error in extraction: {extracted_info['error']}")
@@ -59,14 +104,45 @@ def process_opportunity(input_data: str, output_path: str) -> None:
     save_report(report, output_path)
     print(f"Report saved to: {output_path}")
 
+def read_inputs(input_arg: str) -> List[str]:
+    """Expand the input argument into the opportunities to analyze.
+    
+    Args:
+        input_arg: URL, company name, or path to a file with one input per line
+        
+    Returns:
+        List of URLs or company names
+    """
+    input_file = Path(input_arg)
+    if not input_file.is_file():
+        return [input_arg]
+    return [line.strip() for line in input_file.read_text().splitlines() if line.strip()]
+
+def numbered_output_paths(output_path: str, count: int) -> List[str]:
+    """Derive one report path per input from the requested output path.
+    
+    Args:
+        output_path: Requested output path
+        count: Number of reports
+        
+    Returns:
+        List of paths like reports/opportunity_report_1.json
+    """
+    output_file = Path(output_path)
+    return [str(output_file.with_name(f"{output_file.stem}_{i}{output_file.suffix}")) for i in range(1, count + 1)]
+
 def main():
     parser = argparse.ArgumentParser(description="Business Development Opportunity Analysis System")
-    parser.add_argument("input", help="URL or company name to analyze")
+    parser.add_argument("input", help="URL or company name to analyze, or a file with one per line")
     parser.add_argument("--output", "-o", default="reports/opportunity_report.json",
                       help="Path where to save the report (default: reports/opportunity_report.json)")
     
     args = parser.parse_args()
-    process_opportunity(args.input, args.output)
+    inputs = read_inputs(args.input)
+    if len(inputs) == 1:
+        process_opportunity(inputs[0], args.output)
+    else:
+        process_opportunities(inputs, numbered_output_paths(args.output, len(inputs)))
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
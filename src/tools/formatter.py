@@ -1,22 +1,49 @@
 from typing import Dict, Any, Optional
-import json
+import orjson
 from pathlib import Path
 import jinja2
 from weasyprint import HTML
+from weasyprint.text.fonts import FontConfiguration
 import logging
 from datetime import datetime
 from src.config.model_config import TOOL_CONFIGS, PATHS
 
 logger = logging.getLogger(__name__)
 
+JINJA_CACHE_DIR = Path(".cache/jinja")
+# Indented like json.dump(indent=2); numpy values serialize natively
+JSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+
 class ReportFormatter:
     """Tool for formatting reports in various formats."""
     
     def __init__(self):
         self.config = TOOL_CONFIGS["formatter"]
+        # Compiled templates are also kept on disk so new processes skip compilation
+        JINJA_CACHE_DIR.mkdir(parents=True, exist_ok=True)
         self.template_env = jinja2.Environment(
-            loader=jinja2.FileSystemLoader(self.config["template_path"])
+            loader=jinja2.FileSystemLoader(self.config["template_path"]),
+            bytecode_cache=jinja2.FileSystemBytecodeCache(str(JINJA_CACHE_DIR)),
+            # Drop whitespace around block tags so the rendered HTML stays small
+            trim_blocks=True,
+            lstrip_blocks=True,
+            # Templates ship with the package, so skip the mtime check on every render
+            auto_reload=False
         )
+        # Looked up once so renders skip the loader
+        self.report_template = self.template_env.get_template("report.html")
+        # Shared by every PDF render so fonts are configured only once
+        self.font_config = FontConfiguration()
+        # Formatter for each enabled output format
+        formatters = {
+            "json": self._format_json,
+            "pdf": self._format_pdf,
+            "html": self._format_html
+        }
+        self.formatters = {
+            output_format: formatters[output_format]
+            for output_format in self.config["output_formats"]
+        }
     
     def format_report(
         self,
@@ -34,15 +61,11 @@ class ReportFormatter:
         Returns:
             Dict containing formatted report
         """
-        if output_format not in self.config["output_formats"]:
+        formatter = self.formatters.get(output_format)
+        if formatter is None:
             raise ValueError(f"Unsupported output format: {output_format}")
         
-        if output_format == "json":
-            return self._format_json(data, output_path)
-        elif output_format == "pdf":
-            return self._format_pdf(data, output_path)
-        elif output_format == "html":
-            return self._format_html(data, output_path)
+        return formatter(data, output_path)
     
     def _format_json(self, data: Dict[str, Any], output_path: Optional[str]) -> Dict[str, Any]:
         """Format report as JSON.
@@ -63,11 +86,23 @@ class ReportFormatter:
         }
         
         if output_path:
-            with open(output_path, 'w') as f:
-                json.dump(formatted_data, f, indent=2)
+            Path(output_path).write_bytes(orjson.dumps(formatted_data, option=JSON_OPTIONS))
         
         return formatted_data
     
+    def _render_report(self, data: Dict[str, Any], generated_at: str) -> str:
+        """Render the report template.
+        
+        Args:
+            data: Report data
+            generated_at: Generation timestamp shown in the report
+            
+        Returns:
+            Rendered HTML
+        """
+        # A ready-made context dict skips keyword argument packing in render
+        return self.report_template.render({"report": data, "generated_at": generated_at})
+    
     def _format_pdf(self, data: Dict[str, Any], output_path: Optional[str]) -> Dict[str, Any]:
         """Format report as PDF.
         
@@ -78,17 +113,16 @@ class ReportFormatter:
         Returns:
             Dict containing PDF data
         """
-        # Load HTML template
-        template = self.template_env.get_template("report.html")
+        generated_at = datetime.now().isoformat()
         
-        # Render template with data
-        html_content = template.render(
-            report=data,
-            generated_at=datetime.now().isoformat()
-        )
+        html_content = self._render_report(data, generated_at)
         
         # Convert HTML to PDF
-        pdf = HTML(string=html_content).write_pdf()
+        pdf = HTML(string=html_content).write_pdf(
+            font_config=self.font_config,
+            optimize_images=True,
+            jpeg_quality=85
+        )
         
         if output_path:
             with open(output_path, 'wb') as f:
@@ -97,7 +131,7 @@ class ReportFormatter:
         return {
             "content": pdf,
             "metadata": {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": generated_at,
                 "format": "pdf"
             }
         }
@@ -112,14 +146,9 @@ class ReportFormatter:
         Returns:
             Dict containing HTML data
         """
-        # Load HTML template
-        template = self.template_env.get_template("report.html")
+        generated_at = datetime.now().isoformat()
         
-        # Render template with data
-        html_content = template.render(
-            report=data,
-            generated_at=datetime.now().isoformat()
-        )
+        html_content = self._render_report(data, generated_at)
         
         if output_path:
             with open(output_path, 'w') as f:
@@ -128,7 +157,7 @@ class ReportFormatter:
         return {
             "content": html_content,
             "metadata": {
-                "generated_at": datetime.now().isoformat(),
+                "generated_at": generated_at,
                 "format": "html"
             }
         }
@@ -1,13 +1,20 @@
 from typing import Dict, Any, List, Optional
+from functools import lru_cache
+from itertools import chain
 import spacy
 import scispacy
-from transformers import AutoTokenizer, AutoModel
+from transformers import AutoTokenizer, AutoModelForTokenClassification
 import torch
 import logging
 from src.config.model_config import NER_CONFIGS, TOOL_CONFIGS
 
 logger = logging.getLogger(__name__)
 
+# Entity labels kept from the SciSpacy model
+ENTITY_LABELS = frozenset({"DISEASE", "CHEMICAL", "GENE", "PROTEIN", "ORGANISM"})
+# Only doc.ents is read, so the rest of the pipeline is never run
+DISABLED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
 class NERTool:
     """Tool for Named Entity Recognition using SciSpacy and BioBERT."""
     
@@ -15,6 +22,8 @@ class NERTool:
         self.config = TOOL_CONFIGS["ner"]
         self.scispacy_model = self._load_scispacy()
         self.biobert_model = self._load_biobert()
+        # Therapeutic area and MoA lookups on the same text share one extraction
+        self._cached_entities = lru_cache(maxsize=128)(self.extract_entities)
     
     def _load_scispacy(self) -> spacy.language.Language:
         """Load SciSpacy model.
@@ -23,7 +32,7 @@ class NERTool:
             Loaded SciSpacy model
         """
         try:
-            return spacy.load(NER_CONFIGS["scispacy"]["model"])
+            return spacy.load(NER_CONFIGS["scispacy"]["model"], disable=DISABLED_COMPONENTS)
         except Exception as e:
             logger.error(f"Error loading SciSpacy model: {str(e)}")
             raise
@@ -37,10 +46,14 @@ class NERTool:
         try:
             model_name = NER_CONFIGS["biobert"]["model"]
             tokenizer = AutoTokenizer.from_pretrained(model_name)
-            model = AutoModel.from_pretrained(model_name)
+            model = AutoModelForTokenClassification.from_pretrained(model_name)
+            # Half precision weights: FP16 on GPU, BF16 on CPU
+            device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            dtype = torch.float16 if device.type == "cuda" else torch.bfloat16
             return {
-                "model": model,
-                "tokenizer": tokenizer
+                "model": model.to(device=device, dtype=dtype).eval(),
+                "tokenizer": tokenizer,
+                "device": device
             }
         except Exception as e:
             logger.error(f"Error loading BioBERT model: {str(e)}")
@@ -73,20 +86,44 @@ class NERTool:
         Returns:
             List of extracted entities
         """
-        doc = self.scispacy_model(text)
-        entities = []
+        return self._doc_entities(self.scispacy_model(text))
+    
+    def extract_entities_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Extract SciSpacy entities from many texts with batched inference.
         
-        for ent in doc.ents:
-            if ent.label_ in ["DISEASE", "CHEMICAL", "GENE", "PROTEIN", "ORGANISM"]:
-                entities.append({
-                    "text": ent.text,
-                    "label": ent.label_,
-                    "start": ent.start_char,
-                    "end": ent.end_char,
-                    "confidence": 0.8  # Placeholder for confidence score
-                })
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            List of extracted entities for each text, in input order
+        """
+        docs = self.scispacy_model.pipe(
+            texts,
+            batch_size=self.config["batch_size"],
+            n_process=self.config["n_process"]
+        )
+        return [self._doc_entities(doc) for doc in docs]
+    
+    def _doc_entities(self, doc: spacy.tokens.Doc) -> List[Dict[str, Any]]:
+        """Convert the entities of a processed document.
         
-        return entities
+        Args:
+            doc: Document processed by SciSpacy
+            
+        Returns:
+            List of extracted entities
+        """
+        return [
+            {
+                "text": ent.text,
+                "label": ent.label_,
+                "start": ent.start_char,
+                "end": ent.end_char,
+                "confidence": 0.8  # Placeholder for confidence score
+            }
+            for ent in doc.ents
+            if ent.label_ in ENTITY_LABELS
+        ]
     
     def _extract_biobert_entities(self, text: str) -> List[Dict[str, Any]]:
         """Extract entities using BioBERT.
@@ -97,22 +134,87 @@ class NERTool:
         Returns:
             List of extracted entities
         """
-        # Tokenize text
-        inputs = self.biobert_model["tokenizer"](
-            text,
-            return_tensors="pt",
-            max_length=self.config["max_length"],
-            truncation=True,
-            padding=True
-        )
+        return self.extract_biobert_batch([text])[0]
+    
+    def extract_biobert_batch(self, texts: List[str]) -> List[List[Dict[str, Any]]]:
+        """Extract BioBERT entities from many texts with batched inference.
+        
+        Args:
+            texts: Texts to analyze
+            
+        Returns:
+            List of extracted entities for each text, in input order
+        """
+        tokenizer = self.biobert_model["tokenizer"]
+        model = self.biobert_model["model"]
+        batch_size = self.config["batch_size"]
+        results = []
         
-        # Get model outputs
-        with torch.no_grad():
-            outputs = self.biobert_model["model"](**inputs)
+        for i in range(0, len(texts), batch_size):
+            batch = texts[i:i + batch_size]
+            # Pad to the longest text of the batch rather than to max_length
+            inputs = tokenizer(
+                batch,
+                return_tensors="pt",
+                max_length=self.config["max_length"],
+                truncation=True,
+                padding="longest",
+                return_offsets_mapping=True
+            )
+            offsets = inputs.pop("offset_mapping")
+            
+            with torch.inference_mode():
+                logits = model(**inputs.to(self.biobert_model["device"])).logits
+            scores, tags = logits.float().softmax(dim=-1).max(dim=-1)
+            
+            for text, text_tags, text_scores, spans in zip(
+                batch, tags.tolist(), scores.tolist(), offsets.tolist()
+            ):
+                results.append(self._decode_biobert_tags(text, text_tags, text_scores, spans))
         
-        # Process outputs (simplified version)
-        # TODO: Implement proper entity extraction from BioBERT outputs
-        return []
+        return results
+    
+    def _decode_biobert_tags(
+        self,
+        text: str,
+        tags: List[int],
+        scores: List[float],
+        spans: List[List[int]]
+    ) -> List[Dict[str, Any]]:
+        """Merge per-token BIO tags into entity spans.
+        
+        Args:
+            text: Analyzed text
+            tags: Predicted tag id of each token
+            scores: Probability of each predicted tag
+            spans: Character offsets of each token
+            
+        Returns:
+            List of extracted entities
+        """
+        id2label = self.biobert_model["model"].config.id2label
+        entities = []
+        current = None
+        
+        for tag, score, (start, end) in zip(tags, scores, spans):
+            # Special and padding tokens have empty spans
+            if start == end:
+                current = None
+                continue
+            
+            prefix, _, label = id2label[tag].upper().rpartition("-")
+            if label not in ENTITY_LABELS:
+                current = None
+            elif current is not None and prefix != "B" and current["label"] == label:
+                current["end"] = end
+                current["confidence"] = min(current["confidence"], score)
+            else:
+                current = {"label": label, "start": start, "end": end, "confidence": score}
+                entities.append(current)
+        
+        for entity in entities:
+            entity["text"] = text[entity["start"]:entity["end"]]
+        return entities
     
     def _combine_entities(
         self,
@@ -128,17 +230,14 @@ class NERTool:
         Returns:
             Combined list of entities
         """
-        # Create a set of unique entities based on text and label
+        # Keep one entity per text and label, the one with the highest confidence
         unique_entities = {}
         
-        for entity in scispacy_entities + biobert_entities:
+        for entity in chain(scispacy_entities, biobert_entities):
             key = (entity["text"], entity["label"])
-            if key not in unique_entities:
+            previous = unique_entities.get(key)
+            if previous is None or entity.get("confidence", 0) > previous.get("confidence", 0):
                 unique_entities[key] = entity
-            else:
-                # If entity exists, take the one with higher confidence
-                if entity.get("confidence", 0) > unique_entities[key].get("confidence", 0):
-                    unique_entities[key] = entity
         
         return list(unique_entities.values())
     
@@ -151,14 +250,15 @@ class NERTool:
         Returns:
             List of identified therapeutic areas
         """
-        entities = self.extract_entities(text)
+        entities = self._cached_entities(text)
         therapeutic_areas = []
+        text_length = len(text)
         
         for entity in entities["combined"]:
             if entity["label"] == "DISEASE":
                 therapeutic_areas.append({
                     "area": entity["text"],
-                    "context": text[max(0, entity["start"] - 50):min(len(text), entity["end"] + 50)],
+                    "context": text[max(0, entity["start"] - 50):min(text_length, entity["end"] + 50)],
                     "confidence": entity.get("confidence", 0.8)
                 })
         
@@ -173,14 +273,15 @@ class NERTool:
         Returns:
             List of identified mechanisms of action
         """
-        entities = self.extract_entities(text)
+        entities = self._cached_entities(text)
         moas = []
+        text_length = len(text)
         
         for entity in entities["combined"]:
             if entity["label"] in ["CHEMICAL", "PROTEIN", "GENE"]:
                 moas.append({
                     "mechanism": entity["text"],
-                    "context": text[max(0, entity["start"] - 50):min(len(text), entity["end"] + 50)],
+                    "context": text[max(0, entity["start"] - 50):min(text_length, entity["end"] + 50)],
                     "confidence": entity.get("confidence", 0.8)
                 })
         
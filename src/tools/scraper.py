@@ -1,6 +1,11 @@
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
+import asyncio
+import aiohttp
+import orjson
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from selectolax.parser import HTMLParser
 from newspaper import Article
 import logging
 from src.config.model_config import TOOL_CONFIGS
@@ -15,6 +20,30 @@ class ScraperTool:
         self.headers = {
             "User-Agent": self.config["user_agent"]
         }
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        
+        # Keep connections alive across scrapes and retry transient failures with backoff
+        adapter = HTTPAdapter(
+            pool_connections=self.config["pool_connections"],
+            pool_maxsize=self.config["pool_maxsize"],
+            max_retries=Retry(
+                total=self.config["max_retries"],
+                backoff_factor=self.config["backoff_factor"]
+            )
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+    
+    def __enter__(self) -> "ScraperTool":
+        return self
+    
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        """Close the pooled HTTP connections."""
+        self.session.close()
     
     def scrape_url(self, url: str) -> Dict[str, Any]:
         """Scrape content from a URL.
@@ -26,100 +55,143 @@ class ScraperTool:
             Dict containing scraped content and metadata
         """
         try:
-            # First try using newspaper3k
-            article = Article(url)
-            article.download()
-            article.parse()
+            response = self.session.get(url, timeout=self.config["timeout"])
+            response.raise_for_status()
+            return self._parse_page(url, response.text)
             
-            # If newspaper3k fails, fall back to BeautifulSoup
-            if not article.text:
-                response = requests.get(url, headers=self.headers, timeout=self.config["timeout"])
-                response.raise_for_status()
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Extract text content
-                text = self._extract_text_content(soup)
+        except Exception as e:
+            logger.error(f"Error scraping URL {url}: {str(e)}")
+            return {
+                "url": url,
+                "error": str(e)
+            }
+    
+    async def scrape_urls(self, urls: List[str]) -> List[Dict[str, Any]]:
+        """Scrape content from several URLs concurrently.
+        
+        Args:
+            urls: URLs to scrape
+            
+        Returns:
+            List of dicts containing scraped content and metadata, in input order
+        """
+        semaphore = asyncio.Semaphore(self.config["concurrency"])
+        timeout = aiohttp.ClientTimeout(total=self.config["timeout"])
+        
+        async def scrape(session: aiohttp.ClientSession, url: str) -> Dict[str, Any]:
+            try:
+                async with semaphore:
+                    async with session.get(url) as response:
+                        response.raise_for_status()
+                        html = await response.text()
+                # Parse off the event loop so other downloads keep progressing
+                return await asyncio.to_thread(self._parse_page, url, html)
                 
+            except Exception as e:
+                logger.error(f"Error scraping URL {url}: {str(e)}")
                 return {
                     "url": url,
-                    "title": soup.title.string if soup.title else "",
-                    "text": text,
-                    "html": response.text,
-                    "metadata": self._extract_metadata(soup)
+                    "error": str(e)
                 }
+        
+        async with aiohttp.ClientSession(headers=self.headers, timeout=timeout) as session:
+            return await asyncio.gather(*(scrape(session, url) for url in urls))
+    
+    def _parse_page(self, url: str, html: str) -> Dict[str, Any]:
+        """Extract content and metadata from a downloaded page.
+        
+        Args:
+            url: URL the page was downloaded from
+            html: Page HTML
             
-            return {
-                "url": url,
-                "title": article.title,
-                "text": article.text,
-                "html": article.html,
-                "metadata": {
-                    "authors": article.authors,
-                    "publish_date": article.publish_date,
-                    "keywords": article.keywords,
-                    "summary": article.summary
-                }
-            }
+        Returns:
+            Dict containing scraped content and metadata
+        """
+        # First try using newspaper3k on the downloaded page
+        article = Article(url)
+        article.download(input_html=html)
+        article.parse()
+        
+        # If newspaper3k fails, fall back to parsing the page ourselves
+        if not article.text:
+            tree = HTMLParser(html)
+            title = tree.css_first("title")
+            
+            # Metadata lives in script tags, so read it before they are stripped
+            metadata = self._extract_metadata(tree)
+            
+            # Extract text content
+            text = self._extract_text_content(tree)
             
-        except Exception as e:
-            logger.error(f"Error scraping URL {url}: {str(e)}")
             return {
                 "url": url,
-                "error": str(e)
+                "title": title.text() if title is not None else "",
+                "text": text,
+                "html": html,
+                "metadata": metadata
+            }
+        
+        return {
+            "url": url,
+            "title": article.title,
+            "text": article.text,
+            "html": article.html,
+            "metadata": {
+                "authors": article.authors,
+                "publish_date": article.publish_date,
+                "keywords": article.keywords,
+                "summary": article.summary
             }
+        }
     
-    def _extract_text_content(self, soup: BeautifulSoup) -> str:
-        """Extract text content from BeautifulSoup object.
+    def _extract_text_content(self, tree: HTMLParser) -> str:
+        """Extract text content from a parsed page.
         
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed HTML tree, modified in place
             
         Returns:
             Extracted text content
         """
         # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        tree.strip_tags(["script", "style"])
         
         # Get text
-        text = soup.get_text()
-        
-        # Break into lines and remove leading and trailing space
-        lines = (line.strip() for line in text.splitlines())
-        
-        # Break multi-headlines into a line each
-        chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
+        text = tree.root.text(separator='') if tree.root is not None else ""
         
-        # Drop blank lines
-        text = '\n'.join(chunk for chunk in chunks if chunk)
+        # Line breaks and double spaces (multi-headlines) both end a chunk
+        chunks = "  ".join(text.splitlines()).split("  ")
         
-        return text
+        # Strip each chunk and drop blank ones
+        return '\n'.join(filter(None, map(str.strip, chunks)))
     
-    def _extract_metadata(self, soup: BeautifulSoup) -> Dict[str, Any]:
-        """Extract metadata from BeautifulSoup object.
+    def _extract_metadata(self, tree: HTMLParser) -> Dict[str, Any]:
+        """Extract metadata from a parsed page.
         
         Args:
-            soup: BeautifulSoup object
+            tree: Parsed HTML tree
             
         Returns:
             Dict containing metadata
         """
         metadata = {}
         
-        # Extract meta tags
-        for meta in soup.find_all("meta"):
-            if meta.get("name"):
-                metadata[meta["name"]] = meta.get("content", "")
-            elif meta.get("property"):
-                metadata[meta["property"]] = meta.get("content", "")
+        # Extract meta tags, keyed by name or else property
+        for meta in tree.css("meta[name], meta[property]"):
+            attributes = meta.attributes
+            key = attributes.get("name") or attributes.get("property")
+            if key:
+                metadata[key] = attributes.get("content") or ""
         
-        # Extract structured data
-        for script in soup.find_all("script", type="application/ld+json"):
+        # Extract structured data, keeping every JSON-LD block
+        for script in tree.css('script[type="application/ld+json"]'):
+            body = script.text()
+            if not body:
+                continue
             try:
-                import json
-                metadata["structured_data"] = json.loads(script.string)
-            except:
-                pass
+                metadata.setdefault("structured_data", []).append(orjson.loads(body))
+            except orjson.JSONDecodeError:
+                logger.debug("Skipping malformed JSON-LD block")
         
         return metadata
     
@@ -1,7 +1,35 @@
 from typing import Dict, Any, List, Optional
 from datetime import datetime
 import re
-from urllib.parse import urlparse
+
+# Capitalized words ending in an industry word or a corporate suffix
+COMPANY_NAME_PATTERN = re.compile(
+    r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+'
+    r'(?:Pharma|Biotech|Therapeutics|Medical|Health|Life\s+Sciences'
+    r'|Inc\.|LLC|Ltd\.|Corp\.|Corporation)$'
+)
+
+# Scheme followed by a non-empty network location
+URL_PATTERN = re.compile(r'[a-zA-Z][a-zA-Z0-9+\-.]*://[^\s/?#]')
+
+# Keys each structure must contain
+PIPELINE_INFO_KEYS = frozenset({"products", "phases", "indications"})
+DEAL_INFO_KEYS = frozenset({"partnerships", "licenses", "acquisitions"})
+ANALYSIS_KEYS = frozenset({
+    "therapeutic_areas",
+    "mechanisms_of_action",
+    "competitors",
+    "market_analysis"
+})
+REPORT_KEYS = frozenset({
+    "executive_summary",
+    "opportunity_analysis",
+    "risk_assessment",
+    "recommendations",
+    "generated_at"
+})
+FINANCIAL_TERM_KEYS = frozenset({"type", "value", "context"})
+DATE_KEYS = frozenset({"date", "context"})
 
 def validate_url(url: str) -> bool:
     """Validate if a string is a valid URL.
@@ -12,11 +40,7 @@ def validate_url(url: str) -> bool:
     Returns:
         bool indicating if URL is valid
     """
-    try:
-        result = urlparse(url)
-        return all([result.scheme, result.netloc])
-    except:
-        return False
+    return isinstance(url, str) and URL_PATTERN.match(url) is not None
 
 def validate_company_name(name: str) -> bool:
     """Validate if a string is a valid company name.
@@ -31,12 +55,7 @@ def validate_company_name(name: str) -> bool:
         return False
     
     # Check for common company name patterns
-    patterns = [
-        r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Pharma|Biotech|Therapeutics|Medical|Health|Life\s+Sciences)$',
-        r'^[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Inc\.|LLC|Ltd\.|Corp\.|Corporation)$'
-    ]
-    
-    return any(re.match(pattern, name) for pattern in patterns)
+    return COMPANY_NAME_PATTERN.match(name) is not None
 
 def validate_pipeline_info(pipeline_info: Dict[str, Any]) -> bool:
     """Validate pipeline information structure.
@@ -47,8 +66,7 @@ def validate_pipeline_info(pipeline_info: Dict[str, Any]) -> bool:
     Returns:
         bool indicating if pipeline info is valid
     """
-    required_keys = {"products", "phases", "indications"}
-    return all(key in pipeline_info for key in required_keys)
+    return PIPELINE_INFO_KEYS <= pipeline_info.keys()
 
 def validate_deal_info(deal_info: Dict[str, Any]) -> bool:
     """Validate deal information structure.
@@ -59,8 +77,7 @@ def validate_deal_info(deal_info: Dict[str, Any]) -> bool:
     Returns:
         bool indicating if deal info is valid
     """
-    required_keys = {"partnerships", "licenses", "acquisitions"}
-    return all(key in deal_info for key in required_keys)
+    return DEAL_INFO_KEYS <= deal_info.keys()
 
 def validate_analysis(analysis: Dict[str, Any]) -> bool:
     """Validate analysis results structure.
@@ -71,13 +88,7 @@ def validate_analysis(analysis: Dict[str, Any]) -> bool:
     Returns:
         bool indicating if analysis is valid
     """
-    required_keys = {
-        "therapeutic_areas",
-        "mechanisms_of_action",
-        "competitors",
-        "market_analysis"
-    }
-    return all(key in analysis for key in required_keys)
+    return ANALYSIS_KEYS <= analysis.keys()
 
 def validate_report(report: Dict[str, Any]) -> bool:
     """Validate report structure.
@@ -88,15 +99,7 @@ def validate_report(report: Dict[str, Any]) -> bool:
     Returns:
         bool indicating if report is valid
     """
-    required_keys = {
-        "executive_summary",
-        "opportunity_analysis",
-        "risk_assessment",
-        "recommendations",
-        "generated_at"
-    }
-    
-    if not all(key in report for key in required_keys):
+    if not REPORT_KEYS <= report.keys():
         return False
     
     # Validate generated_at timestamp
@@ -119,9 +122,8 @@ def validate_financial_terms(terms: List[Dict[str, Any]]) -> bool:
     if not isinstance(terms, list):
         return False
     
-    required_keys = {"type", "value", "context"}
     return all(
-        isinstance(term, dict) and all(key in term for key in required_keys)
+        isinstance(term, dict) and FINANCIAL_TERM_KEYS <= term.keys()
         for term in terms
     )
 
@@ -137,9 +139,8 @@ def validate_dates(dates: List[Dict[str, Any]]) -> bool:
     if not isinstance(dates, list):
         return False
     
-    required_keys = {"date", "context"}
     return all(
-        isinstance(date, dict) and all(key in date for key in required_keys)
+        isinstance(date, dict) and DATE_KEYS <= date.keys()
         for date in dates
     )
 
@@ -0,0 +1,114 @@
+from typing import Any, Dict, List, Optional
+import hashlib
+import re
+import threading
+import numpy as np
+
+# Letters only, so digits, dates and punctuation do not perturb the fingerprint
+TOKEN_PATTERN = re.compile(r'[a-z]+')
+
+FINGERPRINT_BITS = 64
+BAND_BITS = 16
+
+def shingles(text: str, k: int = 4) -> List[str]:
+    """Split normalized text into overlapping k-word shingles.
+
+    Args:
+        text: Text to split
+        k: Number of words per shingle
+
+    Returns:
+        List of shingles
+    """
+    tokens = TOKEN_PATTERN.findall(text.lower())
+    if len(tokens) <= k:
+        return [' '.join(tokens)] if tokens else []
+    return [' '.join(tokens[i:i + k]) for i in range(len(tokens) - k + 1)]
+
+def simhash(text: str, k: int = 4) -> int:
+    """Compute a 64-bit SimHash fingerprint of a document.
+
+    Args:
+        text: Document text
+        k: Number of words per shingle
+
+    Returns:
+        Fingerprint as an integer
+    """
+    digests = b''.join(
+        hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest()
+        for shingle in shingles(text, k)
+    )
+    if not digests:
+        return 0
+
+    # One row of 64 bits per shingle, most significant bit first
+    bits = np.unpackbits(np.frombuffer(digests, dtype=np.uint8).reshape(-1, 8), axis=1)
+    # A bit is set in the fingerprint when most shingles have it set
+    majority = 2 * bits.sum(axis=0, dtype=np.int64) > bits.shape[0]
+    return int.from_bytes(np.packbits(majority).tobytes(), 'big')
+
+def hamming_distance(a: int, b: int) -> int:
+    """Count the differing bits between two fingerprints."""
+    return bin(a ^ b).count('1')
+
+class NearDuplicateIndex:
+    """Thread-safe store of payloads keyed by SimHash fingerprint.
+
+    Fingerprints are split into four 16-bit bands. Two fingerprints within
+    3 bits of each other must agree on at least one band, so a lookup only
+    compares against fingerprints sharing a band instead of scanning them all.
+    """
+
+    def __init__(self, max_distance: int = 3, max_entries: int = 10000):
+        bands = FINGERPRINT_BITS // BAND_BITS
+        if max_distance >= bands:
+            raise ValueError(f"max_distance must be lower than {bands}")
+        self.max_distance = max_distance
+        self.max_entries = max_entries
+        self._bands: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+        self._payloads: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+
+    def _band_keys(self, fingerprint: int) -> List[int]:
+        mask = (1 << BAND_BITS) - 1
+        return [(fingerprint >> (i * BAND_BITS)) & mask for i in range(len(self._bands))]
+
+    def lookup(self, fingerprint: int) -> Optional[Any]:
+        """Return the payload of a stored near-duplicate, if any.
+
+        Args:
+            fingerprint: SimHash of the document to look up
+
+        Returns:
+            Stored payload or None
+        """
+        with self._lock:
+            if fingerprint in self._payloads:
+                return self._payloads[fingerprint]
+            for band, key in zip(self._bands, self._band_keys(fingerprint)):
+                for candidate in band.get(key, []):
+                    if hamming_distance(fingerprint, candidate) <= self.max_distance:
+                        return self._payloads[candidate]
+        return None
+
+    def add(self, fingerprint: int, payload: Any) -> None:
+        """Store a payload under a fingerprint, evicting the oldest entry when full.
+
+        Args:
+            fingerprint: SimHash of the document
+            payload: Value to return for near-duplicates of the document
+        """
+        with self._lock:
+            if fingerprint not in self._payloads:
+                for band, key in zip(self._bands, self._band_keys(fingerprint)):
+                    band.setdefault(key, []).append(fingerprint)
+            self._payloads[fingerprint] = payload
+
+            while len(self._payloads) > self.max_entries:
+                oldest = next(iter(self._payloads))
+                del self._payloads[oldest]
+                for band, key in zip(self._bands, self._band_keys(oldest)):
+                    band[key].remove(oldest)
+                    if not band[key]:
+                        del band[key]
@@ -0,0 +1,30 @@
+from __future__ import annotations
+from functools import lru_cache
+from typing import TYPE_CHECKING
+import subprocess
+import sys
+
+# spaCy is slow to import, so it is only loaded with the model
+if TYPE_CHECKING:
+    import spacy
+
+MODEL_NAME = "en_core_web_sm"
+
+# The agents only read doc.ents, so the rest of the pipeline is never run
+DISABLED_COMPONENTS = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+@lru_cache(maxsize=1)
+def get_nlp() -> spacy.language.Language:
+    """Load the NER-only spaCy model once per process, downloading it if missing.
+
+    Returns:
+        Shared spaCy pipeline
+    """
+    import spacy
+    
+    try:
+        return spacy.load(MODEL_NAME, disable=DISABLED_COMPONENTS)
+    except OSError:
+        print("Downloading spaCy model...")
+        subprocess.run([sys.executable, "-m", "spacy", "download", MODEL_NAME])
+        return spacy.load(MODEL_NAME, disable=DISABLED_COMPONENTS)
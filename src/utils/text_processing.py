@@ -1,21 +1,94 @@
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Iterator, Tuple
+from functools import lru_cache
 import re
+import ahocorasick
 from bs4 import BeautifulSoup
 import nltk
-from nltk.tokenize import sent_tokenize
-from nltk.corpus import stopwords
+from nltk.tokenize import PunktTokenizer
 from src.config.settings import THERAPEUTIC_AREAS, DEAL_TYPES, PHASE_KEYWORDS
 
 # Download required NLTK data
 try:
-    nltk.data.find('tokenizers/punkt')
+    nltk.data.find('tokenizers/punkt_tab')
 except LookupError:
-    nltk.download('punkt')
-try:
-    nltk.data.find('corpora/stopwords')
-except LookupError:
-    nltk.download('stopwords')
+    nltk.download('punkt_tab')
+
+# Characters that are neither word, space nor punctuation kept in clean text
+SPECIAL_CHAR_PATTERN = re.compile(r'[^\w\s.,;:!?()-]')
+# The same replacement for ASCII text as a translation table, applied in one pass
+SPECIAL_CHAR_TABLE = str.maketrans({
+    chr(code): ' ' for code in range(128) if SPECIAL_CHAR_PATTERN.match(chr(code))
+})
+
+# Common company name patterns. Names are capped at eight capitalized words
+# before the suffix; an unbounded run made long title-case text quadratic to scan.
+COMPANY_PATTERNS = (
+    re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,7}\s+(?:Pharma|Biotech|Therapeutics|Medical|Health|Life\s+Sciences)\b'),
+    re.compile(r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+){0,7}\s+(?:Inc\.|LLC|Ltd\.|Corp\.|Corporation)\b')
+)
+
+# Common financial term patterns
+FINANCIAL_PATTERNS = {
+    "amount": re.compile(r'\$?\d+(?:,\d{3})*(?:\.\d+)?\s*(?:million|billion|trillion)?', re.IGNORECASE),
+    "percentage": re.compile(r'\d+(?:\.\d+)?%'),
+    "currency": re.compile(r'\$?\d+(?:,\d{3})*(?:\.\d+)?\s*(?:USD|EUR|GBP)', re.IGNORECASE)
+}
+
+# Common date patterns, one named group per format so a single scan finds them all
+DATE_FORMATS = ("month_name", "slashed", "iso")
+DATE_PATTERN = re.compile(
+    r'\b(?:(?P<month_name>(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4})'
+    r'|(?P<slashed>\d{1,2}/\d{1,2}/\d{2,4})'
+    r'|(?P<iso>\d{4}-\d{2}-\d{2}))\b'
+)
+
+def _label_automaton(labeled_keywords: List[Tuple[str, str]]) -> ahocorasick.Automaton:
+    """Build an automaton over lowercased keywords.
+    
+    Each match yields (rank, label, keyword), where rank is the keyword's
+    position in the input list.
+    """
+    automaton = ahocorasick.Automaton()
+    for rank, (label, keyword) in enumerate(labeled_keywords):
+        automaton.add_word(keyword.lower(), (rank, label, keyword))
+    automaton.make_automaton()
+    return automaton
 
+# Business keywords, each group found in a single pass over the text
+THERAPEUTIC_AREA_AUTOMATON = _label_automaton([(area, area) for area in THERAPEUTIC_AREAS])
+DEAL_TYPE_AUTOMATON = _label_automaton([(deal_type, deal_type) for deal_type in DEAL_TYPES])
+PHASE_AUTOMATON = _label_automaton([
+    (phase, keyword) for phase, keywords in PHASE_KEYWORDS.items() for keyword in keywords
+])
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+def _keyword_matches(automaton: ahocorasick.Automaton, text: str) -> Iterator[Tuple[str, str, int, int]]:
+    """Find whole-word, case-insensitive keyword matches.
+    
+    Args:
+        automaton: Automaton built by _label_automaton
+        text: Text to search
+        
+    Yields:
+        (label, keyword, start, end) grouped by keyword in list order, then by position
+    """
+    lowered = text.lower()
+    matches = []
+    for last, (rank, label, keyword) in automaton.iter(lowered):
+        start, end = last - len(keyword) + 1, last + 1
+        # Same boundaries as \b around keywords that start and end with word characters
+        if start > 0 and _is_word_char(lowered[start - 1]):
+            continue
+        if end < len(lowered) and _is_word_char(lowered[end]):
+            continue
+        matches.append((rank, start, label, keyword, end))
+    
+    for _, start, label, keyword, end in sorted(matches):
+        yield label, keyword, start, end
+
+@lru_cache(maxsize=128)
 def clean_text(text: str) -> str:
     """Clean and normalize text content.
     
@@ -25,16 +98,14 @@ def clean_text(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Remove extra whitespace
-    text = re.sub(r'\s+', ' ', text)
-    
     # Remove special characters but keep important ones
-    text = re.sub(r'[^\w\s.,;:!?()-]', ' ', text)
+    if text.isascii():
+        text = text.translate(SPECIAL_CHAR_TABLE)
+    else:
+        text = SPECIAL_CHAR_PATTERN.sub(' ', text)
     
-    # Normalize whitespace
-    text = ' '.join(text.split())
-    
-    return text.strip()
+    # Collapse and trim whitespace
+    return ' '.join(text.split())
 
 def extract_sentences(text: str, max_length: int = 200) -> List[str]:
     """Extract meaningful sentences from text.
@@ -46,8 +117,17 @@ def extract_sentences(text: str, max_length: int = 200) -> List[str]:
     Returns:
         List of extracted sentences
     """
-    sentences = sent_tokenize(text)
-    return [s for s in sentences if len(s) <= max_length]
+    return [s for s in _sentences(text) if len(s) <= max_length]
+
+@lru_cache(maxsize=128)
+def _sentences(text: str) -> Tuple[str, ...]:
+    """Split text into sentences, remembering recent texts since pages are often re-analyzed."""
+    return tuple(_sentence_tokenizer().tokenize(text))
+
+@lru_cache(maxsize=None)
+def _sentence_tokenizer() -> PunktTokenizer:
+    """Load the English Punkt model once rather than on every tokenization."""
+    return PunktTokenizer("english")
 
 def identify_therapeutic_areas(text: str) -> List[Dict[str, Any]]:
     """Identify therapeutic areas mentioned in text.
@@ -59,18 +139,14 @@ def identify_therapeutic_areas(text: str) -> List[Dict[str, Any]]:
         List of identified therapeutic areas with context
     """
     areas = []
-    for area in THERAPEUTIC_AREAS:
-        pattern = re.compile(rf'\b{re.escape(area)}\b', re.IGNORECASE)
-        matches = pattern.finditer(text)
-        for match in matches:
-            start = max(0, match.start() - 100)
-            end = min(len(text), match.end() + 100)
-            context = text[start:end]
-            areas.append({
-                "area": area,
-                "context": context,
-                "confidence": 0.8  # Placeholder for ML-based confidence
-            })
+    for area, _, match_start, match_end in _keyword_matches(THERAPEUTIC_AREA_AUTOMATON, text):
+        # Slices stop at the end of the text on their own, so only the start needs clamping
+        context = text[max(0, match_start - 100):match_end + 100]
+        areas.append({
+            "area": area,
+            "context": context,
+            "confidence": 0.8  # Placeholder for ML-based confidence
+        })
     return areas
 
 def identify_deal_types(text: str) -> List[Dict[str, Any]]:
@@ -83,18 +159,13 @@ def identify_deal_types(text: str) -> List[Dict[str, Any]]:
         List of identified deal types with context
     """
     deals = []
-    for deal_type in DEAL_TYPES:
-        pattern = re.compile(rf'\b{re.escape(deal_type)}\b', re.IGNORECASE)
-        matches = pattern.finditer(text)
-        for match in matches:
-            start = max(0, match.start() - 100)
-            end = min(len(text), match.end() + 100)
-            context = text[start:end]
-            deals.append({
-                "type": deal_type,
-                "context": context,
-                "confidence": 0.8  # Placeholder for ML-based confidence
-            })
+    for deal_type, _, match_start, match_end in _keyword_matches(DEAL_TYPE_AUTOMATON, text):
+        context = text[max(0, match_start - 100):match_end + 100]
+        deals.append({
+            "type": deal_type,
+            "context": context,
+            "confidence": 0.8  # Placeholder for ML-based confidence
+        })
     return deals
 
 def identify_development_phases(text: str) -> List[Dict[str, Any]]:
@@ -107,20 +178,14 @@ def identify_development_phases(text: str) -> List[Dict[str, Any]]:
         List of identified phases with context
     """
     phases = []
-    for phase, keywords in PHASE_KEYWORDS.items():
-        for keyword in keywords:
-            pattern = re.compile(rf'\b{re.escape(keyword)}\b', re.IGNORECASE)
-            matches = pattern.finditer(text)
-            for match in matches:
-                start = max(0, match.start() - 100)
-                end = min(len(text), match.end() + 100)
-                context = text[start:end]
-                phases.append({
-                    "phase": phase,
-                    "keyword": keyword,
-                    "context": context,
-                    "confidence": 0.8  # Placeholder for ML-based confidence
-                })
+    for phase, keyword, match_start, match_end in _keyword_matches(PHASE_AUTOMATON, text):
+        context = text[max(0, match_start - 100):match_end + 100]
+        phases.append({
+            "phase": phase,
+            "keyword": keyword,
+            "context": context,
+            "confidence": 0.8  # Placeholder for ML-based confidence
+        })
     return phases
 
 def extract_company_names(text: str) -> List[str]:
@@ -132,16 +197,11 @@ def extract_company_names(text: str) -> List[str]:
     Returns:
         List of company names
     """
-    # Common company name patterns
-    patterns = [
-        r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Pharma|Biotech|Therapeutics|Medical|Health|Life\s+Sciences)\b',
-        r'\b[A-Z][a-z]+(?:\s+[A-Z][a-z]+)*\s+(?:Inc\.|LLC|Ltd\.|Corp\.|Corporation)\b'
-    ]
-    
-    companies = set()
-    for pattern in patterns:
-        matches = re.finditer(pattern, text)
-        companies.update(match.group() for match in matches)
+    # A dict dedupes like a set but keeps names in the order they were found
+    companies = {}
+    for pattern in COMPANY_PATTERNS:
+        # The patterns have no capturing groups, so findall yields whole matches
+        companies.update(dict.fromkeys(pattern.findall(text)))
     
     return list(companies)
 
@@ -154,20 +214,11 @@ def extract_financial_terms(text: str) -> List[Dict[str, Any]]:
     Returns:
         List of financial terms with context
     """
-    # Common financial term patterns
-    patterns = {
-        "amount": r'\$?\d+(?:,\d{3})*(?:\.\d+)?\s*(?:million|billion|trillion)?',
-        "percentage": r'\d+(?:\.\d+)?%',
-        "currency": r'\$?\d+(?:,\d{3})*(?:\.\d+)?\s*(?:USD|EUR|GBP)'
-    }
-    
     terms = []
-    for term_type, pattern in patterns.items():
-        matches = re.finditer(pattern, text, re.IGNORECASE)
+    for term_type, pattern in FINANCIAL_PATTERNS.items():
+        matches = pattern.finditer(text)
         for match in matches:
-            start = max(0, match.start() - 50)
-            end = min(len(text), match.end() + 50)
-            context = text[start:end]
+            context = text[max(0, match.start() - 50):match.end() + 50]
             terms.append({
                 "type": term_type,
                 "value": match.group(),
@@ -185,23 +236,14 @@ def extract_dates(text: str) -> List[Dict[str, Any]]:
     Returns:
         List of dates with context
     """
-    # Common date patterns
-    patterns = [
-        r'\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]* \d{1,2},? \d{4}\b',
-        r'\b\d{1,2}/\d{1,2}/\d{2,4}\b',
-        r'\b\d{4}-\d{2}-\d{2}\b'
-    ]
-    
     dates = []
-    for pattern in patterns:
-        matches = re.finditer(pattern, text)
-        for match in matches:
-            start = max(0, match.start() - 50)
-            end = min(len(text), match.end() + 50)
-            context = text[start:end]
-            dates.append({
-                "date": match.group(),
-                "context": context
-            })
+    # Listed format by format, as when each format was scanned separately
+    matches = sorted(DATE_PATTERN.finditer(text), key=lambda match: DATE_FORMATS.index(match.lastgroup))
+    for match in matches:
+        context = text[max(0, match.start() - 50):match.end() + 50]
+        dates.append({
+            "date": match.group(),
+            "context": context
+        })
     
     return dates 
\ No newline at end of file
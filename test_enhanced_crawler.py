@@ -1,10 +1,13 @@
 import sys
 import os
-import time
+from concurrent.futures import ThreadPoolExecutor
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '.')))
 from src.agents.crawler import CrawlerAgent
 import json
-from typing import Dict, Any
+from typing import Dict, Any, List
+
+# URLs crawled at once; every test URL targets a different host
+MAX_WORKERS = 4
 
 def print_results(result: Dict[str, Any], title: str = "Results"):
     """Print results in a formatted way."""
@@ -49,6 +52,11 @@ def print_results(result: Dict[str, Any], title: str = "Results"):
             for entity in entities:
                 print(f"  {entity}")
 
+def crawl_all(crawler: CrawlerAgent, inputs: List[str]) -> List[Dict[str, Any]]:
+    """Crawl URLs concurrently, returning results in input order."""
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        return list(executor.map(crawler.process, inputs))
+
 def test_company_crawler():
     """Test the crawler with different company names."""
     crawler = CrawlerAgent()
@@ -61,15 +69,12 @@ def test_company_crawler():
         "Novartis"
     ]
     
+    # Every company name is resolved through the same search engine, so they
+    # run one at a time to keep its rate limit
     for company in test_companies:
         print(f"\nTesting company: {company}")
         print("=" * 50)
-        
-        result = crawler.process(company)
-        print_results(result, f"Company: {company}")
-        
-        # Add a small delay between requests
-        time.sleep(2)
+        print_results(crawler.process(company), f"Company: {company}")
 
 def test_url_crawler():
     """Test the crawler with specific URLs."""
@@ -83,15 +88,10 @@ def test_url_crawler():
         "https://www.novartis.com/research-development/pipeline"
     ]
     
-    for url in test_urls:
+    for url, result in zip(test_urls, crawl_all(crawler, test_urls)):
         print(f"\nTesting URL: {url}")
         print("=" * 50)
-        
-        result = crawler.process(url)
         print_results(result, f"URL: {url}")
-        
-        # Add a small delay between requests
-        time.sleep(2)
 
 def main():
     """Main function to run the tests."""
@@ -0,0 +1,30 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from src.agents.crawler import CrawlerAgent
+from src.agents.analyst import AnalystAgent
+from src.agents.advisor import AdvisorAgent
+from src.config.crawler_config import CACHE_SETTINGS
+
+@pytest.fixture(scope="session", autouse=True)
+def isolated_crawl_cache(tmp_path_factory):
+    """Keep crawl results out of the repository and away from other test workers."""
+    with pytest.MonkeyPatch.context() as monkeypatch:
+        monkeypatch.setitem(CACHE_SETTINGS, "dir", str(tmp_path_factory.mktemp("crawl_cache")))
+        yield
+
+@pytest.fixture(scope="session")
+def crawler():
+    """Crawler agent shared by tests that do not patch it or its settings."""
+    return CrawlerAgent()
+
+@pytest.fixture(scope="session")
+def analyst():
+    """Analyst agent shared by the whole test session, since loading its NLP model is slow."""
+    return AnalystAgent()
+
+@pytest.fixture(scope="session")
+def advisor():
+    """Advisor agent shared by the whole test session."""
+    return AdvisorAgent()
@@ -2,14 +2,12 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
-from src.agents.advisor import AdvisorAgent
+from src.agents.advisor import Factor
 
-def test_advisor_initialization():
-    agent = AdvisorAgent()
-    assert agent.name == "AdvisorAgent"
+def test_advisor_initialization(advisor):
+    assert advisor.name == "AdvisorAgent"
 
-def test_advisor_report_structure():
-    agent = AdvisorAgent()
+def test_advisor_report_structure(advisor):
     analyst_output = {
         "therapeutic_areas": [
             {"area": "Oncology", "matches": [{"term": "cancer", "context": "..."}], "confidence": 0.5},
@@ -24,7 +22,7 @@ def test_advisor_report_structure():
             {"company": "Company Y", "deal_type": "licenses", "context": "..."}
         ]
     }
-    report = agent.process(analyst_output)
+    report = advisor.process(analyst_output)
     assert isinstance(report, dict)
     assert "executive_summary" in report
     assert "opportunity_highlights" in report
@@ -37,17 +35,40 @@ def test_advisor_report_structure():
     assert "Small Molecule" in report["executive_summary"]
     assert "Company X" in report["executive_summary"]
 
-def test_advisor_empty_input():
-    agent = AdvisorAgent()
+def test_advisor_empty_input(advisor):
     empty_output = {"therapeutic_areas": [], "mechanisms_of_action": [], "competitors": []}
-    report = agent.process(empty_output)
+    report = advisor.process(empty_output)
     assert "Unclear therapeutic focus." in report["key_risks"]
     assert "No clear mechanism of action identified." in report["key_risks"]
     assert "No competitors or partners identified" in report["key_risks"]
     assert "Gather more data" in report["strategic_recommendations"]
 
-def test_advisor_error_passthrough():
-    agent = AdvisorAgent()
+def test_advisor_error_passthrough(advisor):
     error_input = {"error": "Some error occurred"}
-    report = agent.process(error_input)
-    assert report["error"] == "Some error occurred" 
\ No newline at end of file
+    report = advisor.process(error_input)
+    assert report["error"] == "Some error occurred"
+
+def test_advisor_report_rendering(advisor):
+    crawler_data = {"company_name": "Acme <Bio>", "pipeline_info": {"phases": {}}}
+    analyst_data = {"therapeutic_areas": ["Oncology"], "competitors": [{"name": "Company X"}], "market_size": "$120B"}
+    recommendations = {"immediate_actions": ["Act now"], "market_entry": ["Enter"], "risk_mitigation": ["Hedge"], "value_creation": ["Grow"]}
+    html = advisor._generate_report(crawler_data, analyst_data, recommendations)
+    assert "Acme &lt;Bio&gt;" in html  # Values are HTML-escaped
+    assert "Oncology" in html
+    assert "Company X" in html
+    assert "$120B" in html
+    assert "Act now" in html
+
+def test_advisor_factor_recommendations(advisor):
+    assessment = {"category": "moderate_potential", "factors": [Factor.LARGE_MARKET, Factor.STRONG_PIPELINE, Factor.HIGH_COMPETITION]}
+    recommendations = advisor._generate_recommendations(assessment)
+    assert recommendations["immediate_actions"] == ["Engage BD team for partnership discussions", "Accelerate clinical development"]
+    assert recommendations["risk_mitigation"] == ["Monitor competitive pipeline", "Establish contingency plans"]
+    assert recommendations["value_creation"] == ["R&D collaborations"]
+
+def test_advisor_empty_report(advisor):
+    crawler_data = {"company_name": "Acme", "pipeline_info": {"phases": {}, "indications": {}},
+                    "deal_info": {"partnerships": [], "licenses": [], "acquisitions": [], "investments": []}}
+    html = advisor._generate_report(crawler_data, {"competitors": []}, {})
+    assert "Acme" in html
+    assert "No pipeline, deal or market data available." in html
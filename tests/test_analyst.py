@@ -2,25 +2,22 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
-from src.agents.analyst import AnalystAgent
 
-def test_analyst_initialization():
+def test_analyst_initialization(analyst):
     """Test analyst agent initialization."""
-    agent = AnalystAgent()
-    assert agent.name == "AnalystAgent"
-    assert "therapeutic_areas" in agent.__dict__
-    assert "mechanisms_of_action" in agent.__dict__
+    assert analyst.name == "AnalystAgent"
+    assert "therapeutic_areas" in analyst.__dict__
+    assert "mechanisms_of_action" in analyst.__dict__
 
-def test_therapeutic_area_identification():
+def test_therapeutic_area_identification(analyst):
     """Test identification of therapeutic areas."""
-    agent = AnalystAgent()
     text = """
     Our lead product is in Phase II clinical trials for cancer treatment.
     We also have a pre-clinical candidate for multiple sclerosis.
     Our IND-enabled program shows promising results in rheumatoid arthritis.
     """
     
-    areas = agent._identify_therapeutic_areas(text)
+    areas = analyst._identify_therapeutic_areas(text)
     
     # Test oncology identification
     oncology = next((area for area in areas if area["area"] == "Oncology"), None)
@@ -40,16 +37,15 @@ def test_therapeutic_area_identification():
     assert immunology["confidence"] > 0
     assert any("rheumatoid arthritis" in match["term"] for match in immunology["matches"])
 
-def test_moa_identification():
+def test_moa_identification(analyst):
     """Test identification of mechanisms of action."""
-    agent = AnalystAgent()
     text = """
     Our lead product is a small molecule inhibitor targeting cancer.
     We also have a monoclonal antibody in development.
     Our cell therapy program shows promising results.
     """
     
-    moas = agent._identify_moas(text)
+    moas = analyst._identify_moas(text)
     
     # Test small molecule identification
     small_molecule = next((moa for moa in moas if moa["category"] == "Small Molecule"), None)
@@ -69,9 +65,8 @@ def test_moa_identification():
     assert cell_therapy["confidence"] > 0
     assert any("cell therapy" in match["term"] for match in cell_therapy["matches"])
 
-def test_competitor_identification():
+def test_competitor_identification(analyst):
     """Test identification of competitors."""
-    agent = AnalystAgent()
     data = {
         "deal_info": {
             "partnerships": [
@@ -84,15 +79,14 @@ def test_competitor_identification():
             "acquisitions": []
         }
     }
-    result = agent.process(data)
+    result = analyst.process(data)
     competitors = result.get("competitors", [])
     assert any("Pfizer" in c.get("name", "") for c in competitors)
     assert any("Novartis" in c.get("name", "") for c in competitors)
     assert any("Roche" in c.get("name", "") for c in competitors)
 
-def test_full_analysis():
+def test_full_analysis(analyst):
     """Test full analysis of pipeline and deal information."""
-    agent = AnalystAgent()
     data = {
         "pipeline_info": {
             "phases": {
@@ -121,7 +115,7 @@ def test_full_analysis():
             "acquisitions": []
         }
     }
-    analysis = agent.process(data)
+    analysis = analyst.process(data)
     # Test therapeutic areas
     assert len(analysis["therapeutic_areas"]) > 0
     assert any(area["area"] == "Oncology" for area in analysis["therapeutic_areas"])
@@ -135,9 +129,8 @@ def test_full_analysis():
     assert any("Pfizer" in c.get("name", "") for c in competitors)
     assert any("Novartis" in c.get("name", "") for c in competitors)
 
-def test_competitor_detection():
+def test_competitor_detection(analyst):
     """Test competitor detection with therapeutic area context."""
-    agent = AnalystAgent()
 
     # Test data with real company names in therapeutic contexts
     test_data = {
@@ -158,7 +151,7 @@ def test_competitor_detection():
         }
     }
 
-    result = agent.process(test_data)
+    result = analyst.process(test_data)
 
     assert "competitors" in result
     competitors = result["competitors"]
@@ -170,9 +163,8 @@ def test_competitor_detection():
     assert "Novartis" in competitor_names
     assert "Roche" in competitor_names
 
-def test_deal_structure_detection():
+def test_deal_structure_detection(analyst):
     """Test detection of different deal structures."""
-    agent = AnalystAgent()
     
     # Test data with various deal types
     test_data = {
@@ -189,7 +181,7 @@ def test_deal_structure_detection():
         }
     }
     
-    result = agent.process(test_data)
+    result = analyst.process(test_data)
     
     assert "deals" in result
     deals = result["deals"]
@@ -206,9 +198,8 @@ def test_deal_structure_detection():
         assert "context" in deal
         assert len(deal["context"]) > 0
 
-def test_competitor_name_cleaning():
+def test_competitor_name_cleaning(analyst):
     """Test competitor name cleaning and deduplication."""
-    agent = AnalystAgent()
     
     # Test data with various company name formats
     test_data = {
@@ -230,7 +221,7 @@ def test_competitor_name_cleaning():
         }
     }
     
-    result = agent.process(test_data)
+    result = analyst.process(test_data)
     
     # Verify competitors were cleaned and deduplicated
     assert "competitors" in result
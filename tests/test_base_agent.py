@@ -0,0 +1,18 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from src.agents.base_agent import BaseAgent
+
+class EchoAgent(BaseAgent):
+    def process(self, input_data):
+        return {"data": input_data}
+
+def test_logger_handlers_not_duplicated(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    first = EchoAgent("EchoAgent")
+    handler_count = len(first.logger.handlers)
+    for _ in range(3):
+        EchoAgent("EchoAgent")
+    assert len(first.logger.handlers) == handler_count == 2
+    assert first.logger.propagate is False
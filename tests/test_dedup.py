@@ -0,0 +1,47 @@
+import sys
+import os
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+import pytest
+from src.utils.dedup import NearDuplicateIndex, hamming_distance, simhash
+
+PRESS_RELEASE = """
+Echosens and Boehringer Ingelheim today announced an expansion of their long-standing
+collaboration to accelerate the development of non-invasive diagnostics for patients
+with metabolic dysfunction-associated steatohepatitis. The companies will jointly
+evaluate new liver stiffness measurements in Phase 3 clinical trials across Europe.
+"""
+
+def test_simhash_ignores_numbers_and_punctuation():
+    """Test that syndicated copies with different dates share a fingerprint."""
+    copy = "10/06/2025 -- " + PRESS_RELEASE.replace("Phase 3", "Phase 2")
+    assert hamming_distance(simhash(PRESS_RELEASE), simhash(copy)) <= 3
+
+def test_simhash_separates_different_documents():
+    """Test that unrelated documents are far apart."""
+    other = "Pfizer completed the acquisition of a gene therapy company focused on rare disease."
+    assert hamming_distance(simhash(PRESS_RELEASE), simhash(other)) > 3
+
+def test_near_duplicate_index():
+    """Test lookups within and beyond the allowed distance."""
+    index = NearDuplicateIndex(max_distance=3)
+    fingerprint = simhash(PRESS_RELEASE)
+    index.add(fingerprint, {"market_size": "$150B"})
+
+    assert index.lookup(fingerprint) == {"market_size": "$150B"}
+    assert index.lookup(fingerprint ^ 0b101) == {"market_size": "$150B"}
+    assert index.lookup(fingerprint ^ 0b1111) is None
+
+def test_near_duplicate_index_eviction():
+    """Test that the oldest entry is evicted when the index is full."""
+    index = NearDuplicateIndex(max_entries=2)
+    index.add(0, "first")
+    index.add(0xFFFF_FFFF_FFFF_FFFF, "second")
+    index.add(0x0F0F_0F0F_0F0F_0F0F, "third")
+
+    assert index.lookup(0) is None
+    assert index.lookup(0xFFFF_FFFF_FFFF_FFFF) == "second"
+    assert index.lookup(0x0F0F_0F0F_0F0F_0F0F) == "third"
+
+def test_invalid_max_distance():
+    with pytest.raises(ValueError):
+        NearDuplicateIndex(max_distance=4)
@@ -54,12 +54,17 @@ def sample_report_data():
         }
     }
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def formatter():
+    # Shared so the template and WeasyPrint font configuration are set up once
     return ReportFormatter()
 
-def test_format_json(formatter, sample_report_data, tmp_path):
-    output_path = tmp_path / "test_report.json"
+@pytest.fixture(scope="session")
+def shared_tmp(tmp_path_factory):
+    return tmp_path_factory.mktemp("fmt")
+
+def test_format_json(formatter, sample_report_data, shared_tmp):
+    output_path = shared_tmp / "test_report.json"
     result = formatter.format_report(
         sample_report_data,
         output_format="json",
@@ -76,8 +81,8 @@ def test_format_json(formatter, sample_report_data, tmp_path):
         saved_data = json.load(f)
         assert saved_data == result
 
-def test_format_html(formatter, sample_report_data, tmp_path):
-    output_path = tmp_path / "test_report.html"
+def test_format_html(formatter, sample_report_data, shared_tmp):
+    output_path = shared_tmp / "test_report.html"
     result = formatter.format_report(
         sample_report_data,
         output_format="html",
@@ -95,8 +100,8 @@ def test_format_html(formatter, sample_report_data, tmp_path):
         assert "Market Analysis Report" in content
         assert sample_report_data["executive_summary"] in content
 
-def test_format_pdf(formatter, sample_report_data, tmp_path):
-    output_path = tmp_path / "test_report.pdf"
+def test_format_pdf(formatter, sample_report_data, shared_tmp):
+    output_path = shared_tmp / "test_report.pdf"
     result = formatter.format_report(
         sample_report_data,
         output_format="pdf",
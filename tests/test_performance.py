@@ -2,26 +2,90 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
+import asyncio
 import time
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from src.agents.crawler import CrawlerAgent
+from src.config.crawler_config import CACHE_SETTINGS
 
-def test_crawler_performance():
-    """Test the performance of the Crawler agent under load."""
+# Press release served by the local test server
+CANNED_HTML = """
+<html>
+    <body>
+        <h1>FOR IMMEDIATE RELEASE</h1>
+        <p>Company Announces Phase 2 Clinical Trial Results</p>
+        <p>The partnership with Acme Therapeutics Inc. covers oncology.</p>
+        <p>About the Company</p>
+    </body>
+</html>
+"""
+
+class CannedResponse:
+    """Streamed requests response carrying CANNED_HTML."""
+    status_code = 200
+    headers = {"Content-Type": "text/html; charset=utf-8"}
+    encoding = "utf-8"
+
+    def iter_content(self, chunk_size):
+        yield CANNED_HTML.encode("utf-8")
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+async def crawl_local_server(crawler, page_count):
+    """Crawl distinct pages of a local server serving CANNED_HTML."""
+    async def press_release(request):
+        return web.Response(text=CANNED_HTML, content_type="text/html")
+
+    app = web.Application()
+    app.router.add_get("/{page}", press_release)
+    async with TestServer(app) as server:
+        urls = [str(server.make_url(f"/release-{i}")) for i in range(page_count)]
+        return await crawler.process_many(urls)
+
+def test_crawler_performance(monkeypatch):
+    """Test the performance of the Crawler agent under concurrent load."""
+    # Every request must reach the server rather than the crawl cache
+    monkeypatch.setitem(CACHE_SETTINGS, "enabled", False)
     crawler = CrawlerAgent()
     start_time = time.time()
-    
-    # Simulate 10 requests
-    for _ in range(10):
-        crawler.process("https://example.com")
-    
+
+    # Simulate 100 concurrent requests against a local server, so only crawler overhead is measured
+    results = asyncio.run(crawl_local_server(crawler, 100))
+
     end_time = time.time()
     total_time = end_time - start_time
-    
+
+    assert len(results) == 100
+    assert all("error" not in result for result in results)
+
     # Ensure the total time is reasonable (e.g., less than 10 seconds)
-    assert total_time < 10, f"Crawler performance test failed: {total_time} seconds for 10 requests"
-    
+    assert total_time < 10, f"Crawler performance test failed: {total_time} seconds for 100 requests"
+
     # Print performance metrics
     print(f"\n=== Crawler Performance Test ===")
-    print(f"Total time for 10 requests: {total_time:.2f} seconds")
-    print(f"Average time per request: {total_time / 10:.2f} seconds")
-    print("===============================\n") 
\ No newline at end of file
+    print(f"Total time for 100 requests: {total_time:.2f} seconds")
+    print(f"Average time per request: {total_time / 100:.3f} seconds")
+    print("===============================\n")
+
+def test_crawler_process_performance(monkeypatch):
+    """Test the synchronous crawl path with the network mocked out."""
+    monkeypatch.setitem(CACHE_SETTINGS, "enabled", False)
+    crawler = CrawlerAgent()
+    monkeypatch.setattr(crawler.session, "get", lambda *args, **kwargs: CannedResponse())
+    start_time = time.time()
+
+    # Simulate 10 requests; with no network the loop measures parsing and extraction only
+    results = [crawler.process(f"https://example.com/release-{i}") for i in range(10)]
+
+    total_time = time.time() - start_time
+
+    assert all("pipeline_info" in result for result in results)
+    assert total_time < 2, f"Crawler process path too slow: {total_time} seconds for 10 requests"
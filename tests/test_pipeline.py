@@ -2,14 +2,10 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import pytest
-from src.agents.crawler import CrawlerAgent
-from src.agents.analyst import AnalystAgent
-from src.agents.advisor import AdvisorAgent
 from unittest.mock import patch
 
-def test_crawler_agent():
+def test_crawler_agent(crawler):
     """Test the crawler agent with a sample URL."""
-    crawler = CrawlerAgent()
     result = crawler.process("https://example.com")
     
     assert isinstance(result, dict)
@@ -17,9 +13,8 @@ def test_crawler_agent():
     assert "deal_info" in result
     assert "raw_text" in result
 
-def test_analyst_agent():
+def test_analyst_agent(analyst):
     """Test the analyst agent with sample data."""
-    analyst = AnalystAgent()
     sample_data = {
         "pipeline_info": {
             "phases": {
@@ -62,9 +57,8 @@ def test_analyst_agent():
     assert len(result["competitors"]) > 0
     assert any(comp["company"] == "Company X" for comp in result["competitors"])
 
-def test_advisor_agent():
+def test_advisor_agent(advisor):
     """Test the advisor agent with sample analysis data."""
-    advisor = AdvisorAgent()
     sample_analysis = {
         "therapeutic_areas": [
             {
@@ -112,7 +106,7 @@ def test_advisor_agent():
     # Verify strategic recommendations
     assert len(result["strategic_recommendations"]) > 0
 
-def test_full_pipeline():
+def test_full_pipeline(crawler, analyst, advisor):
     """Test the full pipeline from Crawler → Analyst → Advisor."""
     with patch('requests.get') as mock_get:
         mock_get.return_value.text = """
@@ -124,10 +118,7 @@ def test_full_pipeline():
             </body>
         </html>
         """
-        # Step 1: Initialize agents
-        crawler = CrawlerAgent()
-        analyst = AnalystAgent()
-        advisor = AdvisorAgent()
+        # Step 1: Agents come from the session fixtures in conftest.py
         
         # Step 2: Crawl a real press release (using a mock URL for testing)
         url = "https://example.com/press-release"